@@ -0,0 +1,178 @@
+import os
+import types
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class HeldKeys:
+    def __init__(self, *keys):
+        """Stand-in for pygame.key.get_pressed() with a fixed set of keys held down."""
+        self.keys = set(keys)
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+
+def make_context(backend=None):
+    """Builds the minimum a scene needs to run headlessly: screen, script_dir and an audio manager."""
+    from managers.audio_manager import AudioManager
+    from rendering.screen import create_screen, BACKEND_SURFACE, BACKEND_TEXTURE
+    screen = create_screen(backend=backend)
+    click_sfx = os.path.join(SCRIPT_DIR, "assets", "audio", "sfx", "click_sound_button.mp3")
+    audio_manager = AudioManager(None, click_sfx)
+    audio_manager.audio_enabled = False  # Keep the runs silent and music loads out of the numbers
+    backend = BACKEND_SURFACE if screen.partial_updates else BACKEND_TEXTURE  # After any fallback
+    return types.SimpleNamespace(screen=screen, backend=backend, script_dir=SCRIPT_DIR, audio_manager=audio_manager,
+                                 get_question_scheduler=lambda profile=None: None,
+                                 return_to_main_menu=lambda: None)
+
+
+def make_map(context):
+    from maps.map import Map
+    return Map(context.screen, context.script_dir, None, context.audio_manager, "boy")
+
+
+def make_battle(context):
+    from gameplay.battle import Battle
+    from gameplay.level_1 import Level1
+    return Battle(context.screen, context.script_dir, Level1(context.script_dir), "boy", context.audio_manager)
+
+
+def make_hero_selection(context):
+    from ui.hero_selection import HeroSelection
+    from ui.menu_background import MenuBackground
+    background = MenuBackground(os.path.join(SCRIPT_DIR, "assets", "videos", "background", "backgroundMenu.mp4"), speed=0.3)
+    return HeroSelection(context, background)
+
+
+def case_map_draw(position):
+    """Map.draw with the viewport at a fraction (fx, fy) of the scrollable area."""
+    def setup(context):
+        game_map = make_map(context)
+        fx, fy = position
+        game_map.map_x = int((SCREEN_WIDTH - game_map.map_width) * fx)
+        game_map.map_y = int((SCREEN_HEIGHT - game_map.map_height) * fy)
+        return game_map.draw
+    return setup
+
+
+def setup_handle_movement(context):
+    from maps.map_character_movement import MapCharacterMovement
+    movement = MapCharacterMovement("boy", context.script_dir, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+    map_width, map_height = 9600, 7200
+    bounds = {'min_x': SCREEN_WIDTH - map_width, 'max_x': 0, 'min_y': SCREEN_HEIGHT - map_height, 'max_y': 0,
+              'width': map_width, 'height': map_height}
+    state = {'map_pos': (-4000, -3000), 'frame': 0}
+    # Walk right then left so the character never gets stuck at an edge
+    right, left = HeldKeys(pygame.K_RIGHT), HeldKeys(pygame.K_LEFT)
+
+    def run():
+        state['frame'] += 1
+        keys = right if state['frame'] % 40 < 20 else left
+        real_get_pressed = pygame.key.get_pressed
+        pygame.key.get_pressed = lambda: keys
+        try:
+            state['map_pos'], _ = movement.handle_movement(bounds, state['map_pos'], (SCREEN_WIDTH, SCREEN_HEIGHT))
+        finally:
+            pygame.key.get_pressed = real_get_pressed
+    return run
+
+
+def setup_check_proximity(context):
+    from gameplay.levels import Levels
+    levels = Levels(context.script_dir)
+    points = [(3000, 1830), (5000, 5000), (9700, 600), (100, 100)]
+    return lambda: [levels.check_proximity(x, y) for x, y in points]
+
+
+def case_frame(factory):
+    """Draws and presents a whole frame of a scene; renderers do much of their work in present(),
+    so this is the number to compare backends by."""
+    def setup(context):
+        scene = factory(context)
+
+        def run():
+            scene.draw()
+            context.screen.present()
+        return run
+    return setup
+
+
+def setup_battle_draw(context):
+    return make_battle(context).draw
+
+
+def setup_pause_overlay(context):
+    battle = make_battle(context)
+    battle.pause_menu.paused = True
+    return battle.pause_menu.draw_pause_overlay
+
+
+def setup_menu_background(context):
+    from ui.menu_background import MenuBackground
+    background = MenuBackground(os.path.join(SCRIPT_DIR, "assets", "videos", "background", "backgroundMenu.mp4"), speed=0.3)
+    return background.get_frame
+
+
+def setup_menu_handle_motion(context):
+    """MainMenu.handle_events for a sweep of pointer motion across the screen."""
+    from ui.main_menu import MainMenu
+    menu = MainMenu(context.screen, context.audio_manager, context.script_dir)
+    events = [pygame.event.Event(pygame.MOUSEMOTION, pos=(x, 670 + x % 240), rel=(0, 0), buttons=(0, 0, 0))
+              for x in range(0, SCREEN_WIDTH, 40)]
+    return lambda: [menu.handle_events(event) for event in events]
+
+
+def setup_random_question(context):
+    from gameplay.questions import QuestionGenerator
+    return lambda: QuestionGenerator.get_random_question(2)
+
+
+def case_blit(image, image_format, scale=None, size=None):
+    """Blits one image converted to a given display format ("decoded" = straight from the file)."""
+    def setup(context):
+        from managers.asset_manager import FORMAT_OPAQUE, FORMAT_COLORKEY, convert_colorkey, transform_image
+        surface = transform_image(pygame.image.load(os.path.join(SCRIPT_DIR, "assets", "images", image)), scale, size)
+        if image_format == FORMAT_OPAQUE:
+            surface = surface.convert()
+        elif image_format == FORMAT_COLORKEY:
+            surface = convert_colorkey(surface)
+        elif image_format != "decoded":
+            surface = surface.convert_alpha()
+        return lambda: context.screen.blit(surface, (0, 0))
+    return setup
+
+
+def construct(factory):
+    """Times building a whole scene."""
+    def setup(context):
+        return lambda: factory(context)
+    return setup
+
+
+# name -> (setup, max iterations); setup(context) returns the callable to time
+CASES = {
+    "map_draw_top_left": (case_map_draw((0.0, 0.0)), 300),
+    "map_draw_center": (case_map_draw((0.5, 0.5)), 300),
+    "map_draw_bottom_right": (case_map_draw((1.0, 1.0)), 300),
+    "map_handle_movement": (setup_handle_movement, 2000),
+    "levels_check_proximity": (setup_check_proximity, 2000),
+    "battle_draw": (setup_battle_draw, 300),
+    "battle_frame": (case_frame(make_battle), 300),
+    "map_frame": (case_frame(make_map), 300),
+    "pause_draw_overlay": (setup_pause_overlay, 300),
+    "menu_background_get_frame": (setup_menu_background, 200),
+    "menu_handle_motion": (setup_menu_handle_motion, 2000),
+    "question_generator_random": (setup_random_question, 2000),
+    "blit_battle_background_decoded": (case_blit("battle/backgrounds/level1_bg.png", "decoded", size=(1920, 1080)), 300),
+    "blit_battle_background_alpha": (case_blit("battle/backgrounds/level1_bg.png", "alpha", size=(1920, 1080)), 300),
+    "blit_battle_background_opaque": (case_blit("battle/backgrounds/level1_bg.png", "opaque", size=(1920, 1080)), 300),
+    "blit_hero_sprite_decoded": (case_blit("battle/boy/boy_stand.png", "decoded", scale=5), 2000),
+    "blit_hero_sprite_alpha": (case_blit("battle/boy/boy_stand.png", "alpha", scale=5), 2000),
+    "blit_hero_sprite_colorkey": (case_blit("battle/boy/boy_stand.png", "colorkey", scale=5), 2000),
+    "construct_map": (construct(make_map), 5),
+    "construct_battle": (construct(make_battle), 20),
+    "construct_hero_selection": (construct(make_hero_selection), 20),
+}
@@ -0,0 +1,183 @@
+"""Headless benchmarks for the game's hot paths.
+
+Usage: python -m benchmarks.run [--output results.json] [--baseline benchmarks/baseline.json]
+                                [--save-baseline] [--threshold 0.25] [--only name ...]
+                                [--backend surface|texture|both]
+
+--backend both runs every case on the software surface renderer and on the SDL texture renderer and
+prints them side by side; the baseline is compared against the surface results.
+"""
+import os
+
+# Must be set before pygame creates a window or opens an audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import pygame
+
+SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(SCRIPT_DIR, "benchmarks", "baseline.json")
+TIME_BUDGET = 2.0  # Seconds spent timing each case at most
+ALLOC_ITERATIONS = 5  # Iterations traced by tracemalloc per case
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def measure(func, max_iterations):
+    """Times func and returns median/p95 in milliseconds, the blocks each iteration leaves allocated and
+    the largest peak of traced memory within one iteration.
+
+    tracemalloc only sees live blocks, so blocks freed within an iteration don't count towards
+    retained_blocks; their size shows up in peak_alloc_kb."""
+    func()  # Warm-up, fills caches the same way a real first frame would
+
+    samples = []
+    deadline = time.perf_counter() + TIME_BUDGET
+    while len(samples) < max_iterations and (not samples or time.perf_counter() < deadline):
+        start = time.perf_counter_ns()
+        func()
+        samples.append((time.perf_counter_ns() - start) / 1e6)
+    samples.sort()
+
+    # Allocations are traced separately so tracemalloc's overhead doesn't skew the timings
+    iterations = max(1, min(ALLOC_ITERATIONS, max_iterations))
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    peak = 0
+    for _ in range(iterations):
+        # The peak is a high-water mark, so it is taken per iteration, above what was live when it began
+        start_size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        func()
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - start_size)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "lineno") if stat.count_diff > 0)
+
+    return {
+        "iterations": len(samples),
+        "median_ms": round(samples[len(samples) // 2], 4),
+        "p95_ms": round(percentile(samples, 0.95), 4),
+        "retained_blocks": round(retained / iterations, 1),
+        "peak_alloc_kb": round(peak / 1024, 1),
+    }
+
+
+def run_cases(names, backend=None):
+    """Runs the selected cases; a case that fails to set up is reported instead of stopping the run."""
+    from benchmarks.cases import CASES, make_context
+    from managers.asset_manager import asset_manager
+
+    context = make_context(backend)
+    print(f"Renderer: {context.backend}")
+    results = {}
+    for name in names:
+        setup, max_iterations = CASES[name]
+        try:
+            results[name] = measure(setup(context), max_iterations)
+            print(f"{name:32} median {results[name]['median_ms']:9.3f} ms   p95 {results[name]['p95_ms']:9.3f} ms"
+                  f"   {results[name]['retained_blocks']:8.1f} retained blocks")
+        except Exception as e:
+            results[name] = {"error": f"{type(e).__name__}: {e}"}
+            print(f"{name:32} ERROR {results[name]['error']}")
+    asset_manager.set_render_copy_factory(None)  # Free the textures while their renderer still exists
+    return results
+
+
+def compare_backends(surface_results, texture_results):
+    """Prints both backends' medians per case and returns them with the texture/surface ratio."""
+    comparison = {}
+    print(f"{'case':32} {'surface':>12} {'texture':>12} {'ratio':>8}")
+    for name, result in surface_results.items():
+        other = texture_results.get(name, {})
+        if "median_ms" not in result or "median_ms" not in other:
+            continue
+        ratio = other["median_ms"] / result["median_ms"] if result["median_ms"] > 0 else 1.0
+        comparison[name] = {"surface_ms": result["median_ms"], "texture_ms": other["median_ms"], "ratio": round(ratio, 3)}
+        print(f"{name:32} {result['median_ms']:9.3f} ms {other['median_ms']:9.3f} ms {ratio:7.2f}x")
+    return comparison
+
+
+def compare(results, baseline, threshold):
+    """Returns the cases whose median got slower than the baseline by more than threshold."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name)
+        if not base or "median_ms" not in base or "median_ms" not in result:
+            continue
+        ratio = result["median_ms"] / base["median_ms"] if base["median_ms"] > 0 else 1.0
+        result["baseline_median_ms"] = base["median_ms"]
+        result["ratio"] = round(ratio, 3)
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    from benchmarks.cases import CASES
+
+    parser = argparse.ArgumentParser(description="Run the headless Final Quiztasy benchmarks.")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before flagging (0.25 = 25%%)")
+    parser.add_argument("--only", nargs="+", choices=sorted(CASES), help="run only these cases")
+    parser.add_argument("--backend", choices=("surface", "texture", "both"), default="surface",
+                        help="renderer to run the cases on, or both to compare them")
+    args = parser.parse_args(argv)
+
+    # Asset paths in settings are relative to the project folder
+    os.chdir(SCRIPT_DIR)
+    sys.path.insert(0, SCRIPT_DIR)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+        },
+    }
+    names = args.only or list(CASES)
+    # One pygame session for both backends: module-level caches (fonts, dialogs) don't survive pygame.quit()
+    pygame.init()
+    if args.backend == "both":
+        report["results"] = run_cases(names, "surface")
+        report["texture_results"] = run_cases(names, "texture")
+        report["backend_comparison"] = compare_backends(report["results"], report["texture_results"])
+    else:
+        report["results"] = run_cases(names, args.backend)
+    pygame.quit()
+    report["meta"]["backend"] = args.backend
+
+    regressions = []
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report["results"], json.load(f), args.threshold)
+        report["regressions"] = regressions
+        for name in regressions:
+            print(f"REGRESSION {name}: {report['results'][name]['ratio']:.2f}x baseline")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""Startup report: import time and time to the first presented menu frame.
+
+Usage: python -m benchmarks.startup [--runs 5] [--output startup.json] [--baseline benchmarks/startup_baseline.json]
+                                    [--save-baseline] [--threshold 0.25] [--top 15]
+
+Every run starts a fresh interpreter with -X importtime, so the numbers include all imports.
+Runs after the first usually hit the OS file cache; clear it (or reboot) to measure a true cold start.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from benchmarks.run import compare
+
+SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(SCRIPT_DIR, "benchmarks", "startup_baseline.json")
+RESULT_MARKER = "STARTUP_RESULT "
+
+# Runs inside the child interpreter: starts the game, lets it present one frame, then quits
+DRIVER = """
+import time
+start = time.perf_counter()
+import json, os, sys
+sys.path.insert(0, os.getcwd())
+import pygame  # Imported first so -X importtime attributes it to pygame rather than to a debug module
+from debug.tracing import tracer
+tracer.start(os.devnull)
+tracer.origin = start
+tracer.begin_transition("menu")
+from debug.frame_timing import frame_timer
+frame_timer.export = lambda *args, **kwargs: None  # Don't write a frame time report per run
+import main
+imported = time.perf_counter()
+game = main.FinalQuiztasy(save_path=":memory:")
+constructed = time.perf_counter()
+pygame.event.post(pygame.event.Event(pygame.QUIT))  # The first frame handles it and ends the loop
+game.run()
+first_frame = next(e for e in tracer.events if e["name"] == "transition to menu")
+print("STARTUP_RESULT " + json.dumps({
+    "construct_ms": (constructed - imported) * 1000,
+    "first_frame_ms": (first_frame["ts"] + first_frame["dur"]) / 1000,
+}))
+"""
+
+
+def parse_importtime(stderr):
+    """Returns (total top-level import ms, [(cumulative ms, module), ...]) from -X importtime output."""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):  # Nested imports are indented further
+            modules.append((int(cumulative) / 1000, name.strip()))
+    return sum(ms for ms, _ in modules), sorted(modules, reverse=True)
+
+
+def run_once():
+    """Starts the game once in a fresh headless interpreter and returns its startup numbers."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", DRIVER], cwd=SCRIPT_DIR, env=env,
+                             capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+    result_line = next((line for line in process.stdout.splitlines() if line.startswith(RESULT_MARKER)), None)
+    if result_line is None:
+        raise RuntimeError(f"startup run failed:\n{process.stderr[-2000:]}")
+    result = json.loads(result_line[len(RESULT_MARKER):])
+    result["import_ms"], result["modules"] = parse_importtime(process.stderr)
+    result["process_ms"] = wall_ms
+    return result
+
+
+def summarize(runs):
+    """Median and max of every metric, in the same shape as benchmarks.run results."""
+    results = {}
+    for metric in ("import_ms", "construct_ms", "first_frame_ms", "process_ms"):
+        values = sorted(run[metric] for run in runs)
+        results[f"startup_{metric[:-3]}"] = {
+            "iterations": len(values),
+            "median_ms": round(values[len(values) // 2], 2),
+            "max_ms": round(values[-1], 2),
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure Final Quiztasy import time and time to first frame.")
+    parser.add_argument("--runs", type=int, default=5, help="number of fresh game starts to measure")
+    parser.add_argument("--output", help="write the report as JSON to this file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before flagging (0.25 = 25%%)")
+    parser.add_argument("--top", type=int, default=15, help="number of slowest top-level imports to list")
+    args = parser.parse_args(argv)
+
+    runs = [run_once() for _ in range(args.runs)]
+    results = summarize(runs)
+    slowest = runs[len(runs) // 2]["modules"][:args.top]
+
+    print("Slowest top-level imports (median run):")
+    for ms, name in slowest:
+        print(f"  {ms:9.1f} ms  {name}")
+    for name, result in results.items():
+        print(f"{name:32} median {result['median_ms']:9.1f} ms   max {result['max_ms']:9.1f} ms")
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+        "slowest_imports": [{"module": name, "cumulative_ms": round(ms, 2)} for ms, name in slowest],
+    }
+
+    regressions = []
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report["results"], json.load(f), args.threshold)
+        report["regressions"] = regressions
+        for name in regressions:
+            print(f"REGRESSION {name}: {report['results'][name]['ratio']:.2f}x baseline")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
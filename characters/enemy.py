@@ -1,7 +1,7 @@
-import pygame
-import os
 import random
-from settings import FONT_PATH
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from ui.hp_bar import HPBar, BAR_WIDTH, BAR_HEIGHT
+from managers.animation_manager import animation_manager, Animator, STATE_IDLE, DIR_LEFT
 
 class Enemy:
     def __init__(self, script_dir, enemy_type="mini", level=1, hp=None, damage=None):
@@ -14,29 +14,27 @@ class Enemy:
         self.max_hp = self.hp
         self.damage = damage if damage is not None else 1  # Default damage
 
-        # Load the appropriate enemy image
-        self.load_image()
+        # Load the appropriate enemy animation
+        self.load_animation()
 
         # Position the enemy on the right side of the screen
         self.rect = self.image.get_rect()
         self.rect.x = 1200  # Right side position
         self.rect.bottom = 700  # Adjust this value as needed
 
-    def load_image(self):
-        """Loads the appropriate enemy image based on type"""
+        # HP bar, rendered only when HP changes
+        self.hp_bar = HPBar(SCREEN_WIDTH - BAR_WIDTH - 100, SCREEN_HEIGHT - BAR_HEIGHT - 320)
+        self.hp_bar.set_hp(self.hp, self.max_hp)
+
+    def load_animation(self):
+        """Loads the appropriate enemy idle loop based on type, facing the player"""
         if self.enemy_type == "mini":
             # Randomly select one of the 19 mini-boss images
-            mini_id = random.randint(1, 19)
-            image_path = os.path.join(self.script_dir, "assets", "images", "battle", "enemy", "mini",f"mini_{mini_id}.png")
+            animations = animation_manager.load("mini_enemy", variant=random.randint(1, 19))
         else:  # Boss type
-            image_path = os.path.join(self.script_dir, "assets", "images", "battle", "enemy", "boss", "boss.png")
-
-        self.image = pygame.image.load(image_path)
-
-        # Scale image if needed
-        scale_factor = 2.5  # Adjust based on your image size
-        self.image = pygame.transform.scale(self.image,(int(self.image.get_width() * scale_factor),int(self.image.get_height() * scale_factor)))
-        self.image = pygame.transform.flip(self.image, True, False)
+            animations = animation_manager.load("boss_enemy", variant=1)
+        self.animator = Animator(animations, STATE_IDLE, DIR_LEFT)
+        self.image = self.animator.image
 
     def take_damage(self, amount):
         """Applies damage to the enemy"""
@@ -49,27 +47,23 @@ class Enemy:
         """Returns the amount of damage this enemy deals"""
         return self.damage
 
-    def draw(self, screen):
-        """Draws the enemy on the screen"""
-        screen.blit(self.image, self.rect)
+    def update(self, dt):
+        """Updates the idle loop and HP bar animation, returns True if either changed"""
+        self.hp_bar.set_hp(self.hp, self.max_hp)
+        bar_changed = self.hp_bar.update(dt)
+        if self.animator.update(dt):
+            self.image = self.animator.image
+            return True
+        return bar_changed
 
-        # Draw HP bar
-        bar_width = 200
-        bar_height = 20
-        bar_x = screen.get_width() - bar_width - 100
-        bar_y = screen.get_height() - bar_height - 320
+    def sprite_rect(self):
+        """Where the current frame is drawn"""
+        return self.rect.move(self.animator.offset)
 
-        # Background (empty) bar
-        pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, bar_width, bar_height))
-
-        # Filled portion of the bar
-        health_width = int(bar_width * (self.hp / self.max_hp))
-        pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, health_width, bar_height))
-
-        # HP text
-        font = pygame.font.Font(FONT_PATH, 20)
-        hp_text = font.render(f"{self.hp}/{self.max_hp} HP", True, (255, 255, 255))
-        screen.blit(hp_text, (bar_x + 10, bar_y + 2))
+    def draw(self, screen):
+        """Draws the enemy on the screen"""
+        screen.blit(self.image, self.sprite_rect())
+        self.hp_bar.draw(screen)
 
 
 class MiniBoss(Enemy):
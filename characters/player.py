@@ -1,6 +1,6 @@
-import pygame
-import os
-from settings import FONT_PATH
+from settings import SCREEN_HEIGHT
+from ui.hp_bar import HPBar, BAR_HEIGHT
+from managers.animation_manager import animation_manager, Animator, STATE_IDLE, DIR_RIGHT
 
 class Player:
     def __init__(self, script_dir, player_type="boy"):
@@ -9,19 +9,19 @@ class Player:
         self.hp = 10  # Universal HP for every level
         self.max_hp = 10
 
-        # Load player image based on type (boy or girl)
-        image_path = os.path.join(script_dir, "assets", "images", "battle", self.player_type, f"{self.player_type}_stand.png")
-        self.image = pygame.image.load(image_path)
-
-        # Scale image if needed (adjust scale factor as appropriate)
-        scale_factor = 5  # Adjust this value based on your image size
-        self.image = pygame.transform.scale(self.image,(int(self.image.get_width() * scale_factor),int(self.image.get_height() * scale_factor)))
+        # Animation based on type (boy or girl), from the "battle_hero" entry of assets/animations.json
+        self.animator = Animator(animation_manager.load("battle_hero", hero=self.player_type), STATE_IDLE, DIR_RIGHT)
+        self.image = self.animator.image
 
         # Position the player on the left side of the screen
         self.rect = self.image.get_rect()
         self.rect.x = 300  # Left side position
         self.rect.bottom = 700  # Adjust this value as needed
 
+        # HP bar, rendered only when HP changes
+        self.hp_bar = HPBar(100, SCREEN_HEIGHT - BAR_HEIGHT - 320)
+        self.hp_bar.set_hp(self.hp, self.max_hp)
+
     def take_damage(self, amount):
         """Applies damage to the player"""
         self.hp -= amount
@@ -35,24 +35,20 @@ class Player:
         if self.hp > self.max_hp:
             self.hp = self.max_hp
 
-    def draw(self, screen):
-        """Draws the player on the screen"""
-        screen.blit(self.image, self.rect)
-
-        # Draw HP bar
-        bar_width = 200
-        bar_height = 20
-        bar_x = 100
-        bar_y = screen.get_height() - bar_height - 320
-
-        # Background (empty) bar
-        pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, bar_width, bar_height))
+    def update(self, dt):
+        """Updates the sprite and HP bar animations, returns True if either changed"""
+        self.hp_bar.set_hp(self.hp, self.max_hp)
+        bar_changed = self.hp_bar.update(dt)
+        if self.animator.update(dt):
+            self.image = self.animator.image
+            return True
+        return bar_changed
 
-        # Filled portion of the bar
-        health_width = int(bar_width * (self.hp / self.max_hp))
-        pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, health_width, bar_height))
+    def sprite_rect(self):
+        """Where the current frame is drawn"""
+        return self.rect.move(self.animator.offset)
 
-        # HP text
-        font = pygame.font.Font(FONT_PATH, 20)
-        hp_text = font.render(f"{self.hp}/{self.max_hp} HP", True, (255, 255, 255))
-        screen.blit(hp_text, (bar_x + 10, bar_y + 2))
\ No newline at end of file
+    def draw(self, screen):
+        """Draws the player on the screen"""
+        screen.blit(self.image, self.sprite_rect())
+        self.hp_bar.draw(screen)
\ No newline at end of file
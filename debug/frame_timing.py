@@ -0,0 +1,185 @@
+import csv
+import json
+import math
+import os
+import time
+from array import array
+import pygame
+from .hotkeys import register_hotkey
+from .tracing import tracer
+from .profiler import frame_profiler
+
+# Phases recorded for every frame, in order. FRAME is the time since the previous frame began (including the FPS wait)
+PHASE_EVENTS, PHASE_UPDATE, PHASE_DRAW, PHASE_PRESENT, PHASE_FRAME = range(5)
+PHASE_NAMES = ("events", "update", "draw", "present", "frame")
+NUM_PHASES = len(PHASE_NAMES)
+
+RING_CAPACITY = 4096  # Frames kept per scene (about a minute at 60 FPS)
+MAX_NESTING = 8  # Game loops run nested (menu -> map -> battle)
+HISTOGRAM_PRECISION = 1.05  # Bucket width, 5% relative error like a 2-digit HDR histogram
+EXPORT_HOTKEY = pygame.K_F9
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "perf_reports")
+
+
+class SceneTimings:
+    def __init__(self, capacity=RING_CAPACITY):
+        """Fixed-size ring buffer of per-phase frame times (milliseconds) for one scene."""
+        self.capacity = capacity
+        self.samples = array('d', bytes(8 * capacity * NUM_PHASES))
+        self.index = 0
+        self.count = 0
+        self.total_frames = 0
+
+    def phase_values(self, phase):
+        """Returns the buffered values of one phase, oldest first."""
+        start = self.index - self.count
+        return [self.samples[((start + i) % self.capacity) * NUM_PHASES + phase] for i in range(self.count)]
+
+
+class FrameTimer:
+    def __init__(self, capacity=RING_CAPACITY):
+        """Records how long each frame spends in events, update, draw and present, per scene.
+
+        Buffers are preallocated, so recording a frame does not allocate buffers or objects beyond floats.
+        A frame that contains a nested game loop (e.g. the menu frame that opened the map) is discarded.
+        """
+        self.capacity = capacity
+        self.scenes = {}
+        self.depth = 0
+        # Per nesting level: scene name and buffer, frame start, last mark, previous frame start, discarded flag
+        self.stack_name = [None] * MAX_NESTING
+        self.stack_scene = [None] * MAX_NESTING
+        self.stack_start = [0.0] * MAX_NESTING
+        self.stack_last = [0.0] * MAX_NESTING
+        self.stack_previous = [0.0] * MAX_NESTING
+        self.stack_discard = [False] * MAX_NESTING
+        self.current_scene = None
+
+    def get_scene(self, name):
+        if name not in self.scenes:
+            self.scenes[name] = SceneTimings(self.capacity)
+        return self.scenes[name]
+
+    def begin_frame(self, scene_name):
+        """Starts timing a frame of the given scene."""
+        now = time.perf_counter()
+        depth = self.depth
+        if depth:
+            self.stack_discard[depth - 1] = True  # The outer frame now includes a whole nested loop
+        if depth >= MAX_NESTING:
+            self.depth += 1
+            return
+        scene = self.get_scene(scene_name)
+        if self.stack_scene[depth] is scene and self.stack_previous[depth]:
+            frame = (now - self.stack_previous[depth]) * 1000
+        else:
+            frame = 0.0
+        self.stack_name[depth] = scene_name
+        self.stack_scene[depth] = scene
+        self.stack_start[depth] = now
+        self.stack_last[depth] = now
+        self.stack_previous[depth] = now
+        self.stack_discard[depth] = False
+        # The slot still holds a frame from one lap of the ring ago; phases this frame doesn't mark must read 0
+        base = scene.index * NUM_PHASES
+        for phase in range(NUM_PHASES):
+            scene.samples[base + phase] = 0.0
+        scene.samples[base + PHASE_FRAME] = frame
+        self.current_scene = scene_name
+        self.depth += 1
+
+    def mark(self, phase):
+        """Ends a phase of the current frame."""
+        depth = self.depth - 1
+        if depth < 0 or depth >= MAX_NESTING:
+            return
+        now = time.perf_counter()
+        scene = self.stack_scene[depth]
+        scene.samples[scene.index * NUM_PHASES + phase] = (now - self.stack_last[depth]) * 1000
+        self.stack_last[depth] = now
+
+    def end_frame(self):
+        """Commits the current frame to its scene's ring buffer."""
+        depth = self.depth - 1
+        if frame_profiler.active:
+            frame_profiler.frame_ended(self.stack_name[depth] if 0 <= depth < MAX_NESTING else self.current_scene)
+        self.depth = depth
+        if depth < 0:
+            self.depth = 0
+            return
+        if 0 < depth <= MAX_NESTING:
+            self.current_scene = self.stack_name[depth - 1]  # Back in the frame that ran this nested loop
+        if depth >= MAX_NESTING:
+            return
+        if tracer.transition is not None:
+            tracer.end_transition(self.stack_start[depth])
+        scene = self.stack_scene[depth]
+        if self.stack_discard[depth]:
+            # Don't count the time spent in the nested loop as this scene's frame time
+            base = scene.index * NUM_PHASES
+            for phase in range(NUM_PHASES):
+                scene.samples[base + phase] = 0.0
+            self.stack_previous[depth] = 0.0
+            return
+        scene.index = (scene.index + 1) % scene.capacity
+        scene.count = min(scene.count + 1, scene.capacity)
+        scene.total_frames += 1
+
+    def summary(self):
+        """Returns count, p50/p95/p99/max and an HDR-style histogram of every phase, per scene."""
+        report = {}
+        for name, scene in self.scenes.items():
+            phases = {}
+            for phase, phase_name in enumerate(PHASE_NAMES):
+                values = scene.phase_values(phase)
+                if phase == PHASE_FRAME:
+                    values = [value for value in values if value > 0]  # First frame has no previous frame
+                phases[phase_name] = summarize(values)
+            # Busy time is everything except waiting for the next frame
+            busy = [sum(values) for values in zip(*(scene.phase_values(phase) for phase in range(PHASE_FRAME)))]
+            phases["busy"] = summarize(busy)
+            report[name] = {"frames": scene.total_frames, "buffered": scene.count, "phases": phases}
+        return report
+
+    def export(self, directory=OUTPUT_DIR):
+        """Writes the summary as JSON and CSV. Returns the JSON path, or None if nothing was recorded."""
+        report = self.summary()
+        if not report:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        json_path = os.path.join(directory, f"frame_times-{stamp}.json")
+        with open(json_path, "w") as f:
+            json.dump(report, f, indent=2)
+        with open(os.path.join(directory, f"frame_times-{stamp}.csv"), "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["scene", "phase", "count", "p50_ms", "p95_ms", "p99_ms", "max_ms"])
+            for name, scene in report.items():
+                for phase_name, stats in scene["phases"].items():
+                    writer.writerow([name, phase_name, stats["count"], stats["p50"], stats["p95"], stats["p99"], stats["max"]])
+        print(f"Frame timings written to {json_path}")
+        return json_path
+
+
+def summarize(values):
+    """Percentiles and a log-bucketed histogram of millisecond values."""
+    if not values:
+        return {"count": 0, "p50": 0, "p95": 0, "p99": 0, "max": 0, "histogram": []}
+    ordered = sorted(values)
+
+    def percentile(fraction):
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 3)
+
+    # Buckets grow by HISTOGRAM_PRECISION, starting at 10 microseconds
+    buckets = {}
+    for value in ordered:
+        bucket = int(math.log(max(value, 0.01) / 0.01, HISTOGRAM_PRECISION))
+        buckets[bucket] = buckets.get(bucket, 0) + 1
+    histogram = [[round(0.01 * HISTOGRAM_PRECISION ** (bucket + 1), 3), count] for bucket, count in sorted(buckets.items())]
+    return {"count": len(ordered), "p50": percentile(0.50), "p95": percentile(0.95),
+            "p99": percentile(0.99), "max": round(ordered[-1], 3), "histogram": histogram}
+
+
+# Shared by every game loop
+frame_timer = FrameTimer()
+register_hotkey(EXPORT_HOTKEY, frame_timer.export)
@@ -0,0 +1,16 @@
+import pygame
+
+# Key -> callbacks run when it is pressed in any scene
+HOTKEYS = {}
+
+
+def register_hotkey(key, callback):
+    """Registers a debug hotkey that works in every game loop."""
+    HOTKEYS.setdefault(key, []).append(callback)
+
+
+def handle_debug_hotkey(event):
+    """Runs the callbacks of a pressed debug hotkey. Game loops pass every event here."""
+    if event.type == pygame.KEYDOWN and event.key in HOTKEYS:
+        for callback in HOTKEYS[event.key]:
+            callback()
@@ -0,0 +1,217 @@
+import gzip
+import json
+import os
+import random
+import time
+import pygame
+
+FORMAT_VERSION = 1
+RECORD_ENV = "QUIZTASY_RECORD"
+NUM_SCANCODES = 512
+
+
+class VirtualClock:
+    def __init__(self, recorder, limit=True):
+        """Drop-in for pygame.time.Clock whose tick() returns the recorded frame time."""
+        self.recorder = recorder
+        self.clock = recorder.real_clock() if limit else None
+        self.last_ticks = recorder.ticks
+        self.frame_time = 0
+
+    def tick(self, framerate=0):
+        if self.clock:
+            self.clock.tick(framerate)
+        self.frame_time = self.recorder.ticks - self.last_ticks
+        self.last_ticks = self.recorder.ticks
+        return self.frame_time
+
+    def get_time(self):
+        return self.frame_time
+
+    def get_rawtime(self):
+        return self.frame_time
+
+    def get_fps(self):
+        return 1000 / self.frame_time if self.frame_time else 0.0
+
+
+class InputSession:
+    def __init__(self, path):
+        """Base for recording and replaying everything the game loops read from pygame.
+
+        A frame starts every time pygame.event.get() is called. Within a frame, time.time(),
+        pygame.time.get_ticks(), the mouse position and the keyboard state are frozen, so a
+        recorded session sees exactly the same values when it is replayed.
+        """
+        self.path = path
+        self.frames = []
+        self.frame_index = -1
+        self.start_time = time.time()
+        self.now = self.start_time
+        self.ticks = 0
+        self.originals = {}
+
+    def patch(self, owner, name, replacement):
+        self.originals[(owner, name)] = getattr(owner, name)
+        setattr(owner, name, replacement)
+
+    def install(self):
+        """Replaces the pygame and time functions the game reads input and time from."""
+        self.real_event_get = pygame.event.get
+        self.real_time = time.time
+        self.real_clock = pygame.time.Clock
+        self.patch(pygame.event, "get", self.event_get)
+        self.patch(pygame.key, "get_pressed", self.get_pressed)
+        self.patch(pygame.mouse, "get_pos", self.get_pos)
+        self.patch(pygame.time, "get_ticks", lambda: self.ticks)
+        self.patch(pygame.time, "Clock", lambda: VirtualClock(self, limit=self.limit_frame_rate))
+        self.patch(time, "time", lambda: self.now)
+        random.seed(self.seed)
+
+    def uninstall(self):
+        for (owner, name), original in self.originals.items():
+            setattr(owner, name, original)
+        self.originals = {}
+
+    def event_get(self, *args, **kwargs):
+        """Starts a frame. The base session reads pygame's real queue; a replay serves recorded events instead."""
+        return self.real_event_get(*args, **kwargs)
+
+    def get_pressed(self):
+        return self.keys
+
+    def get_pos(self):
+        return self.mouse_pos
+
+
+class InputRecorder(InputSession):
+    limit_frame_rate = True
+
+    def __init__(self, path, seed=None):
+        """Records a play session to a gzip-compressed JSON file."""
+        super().__init__(path)
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.keys = pygame.key.ScancodeWrapper([False] * NUM_SCANCODES)
+        self.mouse_pos = (0, 0)
+
+    def install(self):
+        self.real_get_pressed = pygame.key.get_pressed
+        self.real_get_pos = pygame.mouse.get_pos
+        super().install()
+
+    def event_get(self, *args, **kwargs):
+        events = super().event_get(*args, **kwargs)
+        self.now = self.real_time()
+        self.ticks = int((self.now - self.start_time) * 1000)
+        try:
+            self.keys = self.real_get_pressed()
+            self.mouse_pos = self.real_get_pos()
+        except pygame.error:
+            pass  # Display not initialised yet, keep the previous state
+        self.frames.append([
+            self.ticks,
+            list(self.mouse_pos),
+            [scancode for scancode, pressed in enumerate(self.keys) if pressed],
+            [encode_event(event) for event in events],
+        ])
+        return events
+
+    def save(self):
+        """Writes the recording; called once when the game exits."""
+        data = {"version": FORMAT_VERSION, "seed": self.seed, "start_time": self.start_time, "frames": self.frames}
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        print(f"Recorded {len(self.frames)} frames to {self.path}")
+
+
+class InputReplayer(InputSession):
+    limit_frame_rate = False  # Replays run as fast as the game can draw
+
+    def __init__(self, path):
+        """Replays a recording and measures how long every frame took."""
+        super().__init__(path)
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported recording version: {data.get('version')}")
+        self.seed = data["seed"]
+        self.start_time = data["start_time"]
+        self.now = self.start_time
+        self.frames = data["frames"]
+        self.keys = pygame.key.ScancodeWrapper([False] * NUM_SCANCODES)
+        self.mouse_pos = (0, 0)
+        self.frame_times = []
+        self.last_frame_start = None
+
+    def install(self):
+        super().install()
+        self.patch(pygame.time, "delay", lambda milliseconds: 0)
+        self.patch(pygame.time, "wait", lambda milliseconds: 0)
+
+    @property
+    def finished(self):
+        return self.frame_index >= len(self.frames) - 1
+
+    def event_get(self, *args, **kwargs):
+        self.real_event_get()  # Keep SDL's queue drained, the real events are ignored
+
+        frame_start = time.perf_counter()
+        if self.last_frame_start is not None:
+            self.frame_times.append((frame_start - self.last_frame_start) * 1000)
+        self.last_frame_start = frame_start
+
+        if self.finished:
+            # Out of input, close every loop that is still running
+            return [pygame.event.Event(pygame.QUIT)]
+
+        self.frame_index += 1
+        ticks, mouse_pos, pressed, events = self.frames[self.frame_index]
+        self.ticks = ticks
+        self.now = self.start_time + ticks / 1000
+        self.mouse_pos = tuple(mouse_pos)
+        keys = [False] * NUM_SCANCODES
+        for scancode in pressed:
+            keys[scancode] = True
+        self.keys = pygame.key.ScancodeWrapper(keys)
+        return [decode_event(event) for event in events]
+
+    def write_timing(self, path):
+        """Writes per-frame timings as CSV and prints a short summary."""
+        with open(path, "w") as f:
+            f.write("frame,ms\n")
+            for index, ms in enumerate(self.frame_times):
+                f.write(f"{index},{ms:.3f}\n")
+        if self.frame_times:
+            ordered = sorted(self.frame_times)
+            print(f"Replayed {len(self.frame_times)} frames: "
+                  f"median {ordered[len(ordered) // 2]:.2f} ms, "
+                  f"p95 {ordered[int(len(ordered) * 0.95)]:.2f} ms, "
+                  f"max {ordered[-1]:.2f} ms")
+
+
+def encode_event(event):
+    """Converts an event to [type, attributes] with only JSON-friendly values."""
+    attributes = {}
+    for name, value in event.dict.items():
+        if isinstance(value, tuple):
+            value = list(value)
+        if value is None or isinstance(value, (bool, int, float, str, list)):
+            attributes[name] = value
+    return [event.type, attributes]
+
+
+def decode_event(data):
+    event_type, attributes = data
+    return pygame.event.Event(event_type, {name: tuple(value) if isinstance(value, list) else value
+                                           for name, value in attributes.items()})
+
+
+def start_recording_from_env():
+    """Starts recording if QUIZTASY_RECORD is set to an output path. Returns the recorder or None."""
+    path = os.environ.get(RECORD_ENV)
+    if not path:
+        return None
+    recorder = InputRecorder(path)
+    recorder.install()
+    print(f"Recording input to {path} (seed {recorder.seed})")
+    return recorder
@@ -0,0 +1,147 @@
+"""Cycles menu -> map -> battle -> menu headlessly and fails if memory keeps growing.
+
+Usage: python -m debug.leak_check [--cycles 100] [--warmup 5] [--max-rss-mb 64] [--max-heap-mb 8] [--max-surfaces 10]
+
+Each cycle builds the map like FinalQuiztasy.map(), enters a battle from it like the map's enter button
+does, leaves the battle and returns to the main menu. After the warmup cycles fill the caches, the
+resident memory, the Python heap (tracemalloc) and the surfaces referenced from Python objects must stay
+within the given limits, and no Map or Battle may outlive its cycle. Exits with status 1 otherwise.
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LEVEL_IDS = (1, 2, 3, 4, 5)
+
+
+def resident_memory():
+    """Resident set size of this process in bytes, or None when it can't be determined."""
+    try:
+        import psutil  # Optional, works on every platform
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def live_surfaces():
+    """Number of distinct surfaces referenced from Python containers (instance dicts, lists, tuples)."""
+    import pygame
+    seen = set()
+    for obj in gc.get_objects():
+        if isinstance(obj, dict):
+            values = obj.values()
+        elif isinstance(obj, (list, tuple)):
+            values = obj
+        else:
+            continue
+        for value in values:
+            if isinstance(value, pygame.Surface):
+                seen.add(id(value))
+    return len(seen)
+
+
+def live_instances(*classes):
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, classes))
+
+
+def run_cycle(game, level_id):
+    """menu -> map -> battle -> menu, through the same hooks the game uses."""
+    import pygame
+    from maps.map import Map
+    from managers.asset_manager import asset_manager
+    from ui.loading_screen import LoadingScreen
+
+    LoadingScreen(game.screen, "Loading map").run(asset_manager.preload("map", hero="boy"))
+    game.lspu_map = Map(game.screen, game.script_dir, game.return_to_main_menu, game.audio_manager, "boy", game_instance=game)
+    game.main_menu.exit()
+    game.lspu_map.enter()
+    game.lspu_map.draw()
+
+    # The queued QUIT ends the battle after its first frame
+    game.lspu_map.levels_manager.set_active_level(level_id)
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+    game.lspu_map.levels_manager.enter_level()
+
+    game.return_to_main_menu()
+    game.lspu_map.exit()
+    game.lspu_map.dispose()
+    game.lspu_map = None
+    game.main_menu.enter()
+    game.draw()
+    game.screen.present()
+
+
+def measure():
+    gc.collect()
+    return {
+        "rss": resident_memory(),
+        "heap": tracemalloc.get_traced_memory()[0],
+        "surfaces": live_surfaces(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that Final Quiztasy's scenes free their memory.")
+    parser.add_argument("--cycles", type=int, default=100, help="menu -> map -> battle -> menu cycles to run")
+    parser.add_argument("--warmup", type=int, default=5, help="cycles run before the baseline is taken")
+    parser.add_argument("--max-rss-mb", type=float, default=64, help="allowed resident memory growth")
+    parser.add_argument("--max-heap-mb", type=float, default=8, help="allowed Python heap growth")
+    parser.add_argument("--max-surfaces", type=int, default=10, help="allowed growth in live surfaces")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.chdir(SCRIPT_DIR)
+    sys.path.insert(0, SCRIPT_DIR)
+
+    from main import FinalQuiztasy
+    from maps.map import Map
+    from gameplay.battle import Battle
+    game = FinalQuiztasy(save_path=":memory:")
+    game.hero_selection.get()  # Built by the time a player reaches the map
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for cycle in range(args.warmup):
+        run_cycle(game, LEVEL_IDS[cycle % len(LEVEL_IDS)])
+    baseline = measure()
+    for cycle in range(args.cycles):
+        run_cycle(game, LEVEL_IDS[cycle % len(LEVEL_IDS)])
+        if (cycle + 1) % 10 == 0:
+            current = measure()
+            rss = f"{(current['rss'] - baseline['rss']) / 1e6:+.1f} MB" if baseline["rss"] is not None else "n/a"
+            print(f"cycle {cycle + 1:4d}: rss {rss}, heap {(current['heap'] - baseline['heap']) / 1e6:+.2f} MB, "
+                  f"surfaces {current['surfaces'] - baseline['surfaces']:+d}")
+    final = measure()
+    leaked_scenes = live_instances(Map, Battle)
+    tracemalloc.stop()
+
+    failures = []
+    if baseline["rss"] is not None and final["rss"] - baseline["rss"] > args.max_rss_mb * 1e6:
+        failures.append(f"resident memory grew by {(final['rss'] - baseline['rss']) / 1e6:.1f} MB")
+    if final["heap"] - baseline["heap"] > args.max_heap_mb * 1e6:
+        failures.append(f"Python heap grew by {(final['heap'] - baseline['heap']) / 1e6:.2f} MB")
+    if final["surfaces"] - baseline["surfaces"] > args.max_surfaces:
+        failures.append(f"{final['surfaces'] - baseline['surfaces']} more live surfaces")
+    if leaked_scenes:
+        failures.append(f"{leaked_scenes} Map/Battle objects still alive")
+
+    print(f"Ran {args.warmup + args.cycles} cycles in {time.perf_counter() - start:.1f} s")
+    for failure in failures:
+        print(f"LEAK: {failure}")
+    if not failures:
+        print("No leaks found")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+import time
+import weakref
+import pygame
+from settings import FONT_PATH
+from .hotkeys import register_hotkey
+from .frame_timing import frame_timer
+
+TOGGLE_HOTKEY = pygame.K_F3
+HUD_POSITION = (10, 10)
+HUD_SIZE = (330, 150)
+REFRESH_INTERVAL = 0.25  # Seconds between HUD text/sparkline updates
+SPARKLINE_FRAMES = 120
+SPARKLINE_MAX_MS = 50.0  # Frame time at the top of the sparkline
+ATLAS_CHARACTERS = " 0123456789.,:/%-_()abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+BACKGROUND = (0, 0, 0)
+TEXT_COLOR = (0, 255, 0)
+BUDGET_COLOR = (255, 255, 0)
+
+# Objects that hold cached surfaces; each must have a cached_surfaces() method
+surface_caches = weakref.WeakSet()
+
+
+def track_surface_cache(cache):
+    """Registers an object whose cached_surfaces() should count towards the HUD's cache memory."""
+    surface_caches.add(cache)
+
+
+def surface_cache_bytes():
+    """Total bytes of pixel data held by every tracked surface cache."""
+    total = 0
+    seen = set()
+    for cache in list(surface_caches):
+        for surface in cache.cached_surfaces():
+            if surface is not None and id(surface) not in seen:
+                seen.add(id(surface))
+                total += surface.get_width() * surface.get_height() * surface.get_bytesize()
+    return total
+
+
+class PerfHud:
+    def __init__(self):
+        """Toggleable performance overlay. Text is drawn from a pre-rendered glyph atlas into its own
+        surface a few times per second, so showing it costs one blit per frame that isn't counted."""
+        self.visible = False
+        self.hidden_rect = None  # Area to restore on the frame after the HUD was hidden
+        self.surface = None
+        self.glyphs = None
+        self.frame_times = [0.0] * SPARKLINE_FRAMES
+        self.frame_index = 0
+        self.last_frame = None
+        self.last_refresh = 0.0
+        self.blit_count = 0
+        self.rect = pygame.Rect(HUD_POSITION, HUD_SIZE)  # In display pixels, the HUD isn't scaled
+        self.layout_rect = self.rect  # The same area in the scenes' coordinates
+
+    def toggle(self):
+        self.visible = not self.visible
+        if not self.visible:
+            self.hidden_rect = self.layout_rect
+        self.last_refresh = 0.0
+
+    def build_atlas(self):
+        """Renders every glyph the HUD uses once."""
+        font = pygame.font.Font(FONT_PATH, 12)
+        self.glyphs = {char: font.render(char, False, TEXT_COLOR, BACKGROUND).convert() for char in ATLAS_CHARACTERS}
+        self.line_height = font.get_linesize() + 2
+        self.surface = pygame.Surface(HUD_SIZE).convert()
+
+    def draw_text(self, text, x, y):
+        glyphs = self.glyphs
+        for char in text:
+            glyph = glyphs.get(char) or glyphs["_"]
+            self.surface.blit(glyph, (x, y))
+            x += glyph.get_width()
+
+    def dirty_rect(self):
+        """Area the HUD changes this frame, for dirty-rect rendering."""
+        if self.visible:
+            return self.layout_rect
+        rect, self.hidden_rect = self.hidden_rect, None
+        return rect
+
+    def draw(self, screen):
+        """Samples this frame's numbers and draws the overlay; call right before presenting."""
+        now = time.perf_counter()
+        if self.last_frame is not None:
+            self.frame_times[self.frame_index] = (now - self.last_frame) * 1000
+            self.frame_index = (self.frame_index + 1) % SPARKLINE_FRAMES
+        self.last_frame = now
+        self.blit_count = screen.take_blit_count() if hasattr(screen, "take_blit_count") else 0
+
+        if not self.visible:
+            return
+        if self.glyphs is None:
+            self.build_atlas()
+        if now - self.last_refresh >= REFRESH_INTERVAL:
+            self.last_refresh = now
+            self.refresh()
+        # Bypass the blit counter so the HUD doesn't count itself
+        if hasattr(screen, "draw_overlay"):
+            self.layout_rect = screen.to_layout(self.rect)
+            screen.draw_overlay(self.surface, self.rect)
+        else:
+            screen.blit(self.surface, self.rect)
+
+    def refresh(self):
+        """Redraws the HUD text and the frame time sparkline."""
+        frame_time = self.frame_times[self.frame_index - 1]
+        recorded = [value for value in self.frame_times if value]
+        average = sum(recorded) / len(recorded) if recorded else 0
+        fps = 1000 / average if average else 0
+        channels = pygame.mixer.get_num_channels() if pygame.mixer.get_init() else 0
+        busy = sum(1 for i in range(channels) if pygame.mixer.Channel(i).get_busy())
+        music = 1 if pygame.mixer.get_init() and pygame.mixer.music.get_busy() else 0
+
+        self.surface.fill(BACKGROUND)
+        lines = [
+            f"FPS {fps:5.1f}  frame {frame_time:5.1f} ms",
+            f"blits/frame {self.blit_count}",
+            f"cached surfaces {surface_cache_bytes() / 1048576:.1f} MB",
+            f"audio channels {busy}/{channels} music {music}",
+            f"scene {frame_timer.current_scene or '-'}",
+        ]
+        y = 4
+        for line in lines:
+            self.draw_text(line, 4, y)
+            y += self.line_height
+
+        # Sparkline of the last frame times, oldest on the left, with the 60 FPS budget marked
+        top, height = y + 2, HUD_SIZE[1] - y - 6
+        budget_y = top + height - int(height * min(1.0, 16.7 / SPARKLINE_MAX_MS))
+        pygame.draw.line(self.surface, BUDGET_COLOR, (4, budget_y), (HUD_SIZE[0] - 4, budget_y))
+        step = (HUD_SIZE[0] - 8) / (SPARKLINE_FRAMES - 1)
+        points = []
+        for i in range(SPARKLINE_FRAMES):
+            value = self.frame_times[(self.frame_index + i) % SPARKLINE_FRAMES]
+            points.append((4 + i * step, top + height - height * min(1.0, value / SPARKLINE_MAX_MS)))
+        pygame.draw.lines(self.surface, TEXT_COLOR, False, points)
+
+
+# Shared by every game loop
+perf_hud = PerfHud()
+register_hotkey(TOGGLE_HOTKEY, perf_hud.toggle)
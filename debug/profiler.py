@@ -0,0 +1,120 @@
+import cProfile
+import os
+import sys
+import threading
+import time
+from collections import Counter
+import pygame
+from .hotkeys import register_hotkey
+
+PROFILE_ENV = "QUIZTASY_PROFILE_FRAMES"
+PROFILE_HOTKEY = pygame.K_F10
+DEFAULT_FRAMES = 300
+SAMPLE_INTERVAL = 0.001  # Seconds between stack samples
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "perf_reports")
+
+
+class FrameProfiler:
+    def __init__(self):
+        """Profiles the next N frames of whichever scene is active.
+
+        The frame timer calls frame_ended() only while `active` is set, so an idle profiler costs
+        one branch per frame. A capture writes a cProfile .pstats file and a collapsed-stack file
+        (one "outer;...;inner count" line per stack, for flamegraph.pl or speedscope).
+        """
+        self.active = False
+        self.profile = None
+        self.frames_left = 0
+        self.scene = None
+        self.level_id = None  # Set by the battle loop so captures can be tagged with the level
+        self.samples = Counter()
+        self.sampler = None
+        self.sampling = False
+        self.target_thread = None
+
+    def request(self, frames=DEFAULT_FRAMES):
+        """Arms a capture of the next `frames` frames; it starts when the current frame ends."""
+        if self.active:
+            print("Profiler: a capture is already running")
+            return
+        self.frames_left = frames
+        self.profile = None
+        self.active = True
+        print(f"Profiler: capturing the next {frames} frames")
+
+    def frame_ended(self, scene):
+        """Starts, counts and finishes the capture on frame boundaries."""
+        if self.profile is None:
+            self.start(scene)
+            return
+        self.frames_left -= 1
+        if self.frames_left <= 0:
+            self.finish()
+
+    def start(self, scene):
+        self.scene = scene
+        self.samples = Counter()
+        self.target_thread = threading.get_ident()
+        self.sampling = True
+        self.sampler = threading.Thread(target=self.sample_loop, name="frame-profiler", daemon=True)
+        self.sampler.start()
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def sample_loop(self):
+        """Samples the game thread's stack until the capture ends."""
+        while self.sampling:
+            frame = sys._current_frames().get(self.target_thread)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+            time.sleep(SAMPLE_INTERVAL)
+
+    def finish(self, directory=OUTPUT_DIR):
+        """Stops the capture and writes the .pstats and collapsed-stack files."""
+        self.profile.disable()
+        self.sampling = False
+        self.sampler.join()
+        self.active = False
+
+        os.makedirs(directory, exist_ok=True)
+        tag = self.scene or "unknown"
+        if self.level_id is not None:
+            tag += f"-level{self.level_id}"
+        base = os.path.join(directory, f"profile-{tag}-{time.strftime('%Y%m%d-%H%M%S')}")
+        self.profile.dump_stats(base + ".pstats")
+        with open(base + ".collapsed", "w") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+        self.profile = None
+        print(f"Profile written to {base}.pstats and {base}.collapsed")
+        return base
+
+    def close(self):
+        """Writes a capture that was still running when the game exited."""
+        if self.profile is not None:
+            self.finish()
+        self.active = False
+
+
+frame_profiler = FrameProfiler()
+register_hotkey(PROFILE_HOTKEY, frame_profiler.request)
+
+
+def start_profiling_from_env():
+    """Arms a capture if QUIZTASY_PROFILE_FRAMES is set to a frame count."""
+    value = os.environ.get(PROFILE_ENV)
+    if not value:
+        return
+    try:
+        frames = int(value)
+    except ValueError:
+        frames = 0
+    if frames <= 0:
+        print(f"Ignoring {PROFILE_ENV}={value}, expected a frame count")
+        return
+    frame_profiler.request(frames)
@@ -0,0 +1,53 @@
+"""Replays a recorded session headlessly at full speed.
+
+Usage: python -m debug.replay session.qzr [--timing frames.csv] [--trace trace.json] [--profile N] [--window]
+"""
+import argparse
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded Final Quiztasy session.")
+    parser.add_argument("recording", help="file written with QUIZTASY_RECORD")
+    parser.add_argument("--timing", help="CSV file for per-frame timings (default: <recording>.timing.csv)")
+    parser.add_argument("--trace", help="write a Chrome trace of the replayed session to this file")
+    parser.add_argument("--profile", type=int, metavar="N", help="profile the first N frames of the replay")
+    parser.add_argument("--window", action="store_true", help="show the game window instead of running headless")
+    args = parser.parse_args(argv)
+
+    if not args.window:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    recording = os.path.abspath(args.recording)
+    os.chdir(SCRIPT_DIR)
+    sys.path.insert(0, SCRIPT_DIR)
+
+    from debug.input_recorder import InputReplayer
+    replayer = InputReplayer(recording)
+    replayer.install()
+
+    from debug.tracing import tracer, span
+    if args.trace:
+        tracer.start(os.path.abspath(args.trace))
+        tracer.begin_transition("menu")
+
+    from debug.profiler import frame_profiler
+    if args.profile:
+        frame_profiler.request(args.profile)
+
+    from main import FinalQuiztasy
+    with span("startup"):
+        game = FinalQuiztasy(save_path=":memory:")  # Start from empty save data, like the recording did
+    game.run()
+    tracer.save()
+
+    replayer.write_timing(args.timing or recording + ".timing.csv")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+import functools
+import json
+import os
+import threading
+import time
+import pygame
+
+TRACE_ENV = "QUIZTASY_TRACE"
+
+
+class Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.tracer.complete(self.name, self.start, time.perf_counter(), self.args)
+        return False
+
+
+class NullSpan:
+    """Returned by span() while tracing is off, so a disabled span costs one call and one check."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+class Tracer:
+    def __init__(self):
+        """Collects timed spans and writes them as Chrome Trace Event JSON (chrome://tracing, Perfetto).
+
+        While enabled, pygame's image loads, scales and music loads are wrapped so every call shows up
+        as its own span. A scene transition runs from begin_transition() until the first frame of the
+        new scene has been presented (reported by the frame timer).
+        """
+        self.enabled = False
+        self.path = None
+        self.events = []
+        self.origin = time.perf_counter()
+        self.transition = None  # (name, start) while waiting for the first frame of a new scene
+        self.originals = {}
+
+    def start(self, path):
+        """Starts recording spans, to be written to path by save()."""
+        self.path = path
+        self.events = []
+        self.origin = time.perf_counter()
+        self.enabled = True
+        self.wrap(pygame.image, "load", "image.load", lambda args: {"path": os.path.basename(str(args[0]))} if args else {})
+        self.wrap(pygame.transform, "scale", "transform.scale", lambda args: {"size": list(args[1])} if len(args) > 1 else {})
+        self.wrap(pygame.transform, "smoothscale", "transform.smoothscale", lambda args: {"size": list(args[1])} if len(args) > 1 else {})
+        self.wrap(pygame.mixer.music, "load", "music.load", lambda args: {"path": os.path.basename(str(args[0]))} if args else {})
+
+    def stop(self):
+        """Stops recording and restores the wrapped pygame functions."""
+        for (owner, name), original in self.originals.items():
+            setattr(owner, name, original)
+        self.originals = {}
+        self.enabled = False
+        self.transition = None
+
+    def wrap(self, owner, name, span_name, describe):
+        """Replaces owner.name with a version that records every call as a span."""
+        original = getattr(owner, name)
+        self.originals[(owner, name)] = original
+
+        @functools.wraps(original)
+        def traced_call(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.complete(span_name, start, time.perf_counter(), describe(args))
+
+        setattr(owner, name, traced_call)
+
+    def span(self, name, **args):
+        """Context manager timing a block. Costs almost nothing while tracing is off."""
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, args)
+
+    def complete(self, name, start, end, args=None):
+        """Records a finished span; start and end are perf_counter() values."""
+        event = {
+            "name": name,
+            "ph": "X",
+            "ts": (start - self.origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def instant(self, name, **args):
+        """Records a point in time, e.g. a button press that starts a transition."""
+        if not self.enabled:
+            return
+        self.events.append({
+            "name": name,
+            "ph": "i",
+            "s": "g",
+            "ts": (time.perf_counter() - self.origin) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args,
+        })
+
+    def begin_transition(self, name):
+        """Marks the start of a switch to another scene."""
+        if self.enabled:
+            self.transition = (name, time.perf_counter())
+
+    def end_transition(self, frame_start):
+        """Called by the frame timer once the new scene's first frame is presented."""
+        name, start = self.transition
+        self.transition = None
+        end = time.perf_counter()
+        self.complete("first frame", frame_start, end, {"scene": name})
+        self.complete(f"transition to {name}", start, end)
+
+    def save(self):
+        """Writes the recorded spans to the trace file."""
+        if not self.enabled:
+            return None
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w") as trace_file:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, trace_file)
+        print(f"Trace with {len(self.events)} events written to {self.path}")
+        return self.path
+
+
+tracer = Tracer()
+span = tracer.span
+
+
+def traced(name=None):
+    """Decorator timing every call of a function as a span (defaults to its qualified name)."""
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.complete(span_name, start, time.perf_counter())
+        return wrapper
+    return decorator
+
+
+def start_tracing_from_env():
+    """Starts tracing if QUIZTASY_TRACE is set to an output path. Returns the tracer or None."""
+    path = os.environ.get(TRACE_ENV)
+    if not path:
+        return None
+    tracer.start(path)
+    print(f"Tracing to {path}")
+    return tracer
@@ -3,22 +3,36 @@ import time
 import os
 from characters.player import Player
 from gameplay.questions import QuestionGenerator
+from gameplay.question_card import QuestionCard
 from managers.audio_manager import AudioManager
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, FONT_PATH
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, FONT_PATH, DIRTY_RECT_RENDERING
+from rendering.dirty_rects import DirtyRectCompositor
+from debug.frame_timing import frame_timer, PHASE_EVENTS, PHASE_UPDATE, PHASE_DRAW, PHASE_PRESENT
+from debug.hotkeys import handle_debug_hotkey
+from debug.perf_hud import perf_hud
+from debug.tracing import traced
+from debug.profiler import frame_profiler
+from ui.scene import Scene
+from managers.input_manager import input_manager, ACTION_ANSWERS, ACTION_CONFIRM, ACTION_PAUSE
 from .pause import Pause
 
-class Battle:
+class Battle(Scene):
+    @traced()
     def __init__(self, screen, script_dir, level, player_type="boy", audio_manager=None, game_instance=None):
         self.screen = screen
         self.script_dir = script_dir
         self.level = level
         self.running = True
         self.clock = pygame.time.Clock()
+        self.dt = 0  # Seconds since the previous frame
         self.font = pygame.font.Font(FONT_PATH, 50)
         self.small_font = pygame.font.Font(FONT_PATH, 30)
         self.audio_manager = audio_manager
         self.game_instance = game_instance
 
+        # Spaced-repetition scheduler of the current profile (None when run without a game instance)
+        self.scheduler = game_instance.get_question_scheduler() if game_instance else None
+
         # Initialize player and enemy
         self.player = Player(script_dir, player_type)
         self.enemy = level.create_enemy()
@@ -26,12 +40,26 @@ class Battle:
         # Battle state
         self.current_question = None
         self.selected_answer = None
-        self.answer_buttons = []
+        self.question_card = None
+        self.next_card = None  # Prefetched card for the next question
+        self.hovered_answer = None
         self.timer_start = 0
         self.time_left = level.get_timer_seconds()
         self.battle_message = ""
         self.message_timer = 0
 
+        # Cached timer and message surfaces, re-rendered only when their text changes
+        self.timer_value = None
+        self.timer_surface = None
+        self.timer_rect = None
+        self.message_text = None
+        self.message_surface = None
+        self.message_rect = None
+
+        # Redraws only the widgets that changed each frame
+        self.compositor = DirtyRectCompositor(screen, enabled=DIRTY_RECT_RENDERING)
+        self.was_paused = False
+
         # Save the current map OST for restoration later
         self.player_type = player_type
         self.map_ost = self.get_map_ost_path()
@@ -47,12 +75,36 @@ class Battle:
 
         # Initialize first question
         self.generate_new_question()
-
-        # Load and play battle music
+        self.update_widgets()
         self.battle_music = self.load_battle_music()
+
+    def enter(self):
+        """Starts the battle music and the first question's timer."""
+        self.running = True
         if self.battle_music:
             pygame.mixer.music.load(self.battle_music)
             pygame.mixer.music.play(-1)  # Loop the battle music
+        self.timer_start = time.time()
+
+    def exit(self):
+        # Stop battle music and restore map music when the battle ends
+        self.running = False
+        self.stop_battle_music()
+
+    def dispose(self):
+        """Drops the battle's sprites, cards and cached text, and its references to the game."""
+        self.pause_menu.dispose()
+        self.pause_menu = None
+        self.player = None
+        self.enemy = None
+        self.question_card = None
+        self.next_card = None
+        self.timer_surface = None
+        self.message_surface = None
+        self.compositor = None
+        self.level = None
+        self.scheduler = None
+        self.game_instance = None
 
     def open_map_from_pause(self):
         """Handle opening map when selected from pause menu"""
@@ -90,64 +142,66 @@ class Battle:
         pygame.mixer.music.play(-1)  # Loop the map music
 
     def generate_new_question(self):
-        """Generates a new question for the battle"""
-        self.current_question = QuestionGenerator.get_random_question(self.level.get_difficulty())
+        """Shows the next question, using the prefetched card when one is ready"""
+        if self.next_card is None:
+            self.prefetch_next_question()
+        self.question_card = self.next_card
+        self.current_question = self.question_card.question
+        self.next_card = None
         self.timer_start = time.time()
         self.time_left = self.level.get_timer_seconds()
         self.selected_answer = None
-        self.create_answer_buttons()
-
-    def create_answer_buttons(self):
-        """Creates the answer buttons based on the current question"""
-        self.answer_buttons = []
-        # Create a button for each choice
-        button_width = 200
-        button_height = 60
-        button_margin = 20
-        total_width = (button_width + button_margin) * len(self.current_question.choices)
-        start_x = (SCREEN_WIDTH - total_width) // 2
-
-        for i, choice in enumerate(self.current_question.choices):
-            button_rect = pygame.Rect(
-                start_x + i * (button_width + button_margin),
-                SCREEN_HEIGHT - 150,
-                button_width,
-                button_height
-            )
-            self.answer_buttons.append({
-                'rect': button_rect,
-                'value': choice,
-                'text': str(choice),
-                'hovered': False
-            })
+        self.hovered_answer = self.question_card.button_at(input_manager.mouse_pos)
+
+    def prefetch_next_question(self):
+        """Picks the next question and pre-renders its card ahead of time"""
+        question = QuestionGenerator.get_next_question(self.level.get_difficulty(), self.scheduler)
+        self.next_card = QuestionCard(question, self.font, self.small_font)
 
     def handle_events(self):
         """Handle user input during battle"""
-        for event in pygame.event.get():
+        for event in input_manager.poll():
             if event.type == pygame.QUIT:
                 self.running = False
+            handle_debug_hotkey(event)
+            actions = input_manager.actions(event)
 
+            if ACTION_PAUSE in actions:
+                self.pause_menu.handle_pause_action()
             # Only process other events if not paused
-            if not self.pause_menu.is_paused():
+            elif not self.pause_menu.is_paused():
                 if event.type == pygame.MOUSEMOTION:
-                    # Check if mouse is hovering over any answer button
-                    mouse_pos = pygame.mouse.get_pos()
-                    for button in self.answer_buttons:
-                        button['hovered'] = button['rect'].collidepoint(mouse_pos)
+                    # Check if mouse is hovering over an answer button (motion is coalesced to once per frame)
+                    self.hovered_answer = self.question_card.button_at(event.pos)
 
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     # Check if an answer button was clicked
-                    mouse_pos = pygame.mouse.get_pos()
-                    for button in self.answer_buttons:
-                        if button['rect'].collidepoint(mouse_pos):
-                            self.selected_answer = button['value']
-                            self.check_answer()
+                    self.select_answer(self.question_card.button_at(event.pos))
+
+                elif actions:
+                    # Answer keys and gamepad buttons pick an answer; confirm picks the hovered one
+                    index = next((ACTION_ANSWERS.index(action) for action in actions if action in ACTION_ANSWERS), None)
+                    if index is None and ACTION_CONFIRM in actions:
+                        index = self.hovered_answer
+                    self.select_answer(index)
 
             # Always process pause menu events
             self.pause_menu.update(event)
 
+    def select_answer(self, index):
+        """Answers with the answer button at index, if there is one"""
+        if index is not None and index < len(self.question_card.buttons):
+            self.selected_answer = self.question_card.buttons[index]['value']
+            self.check_answer()
+
+    def record_answer(self, correct):
+        """Reports the answer to the scheduler so missed questions come back sooner"""
+        if self.scheduler:
+            self.scheduler.record_answer(self.current_question.item_key, self.level.get_difficulty(), correct)
+
     def check_answer(self):
         """Checks if the selected answer is correct"""
+        self.record_answer(self.selected_answer == self.current_question.answer)
         if self.selected_answer == self.current_question.answer:
             # Correct answer - enemy takes damage
             self.enemy.take_damage(1)
@@ -196,6 +250,7 @@ class Battle:
         # If time runs out, treat as wrong answer
         if self.time_left <= 0 and self.running:
             self.battle_message = "Time's up! You take damage!"
+            self.record_answer(False)
             self.player.take_damage(self.enemy.get_damage_amount())
 
             if self.player.hp <= 0:
@@ -220,65 +275,103 @@ class Battle:
         self.enemy.draw(self.screen)
 
         # Draw timer
-        timer_text = self.font.render(f"Time: {int(self.time_left)}", True, (255, 255, 255))
-        timer_rect = timer_text.get_rect(center=(SCREEN_WIDTH // 2, 50))
-        pygame.draw.rect(self.screen, (0, 0, 0),
-                         (timer_rect.x - 10, timer_rect.y - 10,
-                          timer_rect.width + 20, timer_rect.height + 20))
-        self.screen.blit(timer_text, timer_rect)
-
-        # Draw question box
-        question_box = pygame.Rect(50, SCREEN_HEIGHT - 300, SCREEN_WIDTH - 100, 200)
-        pygame.draw.rect(self.screen, (0, 0, 0, 200), question_box)
-        pygame.draw.rect(self.screen, (255, 255, 255), question_box, 3)
-
-        # Draw question text
-        question_text = self.font.render(self.current_question.question_text, True, (255, 255, 255))
-        question_rect = question_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 250))
-        self.screen.blit(question_text, question_rect)
+        self.screen.blit(self.timer_surface, self.timer_rect)
+
+        # Draw the pre-rendered question box
+        self.question_card.draw_box(self.screen)
 
         # Draw answer buttons if not paused
         if not self.pause_menu.is_paused():
-            for button in self.answer_buttons:
-                color = (100, 100, 255) if button['hovered'] else (50, 50, 200)
-                pygame.draw.rect(self.screen, color, button['rect'])
-                pygame.draw.rect(self.screen, (255, 255, 255), button['rect'], 2)
-                text = self.small_font.render(button['text'], True, (255, 255, 255))
-                text_rect = text.get_rect(center=button['rect'].center)
-                self.screen.blit(text, text_rect)
+            self.question_card.draw_buttons(self.screen, self.hovered_answer)
 
         # Draw battle message
-        if self.battle_message and time.time() - self.message_timer < 2:
-            message_text = self.font.render(self.battle_message, True, (255, 255, 0))
-            message_rect = message_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-            pygame.draw.rect(self.screen, (0, 0, 0),
-                             (message_rect.x - 10, message_rect.y - 10,
-                              message_rect.width + 20, message_rect.height + 20))
-            self.screen.blit(message_text, message_rect)
+        if self.message_surface:
+            self.screen.blit(self.message_surface, self.message_rect)
 
         # Draw pause menu (button and overlay if paused)
         self.pause_menu.draw()
 
+    def render_text_box(self, text, color, center):
+        """Renders text on a black box with 10px padding and returns the surface and its rect"""
+        text_surface = self.font.render(text, True, color)
+        box = pygame.Surface((text_surface.get_width() + 20, text_surface.get_height() + 20)).convert()
+        box.fill((0, 0, 0))
+        box.blit(text_surface, (10, 10))
+        return box, box.get_rect(center=center)
+
+    def update_widgets(self, dt=0):
+        """Refreshes cached widget surfaces and reports changed widget areas to the compositor"""
+        # HP bars drain smoothly and sprites animate over dt seconds
+        self.player.update(dt)
+        self.enemy.update(dt)
+
+        # Timer, re-rendered once per second
+        timer_value = int(self.time_left)
+        if timer_value != self.timer_value:
+            self.timer_value = timer_value
+            self.timer_surface, self.timer_rect = self.render_text_box(
+                f"Time: {timer_value}", (255, 255, 255), (SCREEN_WIDTH // 2, 50))
+
+        # Battle message, shown for 2 seconds
+        message = self.battle_message if self.battle_message and time.time() - self.message_timer < 2 else None
+        if message != self.message_text:
+            self.message_text = message
+            self.message_surface, self.message_rect = None, None
+            if message:
+                self.message_surface, self.message_rect = self.render_text_box(
+                    message, (255, 255, 0), (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
+
+        paused = self.pause_menu.is_paused()
+        compositor = self.compositor
+        if paused or paused != self.was_paused:
+            # The pause overlay covers the whole screen, fall back to full redraws
+            self.was_paused = paused
+            compositor.invalidate()
+            if paused:
+                return
+
+        compositor.mark(perf_hud.dirty_rect())
+        compositor.track('timer', timer_value, self.timer_rect)
+        compositor.track('message', message, self.message_rect)
+        compositor.track('player_hp', self.player.hp_bar.state, self.player.hp_bar.rect)
+        compositor.track('enemy_hp', self.enemy.hp_bar.state, self.enemy.hp_bar.rect)
+        compositor.track('player_sprite', (id(self.player.image), self.player.animator.offset), self.player.sprite_rect())
+        compositor.track('enemy_sprite', (id(self.enemy.image), self.enemy.animator.offset), self.enemy.sprite_rect())
+        compositor.track('question', id(self.question_card), self.question_card.box_rect)
+        compositor.track('answers', (id(self.question_card), self.hovered_answer), self.question_card.buttons_rect)
+        compositor.track('pause_button', id(self.pause_menu.pause_button.image), self.pause_menu.pause_button.rect)
+
     def run(self):
         """Main battle loop"""
+        outer_level_id = frame_profiler.level_id
+        frame_profiler.level_id = self.level.level_id  # Tags profiles captured during this battle
         while self.running:
+            frame_timer.begin_frame("battle")
             # Handle events
             self.handle_events()
+            frame_timer.mark(PHASE_EVENTS)
 
-            # Update timer
+            # Update timer and widgets
             self.update_timer()
+            self.update_widgets(self.dt)
+            frame_timer.mark(PHASE_UPDATE)
 
-            # Draw battle
-            self.draw()
+            # Draw and present only what changed
+            self.compositor.render(self.draw)
+            perf_hud.draw(self.screen)
+            frame_timer.mark(PHASE_DRAW)
+            self.compositor.present()
+            frame_timer.mark(PHASE_PRESENT)
 
-            # Update display
-            pygame.display.flip()
+            # Render the next question's card now so the transition costs only a few blits
+            if self.next_card is None and self.running:
+                self.prefetch_next_question()
+            frame_timer.end_frame()
 
             # Cap the frame rate
-            self.clock.tick(FPS)
+            self.dt = self.clock.tick(FPS) / 1000
 
-        # Stop battle music and restore map music when the battle ends
-        self.stop_battle_music()
+        frame_profiler.level_id = outer_level_id
 
         # Return result (True for victory, False for defeat)
         return self.enemy.hp <= 0
\ No newline at end of file
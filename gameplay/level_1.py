@@ -1,5 +1,6 @@
 import pygame
 from characters.enemy import MiniBoss
+from managers.asset_manager import asset_manager
 
 class Level1:
     def __init__(self, script_dir):
@@ -15,8 +16,8 @@ class Level1:
         self.timer_seconds = 10
 
         # Load background for this level
-        self.background = pygame.image.load(f"{script_dir}/assets/images/battle/backgrounds/level1_bg.png")
-        self.background = pygame.transform.scale(self.background, (1920, 1080))
+        self.background = asset_manager.load_image(f"{script_dir}/assets/images/battle/backgrounds/level1_bg.png")
+        self.background = asset_manager.prepare(pygame.transform.scale(self.background, (1920, 1080)))
 
     def create_enemy(self):
         """Creates the enemy for this level"""
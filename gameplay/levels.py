@@ -2,6 +2,10 @@ import pygame
 import os
 from .battle import Battle
 from importlib import import_module
+from debug.tracing import tracer, span
+from managers.asset_manager import asset_manager
+from ui.loading_screen import LoadingScreen
+from ui.scene import run_scene
 
 class Levels:
     def __init__(self, script_dir):
@@ -21,13 +25,8 @@ class Levels:
         level_names = ["spawn_point"] + [f"stage_{i}" for i in range(1, 21)] # Includes spawn and 20 levels
         # Load and scale images dynamically
         self.level_images = {
-            name: pygame.transform.scale(
-                pygame.image.load(os.path.join(self.script_dir, "assets", "images", "levels", f"{name}.png")),
-                (int(pygame.image.load(os.path.join(self.script_dir, "assets", "images", "levels",
-                    f"{name}.png")).get_width() * LEVEL_SCALE),
-                 int(pygame.image.load(os.path.join(self.script_dir, "assets", "images", "levels",
-                    f"{name}.png")).get_height() * LEVEL_SCALE))
-            ) for name in level_names
+            name: asset_manager.load_image(os.path.join(self.script_dir, "assets", "images", "levels", f"{name}.png"), scale=LEVEL_SCALE)
+            for name in level_names
         }
         # Define level positions and interaction radii
         level_data = [
@@ -66,6 +65,14 @@ class Levels:
         self.audio_manager = audio_manager
         self.game_instance = game_instance
 
+    def dispose(self):
+        """Drops the level sprites and the context set by the map."""
+        self.levels = []
+        self.level_images = {}
+        self.screen = None
+        self.audio_manager = None
+        self.game_instance = None
+
     def get_level_by_id(self, level_id):
         """Get a level by its ID."""
         return next((l for l in self.levels if l["id"] == level_id), None)
@@ -103,15 +110,18 @@ class Levels:
         """Enter the currently active level."""
         if self.active_level is not None and self.screen is not None:
             print(f"Level {self.active_level} is clicked")
-            try:
-                module = import_module(f"gameplay.level_{self.active_level}")
-                # Get the level class (assuming naming convention Level1, Level2, etc.)
-                level_class = getattr(module, f"Level{self.active_level}")
-                level = level_class(self.script_dir)
-            except (ImportError, AttributeError):
-                # Fallback to level 1 if there's any error
-                from gameplay.level_1 import Level1
-                level = Level1(self.script_dir)
+            tracer.begin_transition("battle")
+            LoadingScreen(self.screen, "Loading battle").run(asset_manager.preload("battle", hero=self.hero_type))
+            with span("level construction", level=self.active_level):
+                try:
+                    module = import_module(f"gameplay.level_{self.active_level}")
+                    # Get the level class (assuming naming convention Level1, Level2, etc.)
+                    level_class = getattr(module, f"Level{self.active_level}")
+                    level = level_class(self.script_dir)
+                except (ImportError, AttributeError):
+                    # Fallback to level 1 if there's any error
+                    from gameplay.level_1 import Level1
+                    level = Level1(self.script_dir)
             # Start the battle with the player's hero type
             battle = Battle(
                 self.screen,
@@ -121,7 +131,7 @@ class Levels:
                 self.audio_manager,
                 game_instance=self.game_instance  # Make sure to pass the game_instance here
             )
-            victory = battle.run()
+            victory = run_scene(battle)
             # Handle battle result
             if victory:
                 print(f"Victory! Level {self.active_level} completed.")
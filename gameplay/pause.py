@@ -2,7 +2,10 @@ import pygame
 import os
 import time
 from ui.button import Button
+from ui.widgets import WidgetTree, Layer, ImageNode
+from ui.confirm_dialog import get_dialog
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_PATH
+from managers.asset_manager import asset_manager
 
 
 class Pause:
@@ -16,7 +19,6 @@ class Pause:
         self.total_paused_time = 0
         self.show_confirmation = False
         self.confirmation_type = None  # 'menu' or 'map'
-        self.confirmation_buttons = []
 
         # Callbacks for menu and map actions
         self.map_callback = map_callback
@@ -25,35 +27,42 @@ class Pause:
         # Load fonts
         self.font = pygame.font.Font(FONT_PATH, 50)
 
+        # Semi-transparent overlay, created once and reused every paused frame
+        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.overlay.fill((0, 0, 0, 128))
+
         # Load pause button images
         pause_idle_path = os.path.join(script_dir, "assets", "images", "battle", "pause", "pause", "pause_icon_img.png")
         pause_hover_path = os.path.join(script_dir, "assets", "images", "battle", "pause", "pause", "pause_icon_hover.png")
-        self.pause_idle = self.load_scaled_image(pause_idle_path)
-        self.pause_hover = self.load_scaled_image(pause_hover_path)
 
         # Load pause border image
         border_path = os.path.join(script_dir, "assets", "images", "battle", "pause", "pause_border.png")
         self.border_img = self.load_scaled_image(border_path, 0.5)
 
-        # Load confirmation border image
-        confirm_border_path = os.path.join(script_dir, "assets", "images", "battle", "pause", "confirmation", "yesorno_border.png")
-        self.confirm_border_img = self.load_scaled_image(confirm_border_path, 0.65)
-
         # Create pause button
         self.pause_button = Button(
             x=100,
             y=100,
-            idle_img=self.pause_idle,
-            hover_img=self.pause_hover,
+            idle_img=pause_idle_path,
+            hover_img=pause_hover_path,
             action=self.toggle_pause,
             scale=0.15,
-            audio_manager=self.audio_manager
+            audio_manager=self.audio_manager,
+            hit_mask=True
         )
 
         # Initialize pause menu icons only
         self.pause_icons = []
         self.init_pause_icons()
 
+        # Pause button; when paused the overlay (modal, so the pause button is out of reach), and over it
+        # either the pause menu or the confirmation dialog
+        self.hud_layer = Layer([self.pause_button])
+        self.overlay_layer = Layer([ImageNode(self.overlay)], modal=True)
+        self.menu_layer = Layer([ImageNode(self.border_img, center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)), *self.pause_icons])
+        self.confirmation_dialog = get_dialog(script_dir, "pause", audio_manager)
+        self.ui = WidgetTree(self.hud_layer, self.overlay_layer, self.menu_layer, self.confirmation_dialog)
+
     def init_pause_icons(self):
         """Initialize the pause menu icons"""
         icons = [
@@ -95,68 +104,23 @@ class Pause:
                 hover_img=hover_img,
                 action=icon["action"],
                 scale=1,
-                audio_manager=self.audio_manager
+                audio_manager=self.audio_manager,
+                hit_mask=True
             )
 
             self.pause_icons.append(button)
 
-    def init_confirmation_buttons(self):
-        """Initialize confirmation dialog buttons"""
-        self.confirmation_buttons = []
-
-        # Load button images
-        yes_idle = self.load_scaled_image(
-            os.path.join(self.script_dir, "assets", "images", "battle", "pause", "confirmation", "yes_btn_img.png"),
-            0.4
-        )
-        yes_hover = self.load_scaled_image(
-            os.path.join(self.script_dir, "assets", "images", "battle", "pause", "confirmation", "yes_btn_hover.png"),
-            0.4
-        )
-
-        no_idle = self.load_scaled_image(
-            os.path.join(self.script_dir, "assets", "images", "battle", "pause", "confirmation", "no_btn_img.png"),
-            0.4
-        )
-        no_hover = self.load_scaled_image(
-            os.path.join(self.script_dir, "assets", "images", "battle", "pause", "confirmation", "no_btn_hover.png"),
-            0.4
-        )
-
-        # Create buttons
-        yes_button = Button(
-            x=SCREEN_WIDTH // 2 - 250,
-            y=SCREEN_HEIGHT // 2 + 150,
-            idle_img=yes_idle,
-            hover_img=yes_hover,
-            action=self.confirm_action,
-            scale=1,
-            audio_manager=self.audio_manager
-        )
-
-        no_button = Button(
-            x=SCREEN_WIDTH // 2 + 250,
-            y=SCREEN_HEIGHT // 2 + 150,
-            idle_img=no_idle,
-            hover_img=no_hover,
-            action=self.cancel_confirmation,
-            scale=1,
-            audio_manager=self.audio_manager
-        )
-
-        self.confirmation_buttons.extend([yes_button, no_button])
-
     def show_menu_confirmation(self):
         """Show confirmation dialog for returning to menu"""
         self.show_confirmation = True
         self.confirmation_type = 'menu'
-        self.init_confirmation_buttons()
+        self.confirmation_dialog.open(self.confirm_action, self.cancel_confirmation)
 
     def show_map_confirmation(self):
         """Show confirmation dialog for opening map"""
         self.show_confirmation = True
         self.confirmation_type = 'map'
-        self.init_confirmation_buttons()
+        self.confirmation_dialog.open(self.confirm_action, self.cancel_confirmation)
 
     def confirm_action(self):
         """Handle confirmation (Yes button click)"""
@@ -186,17 +150,11 @@ class Pause:
         """Cancel confirmation dialog (No button click)"""
         self.show_confirmation = False
         self.confirmation_type = None
-        self.confirmation_buttons = []
+        self.confirmation_dialog.close()
 
     def load_scaled_image(self, path, scale=None):
         """Load an image and scale it. If scale is None, use self.scale"""
-        image = pygame.image.load(path).convert_alpha()
-        scale_factor = scale if scale is not None else self.scale
-        if scale_factor != 1.0:
-            new_width = int(image.get_width() * scale_factor)
-            new_height = int(image.get_height() * scale_factor)
-            return pygame.transform.scale(image, (new_width, new_height))
-        return image
+        return asset_manager.load_image(path, scale=scale if scale is not None else self.scale)
 
     def toggle_pause(self):
         """Toggle pause state and play click sound"""
@@ -211,6 +169,13 @@ class Pause:
                 self.total_paused_time += time.time() - self.pause_start_time
                 pygame.mixer.music.unpause()
 
+    def handle_pause_action(self):
+        """The pause key or gamepad button: closes an open confirmation, otherwise toggles pause"""
+        if self.show_confirmation:
+            self.cancel_confirmation()
+        else:
+            self.toggle_pause()
+
     def return_to_menu(self):
         """Return to main menu function"""
         print("Returning to menu...")
@@ -229,50 +194,42 @@ class Pause:
         self.total_paused_time = 0
         return paused_time
 
+    def update_layers(self):
+        """Pause button while playing; overlay plus the pause menu or the confirmation dialog while paused."""
+        self.hud_layer.visible = not self.paused
+        self.overlay_layer.visible = self.paused
+        self.menu_layer.visible = self.paused and not self.show_confirmation
+        self.confirmation_dialog.visible = self.paused and self.show_confirmation
+
     def draw_pause_overlay(self):
         """Draw the pause overlay when game is paused"""
         if self.paused:
-            # Create semi-transparent overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128))
-            self.screen.blit(overlay, (0, 0))
-
-            if not self.show_confirmation:
-                # Draw normal pause menu
-                border_rect = self.border_img.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-                self.screen.blit(self.border_img, border_rect)
-
-                # Draw pause icons
-                for icon in self.pause_icons:
-                    icon.draw(self.screen)
-            else:
-                # Draw confirmation dialog
-                confirm_rect = self.confirm_border_img.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-                self.screen.blit(self.confirm_border_img, confirm_rect)
-
-                # Draw confirmation buttons
-                for button in self.confirmation_buttons:
-                    button.draw(self.screen)
+            self.update_layers()
+            for layer in (self.overlay_layer, self.menu_layer, self.confirmation_dialog):
+                if layer.visible:
+                    layer.draw(self.screen)
 
     def draw(self):
         """Draw the pause button (always visible) and overlay when paused"""
-        if not self.paused:
-            self.pause_button.draw(self.screen)
-        self.draw_pause_overlay()
+        self.update_layers()
+        self.ui.draw(self.screen)
 
     def update(self, event):
-        """Handle pause button events"""
-        if not self.paused:
-            self.pause_button.update(event)
-        else:
-            if self.show_confirmation:
-                # Handle confirmation dialog events
-                for button in self.confirmation_buttons:
-                    button.update(event)
-            else:
-                # Handle pause menu events
-                for icon in self.pause_icons:
-                    icon.update(event)
+        """Handle pause button, pause menu and confirmation dialog events"""
+        self.update_layers()
+        self.ui.dispatch(event)
+
+    def dispose(self):
+        """Drops the overlay, buttons and the battle's callbacks; called by Battle.dispose()."""
+        self.ui.clear()
+        self.ui.release()
+        self.overlay = None
+        self.pause_button = None
+        self.pause_icons = []
+        self.confirmation_dialog.close()
+        self.confirmation_dialog = None
+        self.map_callback = None
+        self.menu_callback = None
 
     def is_paused(self):
         """Check if game is paused"""
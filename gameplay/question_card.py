@@ -0,0 +1,76 @@
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from debug.perf_hud import track_surface_cache
+
+# Answer button layout
+BUTTON_WIDTH = 200
+BUTTON_HEIGHT = 60
+BUTTON_MARGIN = 20
+BUTTON_Y = SCREEN_HEIGHT - 150
+
+# Colors
+BUTTON_COLOR = (50, 50, 200)
+BUTTON_HOVER_COLOR = (100, 100, 255)
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+
+
+class QuestionCard:
+    def __init__(self, question, font, small_font):
+        """Pre-renders the question box and both states of every answer button for one question."""
+        self.question = question
+
+        # Question box with border and question text
+        self.box_rect = pygame.Rect(50, SCREEN_HEIGHT - 300, SCREEN_WIDTH - 100, 200)
+        self.box_surface = pygame.Surface(self.box_rect.size).convert()
+        self.box_surface.fill(BLACK)
+        pygame.draw.rect(self.box_surface, WHITE, self.box_surface.get_rect(), 3)
+        question_text = font.render(question.question_text, True, WHITE)
+        question_rect = question_text.get_rect(center=(SCREEN_WIDTH // 2 - self.box_rect.x, 50))
+        self.box_surface.blit(question_text, question_rect)
+
+        # Answer buttons, laid out in one evenly spaced row
+        self.stride = BUTTON_WIDTH + BUTTON_MARGIN
+        self.start_x = (SCREEN_WIDTH - self.stride * len(question.choices)) // 2
+        self.buttons = []
+        for i, choice in enumerate(question.choices):
+            rect = pygame.Rect(self.start_x + i * self.stride, BUTTON_Y, BUTTON_WIDTH, BUTTON_HEIGHT)
+            self.buttons.append({
+                'rect': rect,
+                'value': choice,
+                'normal': self.render_button(str(choice), BUTTON_COLOR, small_font),
+                'hover': self.render_button(str(choice), BUTTON_HOVER_COLOR, small_font)
+            })
+        self.buttons_rect = self.buttons[0]['rect'].unionall([button['rect'] for button in self.buttons])
+        track_surface_cache(self)
+
+    def cached_surfaces(self):
+        return [self.box_surface] + [button[state] for button in self.buttons for state in ('normal', 'hover')]
+
+    def render_button(self, text, color, font):
+        """Renders one answer button state into its own surface."""
+        surface = pygame.Surface((BUTTON_WIDTH, BUTTON_HEIGHT)).convert()
+        surface.fill(color)
+        pygame.draw.rect(surface, WHITE, surface.get_rect(), 2)
+        label = font.render(text, True, WHITE)
+        surface.blit(label, label.get_rect(center=surface.get_rect().center))
+        return surface
+
+    def button_at(self, pos):
+        """Returns the index of the answer button under pos, or None (no per-button loop needed)."""
+        x, y = pos
+        if not BUTTON_Y <= y < BUTTON_Y + BUTTON_HEIGHT or x < self.start_x:
+            return None
+        index, offset = divmod(x - self.start_x, self.stride)
+        if index >= len(self.buttons) or offset >= BUTTON_WIDTH:
+            return None
+        return index
+
+    def draw_box(self, screen):
+        """Draws the question box."""
+        screen.blit(self.box_surface, self.box_rect)
+
+    def draw_buttons(self, screen, hovered=None):
+        """Draws the answer buttons, using the hovered surface for the hovered one."""
+        for i, button in enumerate(self.buttons):
+            screen.blit(button['hover'] if i == hovered else button['normal'], button['rect'])
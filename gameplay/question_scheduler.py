@@ -0,0 +1,110 @@
+import heapq
+import time
+
+# Review intervals in seconds
+MISSED_INTERVAL = 30  # Missed questions come back within the same session
+LEASE_INTERVAL = 60  # A question handed out but never answered comes back after this
+FIRST_INTERVAL = 10 * 60
+SECOND_INTERVAL = 24 * 60 * 60
+
+# SM-2 ease factor limits
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+MAX_EASE = 3.0
+
+
+class ReviewItem:
+    __slots__ = ("key", "difficulty", "interval", "ease", "reps", "due", "version")
+
+    def __init__(self, key, difficulty, interval=0.0, ease=DEFAULT_EASE, reps=0, due=0.0):
+        self.key = key
+        self.difficulty = difficulty
+        self.interval = interval
+        self.ease = ease
+        self.reps = reps
+        self.due = due
+        self.version = 0  # Bumped on every reschedule so older heap entries can be skipped
+
+
+class QuestionScheduler:
+    def __init__(self, profile, save_manager=None):
+        """Spaced-repetition (SM-2 style) scheduler for one profile, backed by a heap per difficulty."""
+        self.profile = profile
+        self.save_manager = save_manager
+        self.items = {}  # (difficulty, key) -> ReviewItem; an expression is reviewed separately per difficulty
+        self.heaps = {}  # difficulty -> [(due, version, key), ...]
+
+        if self.save_manager:
+            self.load()
+
+    def load(self):
+        """Loads saved review items and builds the heaps in O(n)."""
+        for key, difficulty, interval, ease, reps, due in self.save_manager.load_review_items(self.profile):
+            self.items[difficulty, key] = ReviewItem(key, difficulty, interval, ease, reps, due)
+        for item in self.items.values():
+            self.heaps.setdefault(item.difficulty, []).append((item.due, item.version, item.key))
+        for heap in self.heaps.values():
+            heapq.heapify(heap)
+
+    def next_due(self, difficulty, now=None):
+        """Returns the key of the most overdue question for a difficulty, or None if nothing is due."""
+        heap = self.heaps.get(difficulty)
+        if not heap:
+            return None
+        now = time.time() if now is None else now
+
+        # Drop entries that were superseded by a later reschedule
+        while heap:
+            due, version, key = heap[0]
+            if self.items[difficulty, key].version == version:
+                break
+            heapq.heappop(heap)
+
+        if not heap or heap[0][0] > now:
+            return None
+
+        # Lease the item so it isn't handed out twice before it's answered
+        key = heap[0][2]
+        self.reschedule(self.items[difficulty, key], now + LEASE_INTERVAL)
+        return key
+
+    def record_answer(self, key, difficulty, correct, now=None):
+        """Updates a question's interval after it was answered and saves it."""
+        now = time.time() if now is None else now
+        item = self.items.get((difficulty, key))
+        if item is None:
+            item = ReviewItem(key, difficulty)
+            self.items[difficulty, key] = item
+
+        if correct:
+            item.reps += 1
+            if item.reps == 1:
+                item.interval = FIRST_INTERVAL
+            elif item.reps == 2:
+                item.interval = SECOND_INTERVAL
+            else:
+                item.interval *= item.ease
+            item.ease = min(MAX_EASE, item.ease + 0.1)
+        else:
+            # Missed questions start over with a short interval
+            item.reps = 0
+            item.interval = MISSED_INTERVAL
+            item.ease = max(MIN_EASE, item.ease - 0.2)
+
+        self.reschedule(item, now + item.interval)
+        if self.save_manager:
+            self.save_manager.save_review_item(self.profile, item)
+        return item
+
+    def reschedule(self, item, due):
+        """Pushes a new heap entry for an item; the old entry becomes stale."""
+        item.due = due
+        item.version += 1
+        heapq.heappush(self.heaps.setdefault(item.difficulty, []), (item.due, item.version, item.key))
+
+        # Compact when stale entries outnumber live ones so the heap stays O(n)
+        heap = self.heaps[item.difficulty]
+        if len(heap) > 2 * len(self.items) + 64:
+            self.heaps[item.difficulty] = [entry for entry in heap
+                                           if self.items[item.difficulty, entry[2]].version == entry[1]]
+            heapq.heapify(self.heaps[item.difficulty])
@@ -1,5 +1,9 @@
 import random
 import operator
+import re
+
+# Matches question keys such as "12*4" or "56/7"
+QUESTION_KEY_PATTERN = re.compile(r"^(\d+)([+\-*/])(\d+)$")
 
 class Question:
     def __init__(self):
@@ -7,19 +11,28 @@ class Question:
         self.answer = None
         self.choices = []
         self.correct_choice = None
+        self.item_key = None  # Stable id used by the question scheduler
 
     def check_answer(self, user_answer):
         """Checks if the user's answer is correct"""
         return user_answer == self.answer
 
 class MathQuestion(Question):
-    def __init__(self, difficulty=1):
+    def __init__(self, difficulty=1, spec=None):
         super().__init__()
         self.difficulty = difficulty
-        self.generate_question()
-
-    def generate_question(self):
-        """Generates a random math question based on difficulty"""
+        self.generate_question(spec)
+
+    @classmethod
+    def from_key(cls, key, difficulty=1):
+        """Rebuilds a question from its item key, or returns None if the key is invalid"""
+        match = QUESTION_KEY_PATTERN.match(key)
+        if not match:
+            return None
+        return cls(difficulty, (int(match.group(1)), match.group(2), int(match.group(3))))
+
+    def generate_question(self, spec=None):
+        """Generates a math question based on difficulty, or from a (num1, op, num2) spec"""
         # Select operation
         operations = {
             '+': operator.add,
@@ -39,19 +52,22 @@ class MathQuestion(Question):
             num_range = (1, 100)
             ops = ['+', '-', '*', '/']
 
-        # Select operation
-        op_symbol = random.choice(ops)
-        operation = operations[op_symbol]
+        if spec:
+            num1, op_symbol, num2 = spec
+        else:
+            # Select operation
+            op_symbol = random.choice(ops)
 
-        # Generate numbers
-        num1 = random.randint(*num_range)
+            # Generate numbers
+            num1 = random.randint(*num_range)
 
-        # For division, ensure we get clean integer results
-        if op_symbol == '/':
-            num2 = random.randint(1, 10)
-            num1 = num2 * random.randint(1, 10)
-        else:
-            num2 = random.randint(*num_range)
+            # For division, ensure we get clean integer results
+            if op_symbol == '/':
+                num2 = random.randint(1, 10)
+                num1 = num2 * random.randint(1, 10)
+            else:
+                num2 = random.randint(*num_range)
+        operation = operations[op_symbol]
 
         # Calculate answer
         result = operation(num1, num2)
@@ -63,6 +79,7 @@ class MathQuestion(Question):
         # Set question and answer
         self.question_text = f"What is {num1} {op_symbol} {num2}?"
         self.answer = result
+        self.item_key = f"{num1}{op_symbol}{num2}"
 
         # Generate multiple choice options
         self.generate_choices()
@@ -95,4 +112,15 @@ class QuestionGenerator:
     def get_random_question(difficulty=1):
         """Factory method to get a random question"""
         # Currently only generates math questions, but can be expanded
-        return MathQuestion(difficulty)
\ No newline at end of file
+        return MathQuestion(difficulty)
+
+    @staticmethod
+    def get_next_question(difficulty=1, scheduler=None):
+        """Returns the next due review question, or a new random one if nothing is due"""
+        if scheduler:
+            key = scheduler.next_due(difficulty)
+            if key:
+                question = MathQuestion.from_key(key, difficulty)
+                if question:
+                    return question
+        return QuestionGenerator.get_random_question(difficulty)
\ No newline at end of file
@@ -1,26 +1,41 @@
 import pygame
 import os
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from settings import FPS
 from ui.menu_background import MenuBackground
 from managers.audio_manager import AudioManager
-from ui.main_menu import MainMenu
-from ui.game_modes import GameModes
-from ui.hero_selection import HeroSelection
-from maps.map import Map
-from gameplay.battle import Battle
+from managers.save_manager import SaveManager, DEFAULT_PROFILE
+from gameplay.question_scheduler import QuestionScheduler
+from ui.lazy_scene import LazyScene, SceneWarmer, release_under_memory_pressure
+from ui.loading_screen import LoadingScreen
+from ui.scene import run_scene
+from managers.asset_manager import asset_manager
+from managers.input_manager import input_manager
+from debug.input_recorder import start_recording_from_env
+from debug.frame_timing import frame_timer, PHASE_EVENTS, PHASE_UPDATE, PHASE_DRAW, PHASE_PRESENT
+from debug.hotkeys import handle_debug_hotkey
+from debug.perf_hud import perf_hud
+from debug.tracing import tracer, span, start_tracing_from_env
+from debug.profiler import frame_profiler, start_profiling_from_env
+from rendering.screen import create_screen, CHECK_FORMATS_ENV
+
+MEMORY_CHECK_FRAMES = 5 * FPS  # Check for memory pressure every 5 seconds in the menus
 
 class FinalQuiztasy:
-    def __init__(self):
+    def __init__(self, save_path=None):
         pygame.init()
+        input_manager.install()
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption('Final Quiztasy')
+        self.save_path = save_path or os.path.join(self.script_dir, "database", "game_data.db")
+        self.screen = create_screen(check_formats=bool(os.environ.get(CHECK_FORMATS_ENV)))
+        # Below full resolution, pointer positions are scaled back up to the layout
+        input_manager.set_pointer_scale(1 / self.screen.scale)
+        self.screen.set_caption('Final Quiztasy')
 
         # Set window icon
         icon_path = os.path.join(self.script_dir, "images", "logo", "logo.png")
         if os.path.exists(icon_path):
             window_icon = pygame.image.load(icon_path)
-            pygame.display.set_icon(window_icon)
+            self.screen.set_icon(window_icon)
 
         # Game state
         self.running = True
@@ -28,15 +43,33 @@ class FinalQuiztasy:
         # Initialize game components
         self.setup_background()
         self.setup_audio()
+        self.setup_save_data()
+        LoadingScreen(self.screen).run(asset_manager.preload("boot"))
+        # Scene modules are imported when their screen is first built, so importing main stays cheap
+        from ui.main_menu import MainMenu
         self.main_menu = MainMenu(self.screen, self.audio_manager, self.script_dir, exit_callback=self.exit_game, game_instance=self)
-        self.hero_selection = HeroSelection(self, self.background_menu)  # Pass background_menu
-        self.game_modes = GameModes(self.screen, self.audio_manager, self.script_dir, scale=1.0, game_instance=self)
+
+        # Screens behind the main menu are built on first navigation, or in idle frames once the menu is up
+        self.hero_selection = LazyScene(self.create_hero_selection)
+        self.game_modes = LazyScene(self.create_game_modes)
+        self.lazy_scenes = [self.game_modes, self.hero_selection, self.main_menu.options_handler, self.main_menu.exit_handler]
+        self.scene_warmer = SceneWarmer(self.lazy_scenes)
+        self.menu_loader = asset_manager.preload("menus")  # Converted in idle frames, before the screens are warmed
+        self.frames_until_memory_check = MEMORY_CHECK_FRAMES
         self.lspu_map = None
         self.battle = None
 
         # Clock for controlling frame rate
         self.clock = pygame.time.Clock()
 
+    def create_hero_selection(self):
+        from ui.hero_selection import HeroSelection
+        return HeroSelection(self, self.background_menu)
+
+    def create_game_modes(self):
+        from ui.game_modes import GameModes
+        return GameModes(self.screen, self.audio_manager, self.script_dir, scale=1.0, game_instance=self)
+
     def setup_background(self):
         # Initialize background video
         self.background_menu = MenuBackground(
@@ -48,12 +81,26 @@ class FinalQuiztasy:
                                           os.path.join(self.script_dir, "assets", "audio", "sfx", "click_sound_button.mp3"))
         self.audio_manager.play_music()  # Play The OST Music
 
+    def setup_save_data(self):
+        # Open the save database; question schedulers are loaded per profile on first use
+        self.save_manager = SaveManager(self.save_path)
+        self.profile = DEFAULT_PROFILE
+        self.question_schedulers = {}
+
+    def get_question_scheduler(self, profile=None):
+        """Returns the question scheduler of a profile, loading it from the save data once per session."""
+        profile = profile or self.profile
+        if profile not in self.question_schedulers:
+            self.question_schedulers[profile] = QuestionScheduler(profile, self.save_manager)
+        return self.question_schedulers[profile]
+
     def exit_game(self):
         """Callback function to exit the game."""
         self.running = False
 
     def map(self, hero_ost_path):
         """Stops menu music, plays hero-specific map music, and loads the map."""
+        tracer.begin_transition("map")
         if not hasattr(self, "selected_hero") or not self.selected_hero:
             self.selected_hero = "boy"  # Default to boy if no hero was selected
 
@@ -66,7 +113,13 @@ class FinalQuiztasy:
         if self.audio_manager.audio_enabled:
             self.audio_manager.play_music()
 
-        # Create the LSPU map
+        # Load the question scheduler before the map so the first battle starts instantly
+        with span("load question scheduler"):
+            self.get_question_scheduler()
+
+        # Create the LSPU map; scene modules are imported on first use to keep startup short
+        from maps.map import Map
+        LoadingScreen(self.screen, "Loading map").run(asset_manager.preload("map", hero=self.selected_hero))
         self.lspu_map = Map(
             self.screen,
             self.script_dir,
@@ -76,9 +129,13 @@ class FinalQuiztasy:
             game_instance=self
         )
         self.hero_selection.hide()
+        self.hero_selection.exit()
+        self.main_menu.exit()
 
-        # Simply run the map - it will handle its own loop
-        self.lspu_map.run()
+        # Run the map's own loop; it is disposed when it returns
+        run_scene(self.lspu_map)
+        self.lspu_map = None
+        self.main_menu.enter()
 
         # Stop hero-specific map music when exiting
         self.audio_manager.stop_music()
@@ -90,24 +147,28 @@ class FinalQuiztasy:
 
     def start_battle(self, level, player_type):
         """Starts the battle when entering a level"""
+        tracer.begin_transition("battle")
+        from gameplay.battle import Battle
+        LoadingScreen(self.screen, "Loading battle").run(asset_manager.preload("battle", hero=player_type))
         self.battle = Battle(self.screen, self.script_dir, level, player_type, self.audio_manager, game_instance=self)
-        self.battle.run()
+        run_scene(self.battle)
+        self.battle = None
 
     def return_to_main_menu(self):
         """Callback function to return to the main menu."""
         print("Switching to main menu")
-        self.running_map = False  # Stop map loop if it's running
+        # Stop the running scenes; each is disposed when its loop returns
+        if self.lspu_map is not None:
+            self.lspu_map.running = False
+        if self.battle is not None:
+            self.battle.running = False
         self.main_menu.show()  # Ensure the main menu appears
-        # Also make sure to reset any necessary states
-        if hasattr(self, 'lspu_map'):
-            self.lspu_map = None
-        if hasattr(self, 'battle'):
-            self.battle = None
 
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in input_manager.poll():
             if event.type == pygame.QUIT:
                 self.running = False
+            handle_debug_hotkey(event)
             # Pass events to the main menu or hero selection based on visibility
             if hasattr(self, 'hero_selection') and self.hero_selection.visible:
                 self.hero_selection.update(event)
@@ -116,9 +177,7 @@ class FinalQuiztasy:
 
     def draw(self):
         # Draw background
-        frame_surface = self.background_menu.get_frame()
-        frame_surface = pygame.transform.scale(frame_surface, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.screen.blit(frame_surface, (0, 0))
+        self.screen.draw_fullscreen(self.background_menu.get_frame())
 
         # Draw the main menu or hero selection based on visibility
         if hasattr(self, 'hero_selection') and self.hero_selection.visible:
@@ -126,17 +185,57 @@ class FinalQuiztasy:
         else:
             self.main_menu.draw()
 
+    def idle_frame(self):
+        """Spare work after a menu frame: warm the next screen, and now and then check memory."""
+        if self.menu_loader.finished:
+            self.scene_warmer.idle_frame()
+        elif self.menu_loader.step(budget_ms=2):
+            self.menu_loader.report()
+        self.frames_until_memory_check -= 1
+        if self.frames_until_memory_check <= 0:
+            self.frames_until_memory_check = MEMORY_CHECK_FRAMES
+            release_under_memory_pressure(self.lazy_scenes)
+
     def run(self):
         # Main game loop
         while self.running:
+            frame_timer.begin_frame("hero_selection" if self.hero_selection.visible else "menu")
             self.handle_events()
+            frame_timer.mark(PHASE_EVENTS)
+            frame_timer.mark(PHASE_UPDATE)  # Menus have no separate update step
             self.draw()
-            pygame.display.update()
+            perf_hud.draw(self.screen)
+            frame_timer.mark(PHASE_DRAW)
+            self.screen.present()
+            frame_timer.mark(PHASE_PRESENT)
+            frame_timer.end_frame()
+            self.idle_frame()
             self.clock.tick(FPS)
+        # Write the frame time histograms of this session
+        frame_timer.export()
+        frame_profiler.close()
         # Clean up resources
+        self.main_menu.dispose()
+        for scene in self.lazy_scenes:
+            scene.dispose()
         self.background_menu.close()
+        self.save_manager.close()
         pygame.quit()
 
 if __name__ == "__main__":
-    game = FinalQuiztasy()
-    game.run()
\ No newline at end of file
+    # QUIZTASY_RECORD=<file> records the session for debug.replay, starting from empty save data
+    recorder = start_recording_from_env()
+    # QUIZTASY_TRACE=<file> writes a Chrome trace of startup, scene transitions and asset loads
+    start_tracing_from_env()
+    # QUIZTASY_PROFILE_FRAMES=<n> profiles the first n frames; F10 profiles the next 300 at any time
+    start_profiling_from_env()
+    tracer.begin_transition("menu")
+    try:
+        with span("startup"):
+            game = FinalQuiztasy(save_path=":memory:" if recorder else None)
+        game.run()
+    finally:
+        # Saved on a crash too; that's the session most worth replaying
+        if recorder:
+            recorder.save()
+        tracer.save()
\ No newline at end of file
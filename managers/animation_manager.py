@@ -0,0 +1,122 @@
+import json
+import os
+from settings import GAME_DIR
+from .asset_manager import asset_manager
+
+ANIMATIONS_PATH = os.path.join(GAME_DIR, "assets", "animations.json")
+DEFAULT_FRAME_TIME = 0.1  # Seconds per frame when an entry doesn't set frame_time
+
+# Animation states and facing directions as small integers; a sprite's clips are a flat tuple
+# indexed by clip_index(state, direction), so picking a frame is arithmetic instead of string compares
+STATE_STAND, STATE_WALK, STATE_IDLE = range(3)
+STATES = {"stand": STATE_STAND, "walk": STATE_WALK, "idle": STATE_IDLE}
+DIR_FRONT, DIR_BACK, DIR_LEFT, DIR_RIGHT = range(4)
+DIRECTIONS = {"front": DIR_FRONT, "back": DIR_BACK, "left": DIR_LEFT, "right": DIR_RIGHT}
+
+
+def clip_index(state, direction):
+    return state * len(DIRECTIONS) + direction
+
+
+class AnimationSet:
+    def __init__(self, clips, frame_time):
+        """The clips of one sprite. Each clip is a tuple of (surface, (dx, dy)) frames."""
+        self.clips = clips
+        self.frame_time = frame_time
+
+    def clip(self, state, direction):
+        return self.clips[clip_index(state, direction)]
+
+
+class AnimationManager:
+    def __init__(self, manifest_path=ANIMATIONS_PATH):
+        """Builds sprite animations from the entries of assets/animations.json.
+
+        An entry names a folder, one fixed transform (scale or size, flip_x) applied to every frame, a
+        frame_time, and clips keyed "state/direction". A clip is a list of frame files, or
+        {"frames": [...], "offsets": [[dx, dy], ...]} to move frames around, e.g. an idle bob made from
+        a single image. Paths may use {placeholders} filled in by load(). Frames come from the asset
+        manager, so they are scaled (or baked) once and shared by every sprite using them.
+        """
+        self.manifest_path = manifest_path
+        self.manifest = None
+        self.entries = {}  # name -> (frame_time, [(clip index, frame paths, offsets)]), parsed once
+
+    def get_manifest(self):
+        if self.manifest is None:
+            with open(self.manifest_path) as manifest_file:
+                self.manifest = json.load(manifest_file)
+        return self.manifest
+
+    def get_entry(self, name):
+        """Parses a manifest entry's clip names into clip indexes."""
+        entry = self.entries.get(name)
+        if entry is None:
+            spec = self.get_manifest()[name]
+            clips = []
+            for clip_name, clip in spec["clips"].items():
+                state, direction = clip_name.split("/")
+                if isinstance(clip, list):
+                    clip = {"frames": clip}
+                paths = [os.path.join(spec["folder"], frame) for frame in clip["frames"]]
+                offsets = [tuple(offset) for offset in clip.get("offsets", [(0, 0)])]
+                clips.append((clip_index(STATES[state], DIRECTIONS[direction]), paths, offsets))
+            entry = self.entries[name] = (spec.get("frame_time", DEFAULT_FRAME_TIME), clips)
+        return entry
+
+    def load(self, name, **params):
+        """Returns the AnimationSet of a manifest entry, e.g. load("map_hero", hero="boy").
+
+        Clips the entry doesn't define fall back to its first clip.
+        """
+        spec = self.get_manifest()[name]
+        frame_time, clip_specs = self.get_entry(name)
+        clips = [None] * (len(STATES) * len(DIRECTIONS))
+        for index, paths, offsets in clip_specs:
+            frames = [asset_manager.load_image(os.path.join(GAME_DIR, path.format(**params)), scale=spec.get("scale"),
+                                               size=spec.get("size"), flip_x=spec.get("flip_x", False))
+                      for path in paths]
+            length = max(len(frames), len(offsets))
+            clips[index] = tuple((frames[i % len(frames)], offsets[i % len(offsets)]) for i in range(length))
+        default = clips[clip_specs[0][0]]
+        return AnimationSet(tuple(clip if clip is not None else default for clip in clips), frame_time)
+
+
+class Animator:
+    def __init__(self, animations, state, direction):
+        """Plays one sprite's clips, advancing by frame time. `image` and `offset` are the current frame."""
+        self.animations = animations
+        self.state = None
+        self.direction = None
+        self.play(state, direction)
+
+    def play(self, state, direction):
+        """Switches clip. A new state starts its clip over; a new direction keeps the frame position."""
+        if state == self.state and direction == self.direction:
+            return
+        if state != self.state:
+            self.index = 0
+            self.elapsed = 0.0
+        self.state = state
+        self.direction = direction
+        self.clip = self.animations.clip(state, direction)
+        self.index %= len(self.clip)
+        self.image, self.offset = self.clip[self.index]
+
+    def update(self, dt):
+        """Advances by dt seconds. Returns True if the frame changed; single-frame clips cost nothing."""
+        clip = self.clip
+        if len(clip) < 2:
+            return False
+        self.elapsed += dt
+        frame_time = self.animations.frame_time
+        if self.elapsed < frame_time:
+            return False
+        steps = int(self.elapsed // frame_time)
+        self.elapsed -= steps * frame_time
+        self.index = (self.index + steps) % len(clip)
+        self.image, self.offset = clip[self.index]
+        return True
+
+
+animation_manager = AnimationManager()
@@ -0,0 +1,74 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+# Layout: magic, index length, JSON index, then the file contents back to back.
+# The index maps a name (path relative to the game folder, '/' separated) to [offset, length, sha1],
+# with offsets counted from the start of the archive.
+ARCHIVE_MAGIC = b"QZPAK\x00\x00\x01"
+HEADER_FORMAT = "<8sI"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+
+class AssetArchive:
+    def __init__(self, path):
+        """Memory-maps a packed asset archive; get() returns file contents without copying them."""
+        self.path = path
+        with open(path, "rb") as archive_file:
+            self.map = mmap.mmap(archive_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_length = struct.unpack_from(HEADER_FORMAT, self.map)
+        if magic != ARCHIVE_MAGIC:
+            self.map.close()
+            raise ValueError(f"{path} is not an asset archive")
+        self.entries = json.loads(self.map[HEADER_SIZE:HEADER_SIZE + index_length])
+        self.view = memoryview(self.map)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def names(self):
+        return self.entries.keys()
+
+    def get(self, name):
+        """Returns a read-only memoryview of an archived file, or None if it isn't in the archive."""
+        entry = self.entries.get(name)
+        if entry is None:
+            return None
+        offset, length, _ = entry
+        return self.view[offset:offset + length]
+
+    def verify(self, name):
+        """True if the stored contents still match the hash recorded when packing."""
+        return hashlib.sha1(self.get(name)).hexdigest() == self.entries[name][2]
+
+
+def write_archive(path, files):
+    """Packs files into an archive. `files` maps archive names to file paths on disk."""
+    contents = []
+    for name in sorted(files):
+        with open(files[name], "rb") as source_file:
+            contents.append((name, source_file.read()))
+
+    # The index size depends on the offsets and the offsets on the index size, so grow until stable
+    offset_base = 0
+    while True:
+        entries = {}
+        offset = HEADER_SIZE + offset_base
+        for name, data in contents:
+            entries[name] = [offset, len(data), hashlib.sha1(data).hexdigest()]
+            offset += len(data)
+        index = json.dumps(entries, separators=(",", ":")).encode()
+        if len(index) <= offset_base:
+            break
+        offset_base = len(index) + 64
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as archive_file:
+        archive_file.write(struct.pack(HEADER_FORMAT, ARCHIVE_MAGIC, offset_base))
+        archive_file.write(index.ljust(offset_base))
+        for _, data in contents:
+            archive_file.write(data)
+    os.replace(temp_path, path)
+    return entries
@@ -0,0 +1,445 @@
+import fnmatch
+import glob
+import io
+import json
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from settings import GAME_DIR
+from debug.perf_hud import track_surface_cache
+from .asset_archive import AssetArchive
+
+MANIFEST_PATH = os.path.join(GAME_DIR, "assets", "preload_manifest.json")
+FORMATS_PATH = os.path.join(GAME_DIR, "assets", "image_formats.json")
+BAKE_DIR = os.path.join(GAME_DIR, "build", "assets")
+BAKE_INDEX_PATH = os.path.join(BAKE_DIR, "index.json")
+ARCHIVE_PATH = os.path.join(GAME_DIR, "build", "assets.pak")
+LOOSE_ASSETS_ENV = "QUIZTASY_LOOSE_ASSETS"  # Set to 1 to ignore the archive while editing assets
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+LOADER_THREADS = 4
+
+# Display formats an image is converted to, picked per image by choose_format()
+FORMAT_OPAQUE = "opaque"  # convert(): no transparency, the fastest blit
+FORMAT_COLORKEY = "colorkey"  # convert() + RLE colorkey: every pixel fully transparent or fully opaque
+FORMAT_ALPHA = "alpha"  # convert_alpha(): partly transparent pixels, blended per pixel
+COLORKEY = (255, 0, 255)
+SLOWEST_REPORTED = 5
+
+
+def asset_key(path):
+    """Cache key of an asset path; equivalent paths (relative, with '..') share one entry."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def transform_key(scale=None, size=None, flip_x=False):
+    """Describes a fixed transform as a string, e.g. 'scale=2.5,flip_x'; empty for none."""
+    parts = []
+    if size is not None:
+        parts.append(f"size={size[0]}x{size[1]}")
+    elif scale is not None and scale != 1:
+        parts.append(f"scale={scale:g}")
+    if flip_x:
+        parts.append("flip_x")
+    return ",".join(parts)
+
+
+def image_key(path, transform=""):
+    """Cache key of an image with a transform (from transform_key()); an untransformed image is keyed by its path."""
+    key = asset_key(path)
+    return (key, transform) if transform else key
+
+
+def transform_image(image, scale=None, size=None, flip_x=False):
+    """Applies a fixed transform. The bake step uses the same function, so baked files match exactly."""
+    if size is not None:
+        image = pygame.transform.scale(image, tuple(size))
+    elif scale is not None and scale != 1:
+        image = pygame.transform.scale(image, (int(image.get_width() * scale), int(image.get_height() * scale)))
+    if flip_x:
+        image = pygame.transform.flip(image, True, False)
+    return image
+
+
+def scale_for_render(surface, scale):
+    """Scales a surface by the render scale, keeping its colorkey or alpha."""
+    size = (max(1, round(surface.get_width() * scale)), max(1, round(surface.get_height() * scale)))
+    if surface.get_colorkey() is not None or surface.get_bitsize() < 24:
+        return pygame.transform.scale(surface, size)  # Smoothing would blend the key color into the edges
+    return pygame.transform.smoothscale(surface, size)
+
+
+def choose_format(surface):
+    """Picks the cheapest display format that draws a decoded image exactly."""
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return FORMAT_COLORKEY if surface.get_colorkey() else FORMAT_OPAQUE
+    opaque = pygame.mask.from_surface(surface, 254).count()
+    if opaque == surface.get_width() * surface.get_height():
+        return FORMAT_OPAQUE
+    if pygame.mask.from_surface(surface, 0).count() == opaque:
+        return FORMAT_COLORKEY
+    return FORMAT_ALPHA
+
+
+def convert_colorkey(surface):
+    """Converts an image whose pixels are all fully transparent or fully opaque to an RLE colorkey surface.
+
+    Returns None if the image itself uses the key color.
+    """
+    if surface.get_colorkey() and not surface.get_flags() & pygame.SRCALPHA:
+        keyed = surface.convert()
+    else:
+        keyed = pygame.Surface(surface.get_size()).convert()
+        keyed.fill(COLORKEY)
+        keyed.blit(surface, (0, 0))
+        transparent = surface.get_width() * surface.get_height() - pygame.mask.from_surface(surface, 254).count()
+        if pygame.mask.from_threshold(keyed, COLORKEY, (1, 1, 1, 255)).count() != transparent:
+            return None
+        keyed.set_colorkey(COLORKEY)
+    keyed.set_colorkey(keyed.get_colorkey(), pygame.RLEACCEL)
+    return keyed
+
+
+def asset_name(path):
+    """Name of a file in the asset archive and bake index: its path relative to the game, '/' separated."""
+    return os.path.relpath(os.path.abspath(path), GAME_DIR).replace(os.sep, "/")
+
+
+def bake_entry_name(path, transform):
+    """Bake index key of a source image and transform."""
+    return f"{asset_name(path)}|{transform}"
+
+
+class AssetManager:
+    def __init__(self, manifest_path=MANIFEST_PATH):
+        """Loads images once and hands out the same display-format surface to every caller.
+
+        Callers must treat the surfaces as read-only: transform them into new surfaces instead of
+        drawing onto them.
+        """
+        self.manifest_path = manifest_path
+        self.manifest = None
+        self.format_overrides = None
+        self.images = {}
+        self.masks = weakref.WeakKeyDictionary()  # Surface -> hit-test mask, dropped with the surface
+        self.render_copy_factory = None  # Set by screens that draw copies of surfaces: scaled ones or textures
+        self.render_copies = weakref.WeakKeyDictionary()  # Surface -> what the screen draws for it, dropped with the surface
+        self.bake_index = None
+        self.bake_index_packed = False
+        self.archive = None
+        self.archive_checked = False
+        self.io_lock = threading.Lock()
+        self.io_seconds = 0.0
+        self.io_files = 0
+        self.io_bytes = 0
+        track_surface_cache(self)
+
+    def cached_surfaces(self):
+        """Loaded images, and the scaled copies drawn for them below full resolution (textures live in video memory)."""
+        copies = [copy for copy in list(self.render_copies.values()) if isinstance(copy, pygame.Surface)]
+        return list(self.images.values()) + copies
+
+    def get_manifest(self):
+        """Returns the preload manifest: group name -> list of files and folders relative to the game."""
+        if self.manifest is None:
+            with open(self.manifest_path) as manifest_file:
+                self.manifest = json.load(manifest_file)
+        return self.manifest
+
+    def get_archive(self):
+        """Returns the packed asset archive, or None to read loose files (no archive, or disabled)."""
+        if not self.archive_checked:
+            self.archive_checked = True
+            if not os.environ.get(LOOSE_ASSETS_ENV) and os.path.exists(ARCHIVE_PATH):
+                self.archive = AssetArchive(ARCHIVE_PATH)
+        return self.archive
+
+    def manifest_requests(self, group, **params):
+        """Expands a manifest group into (path, scale, size, flip_x) load requests, skipping missing entries.
+
+        An entry is a file or folder loaded as is, or {"source": file, folder or glob, "scale"/"size"/"flip_x"}
+        for images the game loads with that fixed transform, so the preload fills the cache entry that
+        load_image() will ask for. Sources may use {placeholders} filled from params, e.g. hero="girl".
+        """
+        requests = []
+        for entry in self.get_manifest().get(group, []):
+            if isinstance(entry, str):
+                entry = {"source": entry}
+            for path in self.entry_paths(entry["source"].format(**params)):
+                requests.append((path, entry.get("scale"), entry.get("size"), entry.get("flip_x", False)))
+        return requests
+
+    def manifest_paths(self, group, **params):
+        """The image files a manifest group names."""
+        return [request[0] for request in self.manifest_requests(group, **params)]
+
+    def entry_paths(self, entry):
+        """Expands a file, folder or glob relative to the game into the image files it names."""
+        archive = self.get_archive()
+        if any(char in entry for char in "*?["):
+            if archive is not None:
+                # fnmatch's * also matches '/', so only names as deep as the pattern are compared
+                names = sorted(name for name in archive.names()
+                               if name.count("/") == entry.count("/") and fnmatch.fnmatch(name, entry))
+                paths = [os.path.join(GAME_DIR, name) for name in names]
+            else:
+                paths = sorted(glob.glob(os.path.join(GAME_DIR, entry)))
+            if not paths:
+                print(f"Preload manifest: nothing matches {entry}")
+            return paths
+        path = os.path.join(GAME_DIR, entry)
+        if archive is not None:
+            # List folders from the archive index instead of walking the disk
+            if entry in archive:
+                return [path]
+            names = sorted(name for name in archive.names()
+                           if name.startswith(entry + "/") and name.lower().endswith(IMAGE_EXTENSIONS))
+            if names:
+                return [os.path.join(GAME_DIR, name) for name in names]
+        if os.path.isdir(path):
+            paths = []
+            for folder, _, files in sorted(os.walk(path)):
+                paths.extend(os.path.join(folder, name) for name in sorted(files) if name.lower().endswith(IMAGE_EXTENSIONS))
+            return paths
+        if os.path.isfile(path):
+            return [path]
+        print(f"Preload manifest: {entry} not found")
+        return []
+
+    def read_bytes(self, path):
+        """Returns a file's contents: a slice of the archive when packed, else read from the loose file."""
+        start = time.perf_counter()
+        archive = self.get_archive()
+        data = archive.get(asset_name(path)) if archive is not None else None
+        if data is None:
+            with open(path, "rb") as asset_file:
+                data = asset_file.read()
+        with self.io_lock:
+            self.io_seconds += time.perf_counter() - start
+            self.io_files += 1
+            self.io_bytes += len(data)
+        return data
+
+    def io_report(self):
+        source = "asset archive" if self.archive is not None else "loose files"
+        return f"{self.io_files} files, {self.io_bytes / 1e6:.1f} MB read from {source} in {self.io_seconds * 1000:.1f} ms"
+
+    def decode(self, path, data):
+        """Decodes image bytes; safe to call from a loader thread."""
+        return pygame.image.load(io.BytesIO(data), os.path.basename(path))
+
+    def image_format(self, path, surface):
+        """The display format of an image: its entry in image_formats.json, else what choose_format() picks.
+
+        The overrides cover images that are drawn opaque but were exported with a few stray
+        translucent pixels, such as the battle backgrounds' right edge.
+        """
+        if self.format_overrides is None:
+            with open(FORMATS_PATH) as formats_file:
+                self.format_overrides = json.load(formats_file)
+        name = asset_name(path)
+        for pattern, image_format in self.format_overrides.items():
+            if fnmatch.fnmatch(name, pattern):
+                return image_format
+        return choose_format(surface)
+
+    def finish(self, path, surface):
+        """Converts a decoded image to its display format; must run on the main thread."""
+        image_format = self.image_format(path, surface)
+        if image_format == FORMAT_OPAQUE:
+            return surface.convert()
+        if image_format == FORMAT_COLORKEY:
+            keyed = convert_colorkey(surface)
+            if keyed is not None:
+                return keyed
+        return surface.convert_alpha()
+
+    def load_image(self, path, scale=None, size=None, flip_x=False):
+        """Returns the cached surface of an image file, loading it now if it wasn't preloaded.
+
+        A scale, size or horizontal flip is served from the bake cache when `python -m tools.bake_assets`
+        has baked it for the current source file, and applied at load time otherwise.
+        """
+        cache_key = image_key(path, transform_key(scale, size, flip_x))
+        image = self.images.get(cache_key)
+        if image is None:
+            image = self.finish(path, self.decode_variant(path, scale, size, flip_x))
+            self.images[cache_key] = image
+        return self.prepare(image)
+
+    def decode_variant(self, path, scale=None, size=None, flip_x=False):
+        """Decodes an image with its fixed transform applied: the baked file if it is current, else the
+        transformed source. Safe to call from a loader thread once the bake index is loaded."""
+        transform = transform_key(scale, size, flip_x)
+        if not transform:
+            return self.decode(path, self.read_bytes(path))
+        baked_path = self.baked_path(path, transform)
+        if baked_path is not None:
+            return self.decode(baked_path, self.read_bytes(baked_path))
+        # Transform the decoded source, so the format is picked for the final pixels
+        return transform_image(self.decode(path, self.read_bytes(path)), scale, size, flip_x)
+
+    def get_mask(self, surface):
+        """Returns the hit-test mask of a surface, built on first request and shared by every caller."""
+        mask = self.masks.get(surface)
+        if mask is None:
+            mask = pygame.mask.from_surface(surface)
+            self.masks[surface] = mask
+        return mask
+
+    def set_render_copy_factory(self, factory):
+        """Sets how the screen copies surfaces it draws (None to draw them as they are), dropping old copies."""
+        self.render_copy_factory = factory
+        self.render_copies = weakref.WeakKeyDictionary()
+
+    def get_render_copy(self, surface):
+        """Returns the screen's copy of a surface (scaled to the render resolution, or uploaded as a
+        texture), making it on first request.
+
+        Images are copied when they are loaded; other surfaces the first time they are drawn.
+        """
+        copy = self.render_copies.get(surface)
+        if copy is None:
+            copy = self.render_copy_factory(surface)
+            self.render_copies[surface] = copy
+        return copy
+
+    def prepare(self, surface):
+        """Makes a surface's render copy now, if the screen draws copies, so its first frame doesn't pay
+        for it. load_image() does this for images; scenes call it for surfaces they build while
+        loading, like a scaled map. Returns the surface."""
+        if self.render_copy_factory is not None:
+            self.get_render_copy(surface)
+        return surface
+
+    def surface_changed(self, surface):
+        """Drops the render copy of a surface that was redrawn in place, like an HP bar."""
+        self.render_copies.pop(surface, None)
+
+    def baked_path(self, path, transform):
+        """The baked file of an image and transform, or None if it isn't baked or its source changed since."""
+        if self.bake_index is None:
+            self.load_bake_index()
+        entry = self.bake_index.get(bake_entry_name(path, transform))
+        if entry is None:
+            return None
+        if not self.bake_index_packed:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+            if stat.st_size != entry["source_size"] or stat.st_mtime_ns != entry["source_mtime_ns"]:
+                return None  # The source was edited after baking
+        return os.path.join(BAKE_DIR, entry["file"])
+
+    def load_bake_index(self):
+        """Reads the bake index from the archive if packed, else from the build folder.
+
+        The pack step only keeps bake entries that were current when packing, so packed entries
+        are used without checking the sources again.
+        """
+        self.bake_index = {}
+        archive = self.get_archive()
+        packed = archive.get(asset_name(BAKE_INDEX_PATH)) if archive is not None else None
+        if packed is not None:
+            self.bake_index = json.loads(bytes(packed))["entries"]
+            self.bake_index_packed = True
+        elif os.path.exists(BAKE_INDEX_PATH):
+            with open(BAKE_INDEX_PATH) as index_file:
+                self.bake_index = json.load(index_file)["entries"]
+
+    def is_loaded(self, path, transform=""):
+        return image_key(path, transform) in self.images
+
+    def preload(self, group, **params):
+        """Starts loading a manifest group in the background. Returns its AssetLoader."""
+        requests = [request for request in self.manifest_requests(group, **params)
+                    if not self.is_loaded(request[0], transform_key(*request[1:]))]
+        if self.bake_index is None:
+            self.load_bake_index()  # Read once here, so the loader threads only look baked files up
+        return AssetLoader(self, group, requests)
+
+    def release(self, paths):
+        """Drops cached images and their transformed variants, e.g. the assets of a scene that was disposed."""
+        keys = {asset_key(path) for path in paths}
+        for cache_key in list(self.images):
+            if (cache_key[0] if isinstance(cache_key, tuple) else cache_key) in keys:
+                del self.images[cache_key]
+
+
+class AssetLoader:
+    def __init__(self, manager, name, requests, threads=LOADER_THREADS):
+        """Reads and decodes (path, scale, size, flip_x) requests on a thread pool, transformed or baked like
+        load_image() would; step() converts finished ones on the main thread."""
+        self.manager = manager
+        self.name = name
+        self.total = len(requests)
+        self.done = 0
+        self.timings = []  # (read + decode seconds, path)
+        self.errors = []
+        self.start_time = time.perf_counter()
+        self.elapsed = 0.0
+        self.pending = []
+        if requests:
+            self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="asset-loader")
+            self.pending = [(request, self.executor.submit(self.read_and_decode, request)) for request in requests]
+        else:
+            self.executor = None
+
+    def read_and_decode(self, request):
+        start = time.perf_counter()
+        surface = self.manager.decode_variant(*request)
+        return surface, time.perf_counter() - start
+
+    @property
+    def finished(self):
+        return self.done >= self.total
+
+    @property
+    def progress(self):
+        """Fraction of the group loaded, 0.0 to 1.0."""
+        return self.done / self.total if self.total else 1.0
+
+    def step(self, budget_ms=4.0):
+        """Converts decoded images in submission order until the time budget is used up.
+
+        Returns True once every asset of the group is loaded.
+        """
+        deadline = time.perf_counter() + budget_ms / 1000
+        while self.pending and self.pending[0][1].done():
+            request, future = self.pending.pop(0)
+            path = request[0]
+            try:
+                surface, seconds = future.result()
+                self.manager.images[image_key(path, transform_key(*request[1:]))] = self.manager.finish(path, surface)
+                self.timings.append((seconds, path))
+            except (pygame.error, OSError) as e:
+                # The scene's own load will raise the error again if it really needs the file
+                self.errors.append((path, str(e)))
+            self.done += 1
+            if time.perf_counter() >= deadline:
+                break
+        if self.finished and self.executor:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+            self.elapsed = time.perf_counter() - self.start_time
+        return self.finished
+
+    def wait(self):
+        """Loads the rest of the group right away (no loading screen)."""
+        while not self.step(budget_ms=1000):
+            time.sleep(0.001)
+
+    def report(self):
+        """Prints the total load time and the slowest assets."""
+        print(f"Loaded {self.done} assets for '{self.name}' in {self.elapsed * 1000:.0f} ms")
+        for seconds, path in sorted(self.timings, reverse=True)[:SLOWEST_REPORTED]:
+            print(f"  {seconds * 1000:7.1f} ms  {os.path.relpath(path, GAME_DIR)}")
+        for path, error in self.errors:
+            print(f"  failed: {os.path.relpath(path, GAME_DIR)} ({error})")
+        print(f"  asset I/O so far: {self.manager.io_report()}")
+
+
+asset_manager = AssetManager()
@@ -0,0 +1,180 @@
+import pygame
+
+# Named actions scenes react to instead of raw keys and buttons
+ACTION_MOVE_LEFT = "move_left"
+ACTION_MOVE_RIGHT = "move_right"
+ACTION_MOVE_UP = "move_up"
+ACTION_MOVE_DOWN = "move_down"
+ACTION_CONFIRM = "confirm"
+ACTION_PAUSE = "pause"
+ACTION_ANSWERS = ("answer_1", "answer_2", "answer_3", "answer_4")
+
+# Event types the game reads; everything else is dropped by SDL before it reaches the queue
+USED_EVENTS = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYHATMOTION,
+    pygame.JOYDEVICEADDED,
+    pygame.JOYDEVICEREMOVED,
+]
+
+KEY_BINDINGS = {
+    pygame.K_LEFT: (ACTION_MOVE_LEFT,),
+    pygame.K_a: (ACTION_MOVE_LEFT,),
+    pygame.K_RIGHT: (ACTION_MOVE_RIGHT,),
+    pygame.K_d: (ACTION_MOVE_RIGHT,),
+    pygame.K_UP: (ACTION_MOVE_UP,),
+    pygame.K_w: (ACTION_MOVE_UP,),
+    pygame.K_DOWN: (ACTION_MOVE_DOWN,),
+    pygame.K_s: (ACTION_MOVE_DOWN,),
+    pygame.K_RETURN: (ACTION_CONFIRM,),
+    pygame.K_KP_ENTER: (ACTION_CONFIRM,),
+    pygame.K_SPACE: (ACTION_CONFIRM,),
+    pygame.K_ESCAPE: (ACTION_PAUSE,),
+    pygame.K_p: (ACTION_PAUSE,),
+    pygame.K_1: (ACTION_ANSWERS[0],),
+    pygame.K_2: (ACTION_ANSWERS[1],),
+    pygame.K_3: (ACTION_ANSWERS[2],),
+    pygame.K_4: (ACTION_ANSWERS[3],),
+    pygame.K_KP1: (ACTION_ANSWERS[0],),
+    pygame.K_KP2: (ACTION_ANSWERS[1],),
+    pygame.K_KP3: (ACTION_ANSWERS[2],),
+    pygame.K_KP4: (ACTION_ANSWERS[3],),
+}
+
+# Gamepad buttons in SDL's XInput layout: A, B, X, Y answer 1-4, A also confirms, Start pauses
+GAMEPAD_BINDINGS = {
+    0: (ACTION_ANSWERS[0], ACTION_CONFIRM),
+    1: (ACTION_ANSWERS[1],),
+    2: (ACTION_ANSWERS[2],),
+    3: (ACTION_ANSWERS[3],),
+    7: (ACTION_PAUSE,),
+}
+STICK_DEADZONE = 0.5
+POINTER_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+# Held movement: keys, then d-pad direction, then left stick (axis, sign)
+MOVE_KEYS = {action: [key for key, actions in KEY_BINDINGS.items() if action in actions]
+             for action in (ACTION_MOVE_LEFT, ACTION_MOVE_RIGHT, ACTION_MOVE_UP, ACTION_MOVE_DOWN)}
+MOVE_HAT = {ACTION_MOVE_LEFT: (0, -1), ACTION_MOVE_RIGHT: (0, 1), ACTION_MOVE_UP: (1, 1), ACTION_MOVE_DOWN: (1, -1)}
+MOVE_STICK = {ACTION_MOVE_LEFT: (0, -1), ACTION_MOVE_RIGHT: (0, 1), ACTION_MOVE_UP: (1, -1), ACTION_MOVE_DOWN: (1, 1)}
+
+
+class InputManager:
+    def __init__(self):
+        """Reads input once per frame for every scene.
+
+        poll() replaces pygame.event.get() in the game loops: it returns the frame's events with
+        bursts of mouse motion merged into one, and records the named actions they triggered.
+        """
+        self.allowed = list(USED_EVENTS)
+        self.mouse_pos = (0, 0)
+        self.pointer_scale = 1  # Layout pixels per display pixel
+        self.quit_on_window_close = False  # Set when the game window isn't SDL's only window
+        self.event_actions = {}  # id(event) -> actions of the events polled this frame
+        self.frame_actions = set()
+        self.joysticks = {}
+
+    def install(self):
+        """Restricts SDL's queue to the event types the game uses. Call after pygame.init()."""
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.allowed)
+
+    def allow(self, *event_types):
+        """Lets more event types through, e.g. a scene's own USEREVENT timers."""
+        self.allowed.extend(event_types)
+        if pygame.display.get_init():
+            pygame.event.set_allowed(list(event_types))
+
+    def set_pointer_scale(self, scale):
+        """Scales pointer positions from display pixels to layout pixels, when rendering below full size."""
+        self.pointer_scale = scale
+
+    def poll(self):
+        """Returns this frame's events, motion coalesced, and records the actions they trigger."""
+        events = coalesce_motion(pygame.event.get())
+        if self.quit_on_window_close:
+            events = [pygame.event.Event(pygame.QUIT) if event.type == pygame.WINDOWCLOSE else event for event in events]
+        self.mouse_pos = pygame.mouse.get_pos()
+        if self.pointer_scale != 1:
+            self.scale_pointer(events)
+        self.event_actions = {}
+        self.frame_actions = set()
+        for event in events:
+            if event.type == pygame.JOYDEVICEADDED:
+                joystick = pygame.joystick.Joystick(event.device_index)
+                self.joysticks[joystick.get_instance_id()] = joystick
+            elif event.type == pygame.JOYDEVICEREMOVED:
+                self.joysticks.pop(event.instance_id, None)
+            actions = event_actions(event)
+            if actions:
+                self.event_actions[id(event)] = actions
+                self.frame_actions.update(actions)
+        return events
+
+    def scale_pointer(self, events):
+        """Maps the frame's pointer positions to layout coordinates, so every hit-test works unchanged."""
+        scale = self.pointer_scale
+        self.mouse_pos = (int(self.mouse_pos[0] * scale), int(self.mouse_pos[1] * scale))
+        for event in events:
+            if event.type in POINTER_EVENTS:
+                event.pos = (int(event.pos[0] * scale), int(event.pos[1] * scale))
+                if event.type == pygame.MOUSEMOTION:
+                    event.rel = (int(event.rel[0] * scale), int(event.rel[1] * scale))
+
+    def actions(self, event):
+        """The named actions an event polled this frame triggered (empty for most events)."""
+        return self.event_actions.get(id(event), ())
+
+    def pressed(self, action):
+        """True if the action was triggered during the last poll."""
+        return action in self.frame_actions
+
+    def held(self, action):
+        """True while a movement action's key, d-pad direction or stick direction is held."""
+        keys = pygame.key.get_pressed()
+        if any(keys[key] for key in MOVE_KEYS.get(action, ())):
+            return True
+        for joystick in self.joysticks.values():
+            if action in MOVE_HAT and joystick.get_numhats():
+                axis, sign = MOVE_HAT[action]
+                if joystick.get_hat(0)[axis] == sign:
+                    return True
+            if action in MOVE_STICK and joystick.get_numaxes() >= 2:
+                axis, sign = MOVE_STICK[action]
+                if joystick.get_axis(axis) * sign > STICK_DEADZONE:
+                    return True
+        return False
+
+
+def event_actions(event):
+    """Maps a key press, gamepad button or d-pad press to its named actions."""
+    if event.type == pygame.KEYDOWN:
+        return KEY_BINDINGS.get(event.key, ())
+    if event.type == pygame.JOYBUTTONDOWN:
+        return GAMEPAD_BINDINGS.get(event.button, ())
+    if event.type == pygame.JOYHATMOTION:
+        return tuple(action for action, (axis, sign) in MOVE_HAT.items() if event.value[axis] == sign)
+    return ()
+
+
+def coalesce_motion(events):
+    """Merges every MOUSEMOTION of a frame into one at the position of the last, summing the movement.
+
+    Mice polling at 1000 Hz queue many motion events per frame; scenes only need where the pointer ended up.
+    """
+    motions = [event for event in events if event.type == pygame.MOUSEMOTION]
+    if len(motions) < 2:
+        return events
+    last = motions[-1]
+    rel = (sum(event.rel[0] for event in motions), sum(event.rel[1] for event in motions))
+    merged = pygame.event.Event(pygame.MOUSEMOTION, pos=last.pos, rel=rel, buttons=last.buttons)
+    return [merged if event is last else event for event in events if event.type != pygame.MOUSEMOTION or event is last]
+
+
+input_manager = InputManager()
@@ -0,0 +1,72 @@
+import sqlite3
+import os
+
+DEFAULT_PROFILE = "default"
+
+# The same expression is a separate review item at each difficulty it's asked at
+REVIEW_ITEMS_TABLE = """CREATE TABLE IF NOT EXISTS {name} (
+    profile TEXT NOT NULL,
+    item_key TEXT NOT NULL,
+    difficulty INTEGER NOT NULL,
+    interval REAL NOT NULL,
+    ease REAL NOT NULL,
+    reps INTEGER NOT NULL,
+    due REAL NOT NULL,
+    PRIMARY KEY (profile, item_key, difficulty)
+)"""
+
+
+class SaveManager:
+    def __init__(self, db_path):
+        """Open (or create) the save database used for per-profile progress."""
+        self.db_path = db_path
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.connection = sqlite3.connect(db_path)
+        # Each answer writes one row, so favour cheap commits over full fsyncs
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.create_tables()
+
+    def create_tables(self):
+        """Create the save tables if they don't exist yet."""
+        self.connection.execute(REVIEW_ITEMS_TABLE.format(name="review_items"))
+        self.connection.commit()
+        self.upgrade_review_items()
+
+    def upgrade_review_items(self):
+        """Rebuilds a review_items table from saves where an item was keyed without its difficulty."""
+        key_columns = [row[1] for row in self.connection.execute("PRAGMA table_info(review_items)") if row[5]]
+        if "difficulty" in key_columns:
+            return
+        with self.connection:
+            self.connection.execute(REVIEW_ITEMS_TABLE.format(name="review_items_upgrade"))
+            self.connection.execute("INSERT INTO review_items_upgrade SELECT * FROM review_items")
+            self.connection.execute("DROP TABLE review_items")
+            self.connection.execute("ALTER TABLE review_items_upgrade RENAME TO review_items")
+
+    def load_review_items(self, profile):
+        """Returns every saved review item of a profile as tuples."""
+        cursor = self.connection.execute(
+            "SELECT item_key, difficulty, interval, ease, reps, due FROM review_items WHERE profile = ?",
+            (profile,)
+        )
+        return cursor.fetchall()
+
+    def save_review_item(self, profile, item):
+        """Writes a single review item, so progress is saved one answer at a time."""
+        self.connection.execute(
+            """INSERT INTO review_items (profile, item_key, difficulty, interval, ease, reps, due)
+               VALUES (?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(profile, item_key, difficulty) DO UPDATE SET
+                   interval = excluded.interval,
+                   ease = excluded.ease,
+                   reps = excluded.reps,
+                   due = excluded.due""",
+            (profile, item.key, item.difficulty, item.interval, item.ease, item.reps, item.due)
+        )
+        self.connection.commit()
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
@@ -5,9 +5,20 @@ from ui.back_button import BackButton
 from .map_character_movement import MapCharacterMovement
 from ui.button import Button
 from gameplay.levels import Levels
+from debug.frame_timing import frame_timer, PHASE_EVENTS, PHASE_UPDATE, PHASE_DRAW, PHASE_PRESENT
+from debug.hotkeys import handle_debug_hotkey
+from debug.perf_hud import perf_hud
+from debug.tracing import traced
+from managers.asset_manager import asset_manager
+from managers.input_manager import input_manager, ACTION_CONFIRM
+from ui.scene import Scene
 
+# A battle loads its randomly picked enemy on demand, so the "battle" preload group leaves enemies out
+ENEMY_IMAGES = "assets/images/battle/enemy"
 
-class Map:
+
+class Map(Scene):
+    @traced()
     def __init__(self, screen, script_dir, go_back_callback, audio_manager, hero_type=None, game_instance=None):
         """Initialize the LSPU map with a Back button and navigation features."""
         self.script_dir = script_dir
@@ -22,16 +33,12 @@ class Map:
         # Store the game instance
         self.game_instance = game_instance
 
-        # Play hero-specific OST if audio is enabled
-        if self.audio_manager.audio_enabled:
-            self.audio_manager.play_music()
-
         # Load and scale the map
-        self.map_original = pygame.image.load(os.path.join(script_dir, "assets", "images", "map", "lspu_map.png"))
+        self.map_original = asset_manager.load_image(os.path.join(script_dir, "assets", "images", "map", "lspu_map.png"))
         SCALE_FACTOR = 3
         self.map_width = int(self.map_original.get_width() * SCALE_FACTOR)
         self.map_height = int(self.map_original.get_height() * SCALE_FACTOR)
-        self.map = pygame.transform.scale(self.map_original, (self.map_width, self.map_height))
+        self.map = asset_manager.prepare(pygame.transform.scale(self.map_original, (self.map_width, self.map_height)))
 
         # Initial map position - center the map
         self.map_x = (SCREEN_WIDTH - self.map_width) // 2
@@ -63,6 +70,7 @@ class Map:
 
         # Initialize clock for the run method
         self.clock = pygame.time.Clock()
+        self.dt = 0  # Seconds since the previous frame
 
         # Set the character to spawn at level 0
         self.spawn_at_level(0)
@@ -94,7 +102,32 @@ class Map:
         idle_img = os.path.join(self.script_dir, "assets", "images", "buttons", "enter level", "enter_btn_img.png")
         hover_img = os.path.join(self.script_dir, "assets", "images", "buttons", "enter level", "enter_btn_hover.png")
         # Create button - now using the levels_manager's enter_level method
-        self.enter_button = Button(x=x, y=y, idle_img=idle_img, hover_img=hover_img, action=self.levels_manager.enter_level, scale=0.5, audio_manager=self.audio_manager)
+        self.enter_button = Button(x=x, y=y, idle_img=idle_img, hover_img=hover_img, action=self.levels_manager.enter_level, scale=0.5, audio_manager=self.audio_manager,
+                                   hit_mask=True)
+
+    def enter(self):
+        """Starts the map loop and the hero-specific OST if audio is enabled."""
+        self.running = True
+        if self.audio_manager.audio_enabled:
+            self.audio_manager.play_music()
+
+    def exit(self):
+        self.running = False
+
+    def dispose(self):
+        """Frees the scaled map and drops the map and battle images, and the enemy that was fought, from the asset cache."""
+        self.map = None
+        self.map_original = None
+        self.character_movement = None
+        self.levels_manager.dispose()
+        self.levels_manager = None
+        self.back_button = None
+        self.enter_button = None
+        self.go_back_callback = None
+        self.game_instance = None
+        asset_manager.release(asset_manager.manifest_paths("map", hero=self.hero_type) +
+                              asset_manager.manifest_paths("battle", hero=self.hero_type) +
+                              asset_manager.entry_paths(ENEMY_IMAGES))
 
     def go_back(self):
         if self.audio_manager:
@@ -173,33 +206,43 @@ class Map:
 
     def handle_events(self):
         """Handle map interactions and level selection."""
-        for event in pygame.event.get():
+        for event in input_manager.poll():
             if event.type == pygame.QUIT:
                 self.running = False
+            handle_debug_hotkey(event)
 
             # Handle back button
             self.back_button.update(event)
 
-            # Handle enter button if it exists and is visible
+            # Handle enter button if it exists and is visible; confirm enters the level too
             if self.enter_button and self.enter_button.visible:
                 self.enter_button.update(event)
+                if ACTION_CONFIRM in input_manager.actions(event):
+                    self.enter_button.action()
 
     def update_character_animation(self):
         """Update character animation frames"""
-        self.character_movement.update_animation()
+        self.character_movement.update_animation(self.dt)
 
     def run(self):
         """Main map loop."""
         while self.running:
+            frame_timer.begin_frame("map")
             # Handle events
             self.handle_events()
+            frame_timer.mark(PHASE_EVENTS)
             # Handle character movement - this should be called every frame
             self.move_character()
             # Update animation
             self.update_character_animation()
+            frame_timer.mark(PHASE_UPDATE)
             # Draw everything
             self.draw()
+            perf_hud.draw(self.screen)
+            frame_timer.mark(PHASE_DRAW)
             # Update display
-            pygame.display.flip()
+            self.screen.present()
+            frame_timer.mark(PHASE_PRESENT)
+            frame_timer.end_frame()
             # Cap the frame rate
-            self.clock.tick(FPS)
\ No newline at end of file
+            self.dt = self.clock.tick(FPS) / 1000
\ No newline at end of file
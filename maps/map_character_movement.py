@@ -1,6 +1,6 @@
-import pygame
-import sys
 import os
+from managers.animation_manager import animation_manager, Animator, STATE_STAND, STATE_WALK, DIR_FRONT, DIR_BACK, DIR_LEFT, DIR_RIGHT
+from managers.input_manager import input_manager, ACTION_MOVE_LEFT, ACTION_MOVE_RIGHT, ACTION_MOVE_UP, ACTION_MOVE_DOWN
 
 class MapCharacterMovement:
     def __init__(self, hero_type, script_dir, initial_x, initial_y):
@@ -13,144 +13,45 @@ class MapCharacterMovement:
         self.character_y = initial_y
         self.character_speed = 50 # 5 normal
 
-        # Animation properties
-        self.direction = "front"  # Default direction is front
+        # Animation state, driven by the "map_hero" entry of assets/animations.json
+        self.direction = DIR_FRONT
         self.is_walking = False
-        self.animation_frame = 0
-        self.animation_cooldown = 100  # Milliseconds between animation frames
-        self.last_animation_update = pygame.time.get_ticks()
-
-        # Load character animations
-        self.load_character_animations()
-
-    def load_character_animations(self):
-        """Load all character animation frames based on hero_type."""
-        base_path = os.path.join(self.script_dir, "..", "assets", "images", "map", "animation", self.hero_type)
-
-        # Initialize animation dictionaries
-        self.animations = {
-            "back": {"stand": None, "walk_left": None, "walk_right": None},
-            "front": {"stand": None, "walk_left": None, "walk_right": None},
-            "left": {"stand": None, "walk": None},
-            "right": {"stand": None, "walk": None}
-        }
-
-        # Load back animations
-        self.animations["back"]["stand"] = pygame.image.load(
-            os.path.join(base_path, "back and walk", f"{self.hero_type}_back_stand.png")
-        ).convert_alpha()
-        self.animations["back"]["walk_left"] = pygame.image.load(
-            os.path.join(base_path, "back and walk", f"{self.hero_type}_back_walkl.png")
-        ).convert_alpha()
-        self.animations["back"]["walk_right"] = pygame.image.load(
-            os.path.join(base_path, "back and walk", f"{self.hero_type}_back_walkr.png")
-        ).convert_alpha()
-
-        # Load front animations
-        self.animations["front"]["stand"] = pygame.image.load(
-            os.path.join(base_path, "front and walk", f"{self.hero_type}_front_stand.png")
-        ).convert_alpha()
-        self.animations["front"]["walk_left"] = pygame.image.load(
-            os.path.join(base_path, "front and walk", f"{self.hero_type}_front_walkl.png")
-        ).convert_alpha()
-        self.animations["front"]["walk_right"] = pygame.image.load(
-            os.path.join(base_path, "front and walk", f"{self.hero_type}_front_walkr.png")
-        ).convert_alpha()
-
-        # Load sideway animations
-        self.animations["left"]["stand"] = pygame.image.load(
-            os.path.join(base_path, "sideway and walk", f"{self.hero_type}_left_stand.png")
-        ).convert_alpha()
-        self.animations["left"]["walk"] = pygame.image.load(
-            os.path.join(base_path, "sideway and walk", f"{self.hero_type}_left_walk.png")
-        ).convert_alpha()
-
-        self.animations["right"]["stand"] = pygame.image.load(
-            os.path.join(base_path, "sideway and walk", f"{self.hero_type}_right_stand.png")
-        ).convert_alpha()
-        self.animations["right"]["walk"] = pygame.image.load(
-            os.path.join(base_path, "sideway and walk", f"{self.hero_type}_right_walk.png")
-        ).convert_alpha()
-
-        # Scale all animations to an appropriate size
-        scale_factor = 3.0  # Adjust as needed
-        for direction in self.animations:
-            for animation_type in self.animations[direction]:
-                img = self.animations[direction][animation_type]
-                scaled_width = int(img.get_width() * scale_factor)
-                scaled_height = int(img.get_height() * scale_factor)
-                self.animations[direction][animation_type] = pygame.transform.scale(
-                    img, (scaled_width, scaled_height)
-                )
-
-    def update_animation(self):
-        """Update character animation frame based on movement and direction."""
-        # Check if it's time to update the animation
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_animation_update >= self.animation_cooldown:
-            self.last_animation_update = current_time
-            if self.is_walking:
-                self.animation_frame = (self.animation_frame + 1) % 2  # Toggle between 0 and 1
-            else:
-                self.animation_frame = 0  # Reset to standing frame
+        self.animator = Animator(animation_manager.load("map_hero", hero=hero_type), STATE_STAND, self.direction)
+
+    def update_animation(self, dt):
+        """Advance the character animation by dt seconds."""
+        self.animator.update(dt)
 
     def get_current_frame(self):
-        """Get the current animation frame based on direction and movement state."""
-        if not self.is_walking:
-            # Return standing frame
-            if self.direction == "left":
-                return self.animations["left"]["stand"]
-            elif self.direction == "right":
-                return self.animations["right"]["stand"]
-            elif self.direction == "back":
-                return self.animations["back"]["stand"]
-            else:  # front
-                return self.animations["front"]["stand"]
-        else:
-            # Return walking frame
-            if self.direction == "left":
-                return self.animations["left"]["walk"] if self.animation_frame == 1 else self.animations["left"][
-                    "stand"]
-            elif self.direction == "right":
-                return self.animations["right"]["walk"] if self.animation_frame == 1 else self.animations["right"][
-                    "stand"]
-            elif self.direction == "back":
-                frame = "walk_left" if self.animation_frame == 0 else "walk_right"
-                return self.animations["back"][frame]
-            else:  # front
-                frame = "walk_left" if self.animation_frame == 0 else "walk_right"
-                return self.animations["front"][frame]
+        """Get the current animation frame."""
+        return self.animator.image
 
     def handle_movement(self, map_bounds, map_pos, screen_size):
         # Unpack parameters
         map_x, map_y = map_pos
         screen_width, screen_height = screen_size
 
-        # Get keyboard state
-        keys = pygame.key.get_pressed()
-
         dx = 0
         dy = 0
-        was_walking = self.is_walking
         self.is_walking = False
 
-        # Check arrow keys
-        if keys[pygame.K_LEFT]:
+        # Check the movement actions (arrow keys, WASD, d-pad or left stick)
+        if input_manager.held(ACTION_MOVE_LEFT):
             dx = -self.character_speed
-            self.direction = "left"
+            self.direction = DIR_LEFT
             self.is_walking = True
-        elif keys[pygame.K_RIGHT]:
+        elif input_manager.held(ACTION_MOVE_RIGHT):
             dx = self.character_speed
-            self.direction = "right"
+            self.direction = DIR_RIGHT
             self.is_walking = True
 
-        if keys[pygame.K_UP]:
+        if input_manager.held(ACTION_MOVE_UP):
             dy = -self.character_speed
-            self.direction = "back"
+            self.direction = DIR_BACK
             self.is_walking = True
-        elif keys[pygame.K_DOWN]:
+        elif input_manager.held(ACTION_MOVE_DOWN):
             dy = self.character_speed
-            self.direction = "front"
+            self.direction = DIR_FRONT
             self.is_walking = True
 
         # Only process if movement keys are pressed
@@ -312,20 +213,19 @@ class MapCharacterMovement:
             self.character_x = max(char_width // 2, min(self.character_x, screen_width - char_width // 2))
             self.character_y = max(char_height // 2, min(self.character_y, screen_height - char_height // 2))
 
-        # Update animation state if movement state changed
-        if was_walking != self.is_walking:
-            self.animation_frame = 0
-            self.last_animation_update = pygame.time.get_ticks()
+        # Switch clip; starting or stopping a walk restarts the animation
+        self.animator.play(STATE_WALK if self.is_walking else STATE_STAND, self.direction)
 
         return (map_x, map_y), (self.character_x, self.character_y)
 
     def draw(self, screen):
         # Get current character frame
         character_image = self.get_current_frame()
+        offset_x, offset_y = self.animator.offset
 
         # Calculate character position (centered at character_x, character_y)
-        char_x = self.character_x - character_image.get_width() // 2
-        char_y = self.character_y - character_image.get_height() // 2
+        char_x = self.character_x - character_image.get_width() // 2 + offset_x
+        char_y = self.character_y - character_image.get_height() // 2 + offset_y
 
         # Draw character
         screen.blit(character_image, (char_x, char_y))
\ No newline at end of file
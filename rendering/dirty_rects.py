@@ -0,0 +1,80 @@
+import pygame
+
+# Above this share of the screen a single full redraw is cheaper than many clipped ones
+FULL_REDRAW_RATIO = 0.5
+
+
+class DirtyRectCompositor:
+    def __init__(self, screen, enabled=True):
+        """Redraws and presents only the parts of the screen that changed since the last frame."""
+        self.screen = screen
+        self.enabled = enabled and screen.partial_updates  # Renderers that present whole frames redraw in full
+        self.screen_rect = screen.get_rect()
+        self.dirty_rects = []
+        self.full_redraw = True  # The first frame is always drawn in full
+        self.widget_states = {}  # name -> (state, rect) from the previous frame
+        self.presented_rects = None  # Areas drawn by the last render(), None for the full screen
+
+    def invalidate(self):
+        """Forces a full redraw on the next frame (used for transitions and overlays)."""
+        self.full_redraw = True
+
+    def mark(self, rect):
+        """Marks a screen area as changed."""
+        if rect:
+            self.dirty_rects.append(pygame.Rect(rect))
+
+    def track(self, name, state, rect):
+        """Marks a widget's old and new areas as changed whenever its state is different from last frame."""
+        previous = self.widget_states.get(name)
+        if previous is not None and previous[0] == state:
+            return
+        if previous is not None:
+            self.mark(previous[1])
+        self.mark(rect)
+        self.widget_states[name] = (state, pygame.Rect(rect) if rect else None)
+
+    def merge_rects(self):
+        """Merges overlapping dirty rects so no area is drawn twice."""
+        merged = []
+        for rect in self.dirty_rects:
+            rect = rect.clip(self.screen_rect)
+            if not rect.width or not rect.height:
+                continue
+            # Keep absorbing overlapping rects until the rect stops growing
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def render(self, draw):
+        """Calls draw once per dirty area (clipped to it), or once for the whole screen on a full redraw."""
+        rects = self.merge_rects()
+        self.dirty_rects = []
+
+        if not self.full_redraw and self.enabled:
+            area = sum(rect.width * rect.height for rect in rects)
+            if area > self.screen_rect.width * self.screen_rect.height * FULL_REDRAW_RATIO:
+                self.full_redraw = True
+
+        if self.full_redraw or not self.enabled:
+            self.full_redraw = False
+            self.presented_rects = None
+            draw()
+            return
+
+        for rect in rects:
+            self.screen.set_clip(rect)
+            draw()
+        self.screen.set_clip(None)
+        self.presented_rects = rects
+
+    def present(self):
+        """Presents what the last render() drew: the dirty areas only, or the full screen."""
+        if self.presented_rects is None:
+            self.screen.present()
+        elif self.presented_rects:
+            self.screen.present(self.presented_rects)
+        # No dirty areas: keep the previous frame on screen
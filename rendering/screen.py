@@ -0,0 +1,207 @@
+import math
+import os
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, RENDER_WIDTH, RENDER_HEIGHT, RENDER_BACKEND
+from managers.asset_manager import asset_manager, scale_for_render
+
+CHECK_FORMATS_ENV = "QUIZTASY_CHECK_FORMATS"  # Set to 1 to assert every blit source is in the display format
+RENDER_SIZE_ENV = "QUIZTASY_RENDER_SIZE"  # e.g. 960x540, overrides RENDER_WIDTH x RENDER_HEIGHT
+RENDER_BACKEND_ENV = "QUIZTASY_RENDER_BACKEND"  # "surface" or "texture", overrides RENDER_BACKEND
+BACKEND_SURFACE = "surface"
+BACKEND_TEXTURE = "texture"
+
+
+def is_display_format(source, display):
+    """True if blitting source onto display needs no per-pixel format conversion."""
+    return source.get_bitsize() == display.get_bitsize() and source.get_masks()[:3] == display.get_masks()[:3]
+
+
+class Screen:
+    scale = 1  # Display pixels per layout pixel
+    partial_updates = True  # Whether present() can show just the changed areas of a frame
+    make_render_copy = None  # Screens that draw copies of surfaces (scaled, or textures) make them with this
+
+    def __init__(self, surface, check_formats=False):
+        """Wraps the display surface so draw calls can be counted; everything else is forwarded to it."""
+        self.surface = surface
+        self.rect = surface.get_rect() if surface is not None else pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.blit_count = 0
+        self.check_formats = check_formats
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        self.blit_count += 1
+        if self.check_formats:
+            self.assert_display_format(source)
+        return self.surface.blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        blit_sequence = list(blit_sequence)
+        self.blit_count += len(blit_sequence)
+        if self.check_formats:
+            for item in blit_sequence:
+                self.assert_display_format(item[0])
+        return self.surface.blits(blit_sequence, doreturn)
+
+    def assert_display_format(self, source):
+        assert is_display_format(source, self.surface), (
+            f"Unconverted {source.get_bitsize()}-bit {source.get_width()}x{source.get_height()} surface blitted to the "
+            "screen; load it through asset_manager or convert() it once when it's created")
+
+    def fill(self, color, rect=None, special_flags=0):
+        self.blit_count += 1
+        return self.surface.fill(color, rect, special_flags)
+
+    def draw_fullscreen(self, frame):
+        """Draws a frame stretched over the whole screen, e.g. a video frame, scaled straight to the display size."""
+        self.blit_count += 1
+        if frame.get_size() != self.surface.get_size():
+            frame = pygame.transform.scale(frame, self.surface.get_size())
+        return self.surface.blit(frame, (0, 0))
+
+    def draw_overlay(self, surface, position):
+        """Draws a debug overlay at display pixels without counting it as a blit."""
+        self.surface.blit(surface, position)
+
+    def present(self, rects=None):
+        """Shows the frame: only the given areas, or the whole screen."""
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+    def set_caption(self, title):
+        pygame.display.set_caption(title)
+
+    def set_icon(self, icon):
+        pygame.display.set_icon(icon)
+
+    # The layout size scenes draw in, whatever the display's size
+    def get_rect(self, **kwargs):
+        rect = self.rect.copy()
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def get_size(self):
+        return self.rect.size
+
+    def get_width(self):
+        return self.rect.width
+
+    def get_height(self):
+        return self.rect.height
+
+    # Conversions between layout coordinates (what scenes use) and display pixels
+    def to_display(self, rect):
+        return pygame.Rect(rect)
+
+    def to_layout(self, rect):
+        return pygame.Rect(rect)
+
+    def take_blit_count(self):
+        """Returns the number of blits since the last call and resets the counter."""
+        count = self.blit_count
+        self.blit_count = 0
+        return count
+
+    def __getattr__(self, name):
+        return getattr(self.surface, name)
+
+
+class ScaledScreen(Screen):
+    def __init__(self, surface, check_formats=False):
+        """A Screen whose display surface is smaller than the layout of the scenes.
+
+        Scenes keep drawing in SCREEN_WIDTH x SCREEN_HEIGHT coordinates. Each blit draws the source's
+        render copy, scaled once by the asset manager, at the scaled position, so at half size a frame
+        fills a quarter of the pixels. SDL scales the finished frame up to the window (pygame.SCALED).
+        """
+        super().__init__(surface, check_formats)
+        self.scale = surface.get_width() / SCREEN_WIDTH
+        self.rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        self.blit_count += 1
+        copy = asset_manager.get_render_copy(source)
+        alpha = source.get_alpha()
+        if copy.get_alpha() != alpha:
+            copy.set_alpha(alpha)  # Fades change the source's alpha between frames
+        if self.check_formats:
+            self.assert_display_format(copy)
+        if area is not None:
+            area = self.to_display(area)
+        position = (math.floor(dest[0] * self.scale), math.floor(dest[1] * self.scale))
+        return self.to_layout(self.surface.blit(copy, position, area, special_flags))
+
+    def blits(self, blit_sequence, doreturn=1):
+        rects = [self.blit(*item) for item in blit_sequence]
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None, special_flags=0):
+        self.blit_count += 1
+        return self.surface.fill(color, self.to_display(rect) if rect is not None else None, special_flags)
+
+    def set_clip(self, rect=None):
+        self.surface.set_clip(self.to_display(rect) if rect is not None else None)
+
+    def make_render_copy(self, surface):
+        return scale_for_render(surface, self.scale)
+
+    def get_clip(self):
+        return self.to_layout(self.surface.get_clip())
+
+    def present(self, rects=None):
+        super().present([self.to_display(rect) for rect in rects] if rects is not None else None)
+
+    def to_display(self, rect):
+        """Display pixels covering a layout rect, rounded outwards."""
+        rect = pygame.Rect(rect)
+        left, top = math.floor(rect.left * self.scale), math.floor(rect.top * self.scale)
+        return pygame.Rect(left, top, math.ceil(rect.right * self.scale) - left, math.ceil(rect.bottom * self.scale) - top)
+
+    def to_layout(self, rect):
+        """Layout area covering a rect of display pixels."""
+        rect = pygame.Rect(rect)
+        left, top = math.floor(rect.left / self.scale), math.floor(rect.top / self.scale)
+        return pygame.Rect(left, top, math.ceil(rect.right / self.scale) - left, math.ceil(rect.bottom / self.scale) - top)
+
+
+def render_size():
+    """The internal render resolution: $QUIZTASY_RENDER_SIZE if set, else RENDER_WIDTH x RENDER_HEIGHT."""
+    value = os.environ.get(RENDER_SIZE_ENV)
+    if value:
+        try:
+            width, height = (int(part) for part in value.lower().split("x"))
+            return width, height
+        except ValueError:
+            print(f"Ignoring {RENDER_SIZE_ENV}={value}, expected WIDTHxHEIGHT")
+    return RENDER_WIDTH, RENDER_HEIGHT
+
+
+def render_backend():
+    """The renderer to use: $QUIZTASY_RENDER_BACKEND if set, else RENDER_BACKEND."""
+    return os.environ.get(RENDER_BACKEND_ENV) or RENDER_BACKEND
+
+
+def create_screen(check_formats=False, backend=None):
+    """Opens the window and returns the Screen scenes draw to.
+
+    The texture backend draws through an SDL renderer and falls back to the surface backend when it
+    can't start. On the surface backend, a render size below the layout size makes the display surface
+    that size and pygame.SCALED stretch it to the window; if SDL can't do that the game renders at
+    full size.
+    """
+    screen = None
+    if (backend or render_backend()) == BACKEND_TEXTURE:
+        from .texture_screen import create_texture_screen
+        screen = create_texture_screen()
+    size = render_size()
+    if screen is None and size != (SCREEN_WIDTH, SCREEN_HEIGHT):
+        try:
+            screen = ScaledScreen(pygame.display.set_mode(size, pygame.SCALED), check_formats=check_formats)
+        except pygame.error as e:
+            print(f"Can't render at {size[0]}x{size[1]} ({e}), rendering at full size")
+    if screen is None:
+        screen = Screen(pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT)), check_formats=check_formats)
+    asset_manager.set_render_copy_factory(screen.make_render_copy)
+    return screen
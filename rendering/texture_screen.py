@@ -0,0 +1,135 @@
+import atexit
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from managers.asset_manager import asset_manager
+from managers.input_manager import input_manager
+from .screen import Screen
+
+try:
+    from pygame._sdl2 import video
+except ImportError:  # pygame builds without the SDL2 video module
+    video = None
+
+MAX_TEXTURE_SIZE = 4096  # Larger surfaces, like the scaled map, are uploaded as tiles; many GPUs cap textures here
+TILE_SIZE = 2048
+BLENDMODE_BLEND = 1  # SDL_BLENDMODE_BLEND
+
+
+class TextureScreen(Screen):
+    partial_updates = False  # The renderer presents whole frames, so every frame is drawn in full
+
+    def __init__(self, window, renderer):
+        """A Screen that draws through an SDL renderer (pygame._sdl2.video) instead of software blits.
+
+        Every surface drawn is uploaded once as a texture, kept by the asset manager as its render copy:
+        images while they load, cached layers and text the first time they are drawn. Frames are then
+        composed from texture copies, on the GPU when there is one and with SDL's software renderer
+        otherwise (SDL_RENDER_DRIVER=software forces it).
+        """
+        super().__init__(None)
+        self.window = window
+        self.renderer = renderer
+        self.clip = None
+
+    def make_render_copy(self, surface):
+        width, height = surface.get_size()
+        if width <= MAX_TEXTURE_SIZE and height <= MAX_TEXTURE_SIZE:
+            return video.Texture.from_surface(self.renderer, surface)
+        tiles = []
+        for y in range(0, height, TILE_SIZE):
+            for x in range(0, width, TILE_SIZE):
+                rect = pygame.Rect(x, y, min(TILE_SIZE, width - x), min(TILE_SIZE, height - y))
+                tiles.append((video.Texture.from_surface(self.renderer, surface.subsurface(rect)), rect))
+        return tiles
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Draws a surface's texture. Blend flags aren't supported; the game doesn't use them."""
+        self.blit_count += 1
+        source_rect = source.get_rect()
+        src = source_rect if area is None else pygame.Rect(area).clip(source_rect)
+        dst = pygame.Rect(dest[0], dest[1], src.width, src.height)
+        if self.clip is not None:
+            visible = dst.clip(self.clip)
+            src = pygame.Rect(src.x + visible.x - dst.x, src.y + visible.y - dst.y, visible.width, visible.height)
+            dst = visible
+        if not dst.width or not dst.height:
+            return dst
+        copy = asset_manager.get_render_copy(source)
+        alpha = source.get_alpha()
+        if isinstance(copy, list):
+            for texture, tile in copy:
+                part = tile.clip(src)
+                if part.width and part.height:
+                    self.draw_texture(texture, alpha, part.move(-tile.x, -tile.y), part.move(dst.x - src.x, dst.y - src.y))
+        else:
+            self.draw_texture(copy, alpha, src, dst)
+        return dst
+
+    def draw_texture(self, texture, alpha, src, dst):
+        alpha = 255 if alpha is None else alpha
+        if texture.alpha != alpha:
+            texture.alpha = alpha  # Fades change the source's alpha between frames
+            texture.blend_mode = BLENDMODE_BLEND
+        texture.draw(src, dst)
+
+    def blits(self, blit_sequence, doreturn=1):
+        rects = [self.blit(*item) for item in blit_sequence]
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None, special_flags=0):
+        self.blit_count += 1
+        rect = pygame.Rect(rect) if rect is not None else self.rect.copy()
+        if self.clip is not None:
+            rect = rect.clip(self.clip)
+        self.renderer.draw_color = pygame.Color(color)
+        self.renderer.fill_rect(rect)
+        return rect
+
+    def draw_fullscreen(self, frame):
+        """Uploads the frame at its own size and lets the renderer stretch it."""
+        self.blit_count += 1
+        video.Texture.from_surface(self.renderer, frame).draw(None, self.rect)
+        return self.rect.copy()
+
+    def draw_overlay(self, surface, position):
+        # Overlays are redrawn in place, so they are uploaded each time instead of kept as render copies
+        video.Texture.from_surface(self.renderer, surface).draw(None, pygame.Rect(position[:2], surface.get_size()))
+
+    def set_clip(self, rect=None):
+        self.clip = pygame.Rect(rect).clip(self.rect) if rect is not None else None
+
+    def get_clip(self):
+        return self.clip.copy() if self.clip is not None else self.rect.copy()
+
+    def present(self, rects=None):
+        self.renderer.present()
+
+    def set_caption(self, title):
+        self.window.title = title
+
+    def set_icon(self, icon):
+        self.window.set_icon(icon)
+
+    def __getattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} has no attribute {name!r}")
+
+
+def create_texture_screen():
+    """Opens a renderer window, or returns None (saying why) when SDL's renderer isn't available."""
+    if video is None:
+        print("pygame._sdl2 isn't available, using the surface renderer")
+        return None
+    try:
+        # convert() needs a display format, so a hidden 1x1 display stands next to the renderer's window
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        window = video.Window("Final Quiztasy", (SCREEN_WIDTH, SCREEN_HEIGHT))
+        renderer = video.Renderer(window)
+    except (pygame.error, RuntimeError) as e:
+        print(f"Can't start the texture renderer ({e}), using the surface renderer")
+        return None
+    # With the hidden display open, closing the game window no longer quits on its own
+    input_manager.allow(pygame.WINDOWCLOSE)
+    input_manager.quit_on_window_close = True
+    # Textures must go before pygame's own exit handler shuts SDL down (atexit runs handlers last-in first-out)
+    atexit.register(asset_manager.set_render_copy_factory, None)
+    return TextureScreen(window, renderer)
@@ -1,8 +1,6 @@
-import pygame
 import os
 
-# Initialize Pygame
-pygame.init()
+# Importing settings has no side effects: pygame is initialized by the game itself (main.py)
 
 # ================================
 # 🛠️ GAME SETTINGS
@@ -12,9 +10,20 @@ SCREEN_WIDTH = 1920
 SCREEN_HEIGHT = 1080
 FPS = 60
 
-# Font settings
-FONT_PATH = os.path.join("assets", "fonts", "press_start_2p.ttf")
-FONT_SIZE = 24
+# Internal render resolution. Scenes are laid out at SCREEN_WIDTH x SCREEN_HEIGHT either way; a smaller size
+# (e.g. 960 x 540 on slow PCs) draws every frame at that size and lets SDL scale it up to the window.
+# It saves draw time, not memory: images keep their full-size surface next to the scaled copy that is drawn
+RENDER_WIDTH = SCREEN_WIDTH
+RENDER_HEIGHT = SCREEN_HEIGHT
+
+# "surface" draws with software blits; "texture" uploads art to an SDL renderer once and composes frames
+# from textures, falling back to "surface" where the renderer isn't available
+RENDER_BACKEND = "surface"
 
-# Load font
-game_font = pygame.font.Font(FONT_PATH, FONT_SIZE)
\ No newline at end of file
+# Redraw only changed screen areas in battles (False always redraws the full screen)
+DIRTY_RECT_RENDERING = True
+
+# Font settings, resolved relative to the game folder so it loads from any working directory
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+FONT_PATH = os.path.join(GAME_DIR, "assets", "fonts", "press_start_2p.ttf")
+FONT_SIZE = 24
@@ -0,0 +1,98 @@
+"""Bakes the fixed image transforms (scales, flips) into a build cache the game loads directly.
+
+Usage: python -m tools.bake_assets [--manifest assets/bake_manifest.json] [--jobs N] [--clean]
+
+Baked files are named after a hash of the source content and the transform, so unchanged sources
+are never baked twice and editing a source simply produces a new file. The game checks each source's
+size and modification time against the index and falls back to transforming at load time if they differ.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_MANIFEST = os.path.join(SCRIPT_DIR, "assets", "bake_manifest.json")
+
+
+def bake_one(source, output, scale, size, flip_x):
+    """Runs in a worker process: loads, transforms and saves one image."""
+    import pygame
+    from managers.asset_manager import transform_image
+    image = transform_image(pygame.image.load(source), scale, size, flip_x)
+    temp_path = output + ".tmp.png"
+    pygame.image.save(image, temp_path)
+    os.replace(temp_path, output)
+    return output
+
+
+def expand_manifest(manifest):
+    """Yields (source path, scale, size, flip_x) for every file matched by the manifest."""
+    for entry in manifest:
+        sources = sorted(glob.glob(os.path.join(SCRIPT_DIR, entry["source"])))
+        if not sources:
+            print(f"Bake manifest: nothing matches {entry['source']}")
+        for source in sources:
+            yield source, entry.get("scale"), entry.get("size"), entry.get("flip_x", False)
+
+
+def main(argv=None):
+    sys.path.insert(0, SCRIPT_DIR)
+    from managers.asset_manager import BAKE_DIR, BAKE_INDEX_PATH, transform_key, bake_entry_name
+
+    parser = argparse.ArgumentParser(description="Bake the fixed image transforms of Final Quiztasy.")
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST, help="bake manifest JSON")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--clean", action="store_true", help="delete baked files no longer in the index")
+    args = parser.parse_args(argv)
+
+    with open(args.manifest) as f:
+        manifest = json.load(f)
+    os.makedirs(BAKE_DIR, exist_ok=True)
+
+    start = time.perf_counter()
+    entries = {}
+    jobs = []
+    for source, scale, size, flip_x in expand_manifest(manifest):
+        transform = transform_key(scale, size, flip_x)
+        with open(source, "rb") as f:
+            digest = hashlib.sha1(f.read() + transform.encode()).hexdigest()
+        name = f"{digest}.png"
+        stat = os.stat(source)
+        entries[bake_entry_name(source, transform)] = {
+            "file": name,
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+        }
+        output = os.path.join(BAKE_DIR, name)
+        if not os.path.exists(output):
+            jobs.append((source, output, scale, size, flip_x))
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            futures = [pool.submit(bake_one, *job) for job in jobs]
+            for future in futures:
+                future.result()
+
+    with open(BAKE_INDEX_PATH, "w") as f:
+        json.dump({"version": 1, "entries": entries}, f, indent=1)
+
+    removed = 0
+    if args.clean:
+        referenced = {entry["file"] for entry in entries.values()} | {os.path.basename(BAKE_INDEX_PATH)}
+        for name in os.listdir(BAKE_DIR):
+            if name not in referenced:
+                os.remove(os.path.join(BAKE_DIR, name))
+                removed += 1
+
+    print(f"Baked {len(jobs)} of {len(entries)} images ({len(entries) - len(jobs)} up to date)"
+          f"{f', removed {removed} stale files' if args.clean else ''} in {time.perf_counter() - start:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Packs the game's images (and the current bake cache) into one memory-mapped archive.
+
+Usage: python -m tools.pack_assets [--output build/assets.pak] [--verify]
+
+Run tools.bake_assets first to include baked images. The game reads from the archive whenever it
+exists; set QUIZTASY_LOOSE_ASSETS=1 to read loose files while editing assets, or delete the archive.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMAGE_ROOT = os.path.join(SCRIPT_DIR, "assets", "images")
+
+
+def collect_files():
+    """Returns archive name -> file path for every image and every bake entry that is still current."""
+    from managers.asset_manager import BAKE_DIR, BAKE_INDEX_PATH, IMAGE_EXTENSIONS, asset_name
+    files = {}
+    for folder, _, names in os.walk(IMAGE_ROOT):
+        for name in names:
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                path = os.path.join(folder, name)
+                files[asset_name(path)] = path
+
+    if os.path.exists(BAKE_INDEX_PATH):
+        with open(BAKE_INDEX_PATH) as index_file:
+            index = json.load(index_file)
+        current = {}
+        for key, entry in index["entries"].items():
+            source = os.path.join(SCRIPT_DIR, key.split("|")[0])
+            baked = os.path.join(BAKE_DIR, entry["file"])
+            try:
+                stat = os.stat(source)
+            except OSError:
+                continue
+            if stat.st_size == entry["source_size"] and stat.st_mtime_ns == entry["source_mtime_ns"] and os.path.exists(baked):
+                current[key] = entry
+                files[asset_name(baked)] = baked
+        stale = len(index["entries"]) - len(current)
+        if stale:
+            print(f"Skipped {stale} stale bake entries; run python -m tools.bake_assets to refresh them")
+        # Pack only the current entries, so the game can trust the packed index without checking sources
+        packed_index = os.path.join(BAKE_DIR, "index.packed.json")
+        with open(packed_index, "w") as index_file:
+            json.dump({"version": index["version"], "entries": current}, index_file)
+        files[asset_name(BAKE_INDEX_PATH)] = packed_index
+    else:
+        print("No bake cache found; packing source images only")
+    return files
+
+
+def time_reads(manager, paths):
+    """Reads every path through an AssetManager and returns the I/O time in seconds."""
+    for path in paths:
+        manager.read_bytes(path)
+    return manager.io_seconds
+
+
+def main(argv=None):
+    sys.path.insert(0, SCRIPT_DIR)
+    from managers.asset_archive import AssetArchive, write_archive
+    from managers.asset_manager import ARCHIVE_PATH, AssetManager
+
+    parser = argparse.ArgumentParser(description="Pack the images of Final Quiztasy into one archive.")
+    parser.add_argument("--output", default=ARCHIVE_PATH, help="archive file to write")
+    parser.add_argument("--verify", action="store_true", help="check the archive against its hashes after packing")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    files = collect_files()
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    entries = write_archive(args.output, files)
+    size = os.path.getsize(args.output)
+    print(f"Packed {len(entries)} files ({size / 1e6:.1f} MB) into {os.path.relpath(args.output, SCRIPT_DIR)} "
+          f"in {time.perf_counter() - start:.2f} s")
+
+    archive = AssetArchive(args.output)
+    if args.verify:
+        corrupt = [name for name in archive.names() if not archive.verify(name)]
+        print(f"Verified {len(entries) - len(corrupt)} of {len(entries)} files")
+        for name in corrupt:
+            print(f"  hash mismatch: {name}")
+
+    # Compare reading every packed file loose against reading it from the archive
+    paths = [os.path.join(SCRIPT_DIR, name) for name in archive.names()]
+    loose = AssetManager()
+    loose.archive_checked = True
+    packed = AssetManager()
+    packed.archive, packed.archive_checked = archive, True
+    print(f"Reading {len(paths)} files: loose {time_reads(loose, paths) * 1000:.1f} ms, "
+          f"archive {time_reads(packed, paths) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,66 +1,117 @@
 import pygame
 import time
+from managers.asset_manager import asset_manager, transform_image
+from managers.input_manager import input_manager
+from .widgets import Widget
 
-class Button:
-    def __init__(self, x, y, idle_img, hover_img, click_img=None, action=None, scale=1.0, audio_manager=None, freeze_duration=0):
-        """Creates a button with optional freeze time (only for Hero Selection buttons)."""
-        self.idle_img = self.load_image(idle_img)
-        self.hover_img = self.load_image(hover_img)
-        self.click_img = self.load_image(click_img) if click_img else self.hover_img
+class Button(Widget):
+    interactive = True
 
-        # Scale images
-        self.idle_img = pygame.transform.scale(self.idle_img, (int(self.idle_img.get_width() * scale), int(self.idle_img.get_height() * scale)))
-        self.hover_img = pygame.transform.scale(self.hover_img, (int(self.hover_img.get_width() * scale), int(self.hover_img.get_height() * scale)))
-        self.click_img = pygame.transform.scale(self.click_img, (int(self.click_img.get_width() * scale), int(self.click_img.get_height() * scale)))
+    def __init__(self, x, y, idle_img, hover_img, click_img=None, action=None, scale=1.0, audio_manager=None, freeze_duration=0,
+                 hit_mask=False):
+        """Creates a button with optional freeze time (only for Hero Selection buttons).
 
-        self.image = self.idle_img
-        self.rect = self.image.get_rect(center=(x, y))
+        With hit_mask, only the opaque pixels of the idle image are clickable, for irregular shapes.
+        """
+        # Load and scale images (baked at that scale when available)
+        self.idle_img = self.load_image(idle_img, scale)
+        self.hover_img = self.load_image(hover_img, scale)
+        self.click_img = self.load_image(click_img, scale) if click_img else self.hover_img
+
+        super().__init__(self.idle_img.get_rect(center=(x, y)))
+        self._image = self.idle_img
         self.action = action
-        self.visible = True
-        self.active = True
         self.clicked = False
         self.click_time = None  # Track click time
         self.freeze_duration = freeze_duration  # ❗ Only Hero Selection buttons will have a freeze time
+        self.mask = asset_manager.get_mask(self.idle_img) if hit_mask else None
 
         self.audio_manager = audio_manager
 
-    def load_image(self, img):
-        """Helper method to load an image from file or return the surface if already loaded."""
-        return pygame.image.load(img).convert_alpha() if isinstance(img, str) else img
+    def load_image(self, img, scale):
+        """Helper method to load a scaled image from file, or scale a surface that is already loaded."""
+        return asset_manager.load_image(img, scale=scale) if isinstance(img, str) else transform_image(img, scale)
+
+    @property
+    def image(self):
+        return self._image
+
+    @image.setter
+    def image(self, image):
+        if image is not self._image:
+            self._image = image
+            self.mark_dirty(layout=False)
+
+    def set_images(self, idle_img, hover_img=None, click_img=None):
+        """Swaps the button's art for already loaded surfaces, keeping its state."""
+        state = "hover" if self._image is self.hover_img else "click" if self._image is self.click_img else "idle"
+        self.idle_img = idle_img
+        self.hover_img = hover_img if hover_img is not None else idle_img
+        self.click_img = click_img if click_img is not None else self.hover_img
+        if self.mask is not None:
+            self.mask = asset_manager.get_mask(idle_img)
+        self.image = {"hover": self.hover_img, "click": self.click_img}.get(state, self.idle_img)
 
     def draw(self, screen):
         """Draw the button on the screen."""
         if self.visible:
             screen.blit(self.image, self.rect.topleft)
 
-    def update(self, event):
-        """Handles hover, click, and optional freeze effect for Hero Selection."""
-        if not self.visible or not self.active:
-            return  # Ignore updates if the button is disabled
+    def layer_item(self):
+        """Returns this button as a (surface, position, resting surface) draw item, or None if hidden.
+        An active button rests on its idle image, so hovering it doesn't change the cached layer."""
+        if not self.visible:
+            return None
+        return self.image, self.rect.topleft, self.idle_img if self.active else self.image
+
+    def contains(self, pos):
+        """Rect check first; the mask lookup only runs for points inside the rect."""
+        if not self.rect.collidepoint(pos):
+            return False
+        return self.mask is None or self.mask.get_at((pos[0] - self.rect.x, pos[1] - self.rect.y))
 
-        mouse_pos = pygame.mouse.get_pos()
+    def collect(self, items):
+        item = self.layer_item()
+        if item:
+            items.append(item)
 
-        # If button has a freeze duration, stay on click_img
+    def frozen(self):
+        """True while a freeze-duration button still shows its click image."""
         if self.clicked and self.freeze_duration > 0:
-            if time.time() - self.click_time >= self.freeze_duration:  # Wait for freeze_duration seconds
-                self.clicked = False
-                self.image = self.idle_img  # Return to normal
-            return  # Skip hover effect while frozen
+            if time.time() - self.click_time < self.freeze_duration:  # Wait for freeze_duration seconds
+                return True
+            self.clicked = False
+            self.image = self.idle_img  # Return to normal
+        return False
+
+    def set_hover(self, hovered):
+        """Hover effect; a disabled or frozen button keeps its image."""
+        if self._active and not self.frozen():
+            self.image = self.hover_img if hovered else self.idle_img
+
+    def press(self):
+        """Click effect, click sound and the button's action."""
+        self.image = self.click_img
+        self.clicked = True
+        self.click_time = time.time()  # Start freeze timer
+
+        if self.audio_manager and self.audio_manager.audio_enabled:
+            self.audio_manager.play_sfx()
 
-        # Hover effect
-        if self.rect.collidepoint(mouse_pos):
-            self.image = self.hover_img
-        else:
-            self.image = self.idle_img
+        if self.action:
+            self.action()  # Call the assigned function
 
-        # Click effect
-        if event.type == pygame.MOUSEBUTTONDOWN and self.rect.collidepoint(mouse_pos):
-            self.image = self.click_img
-            self.clicked = True
-            self.click_time = time.time()  # Start freeze timer
+    def update(self, event):
+        """Handles hover and click for a button outside a widget tree."""
+        if not self.visible or not self.active:
+            return  # Ignore updates if the button is disabled
 
-            if self.audio_manager and self.audio_manager.audio_enabled:
-                self.audio_manager.play_sfx()
+        # Mouse events carry their position; for others use the position read once this frame
+        mouse_pos = getattr(event, "pos", input_manager.mouse_pos)
+        if self.frozen():
+            return  # Skip hover effect while frozen
 
-            if self.action:
-                self.action()  # Call the assigned function
+        hovered = self.contains(mouse_pos)
+        self.set_hover(hovered)
+        if event.type == pygame.MOUSEBUTTONDOWN and hovered:
+            self.press()
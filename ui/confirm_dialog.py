@@ -0,0 +1,113 @@
+import os
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_PATH
+from managers.asset_manager import asset_manager
+from .button import Button
+from .widgets import Layer, ImageNode, LabelNode
+
+# Art of each dialog style: folder under assets/images, border (scaled or sized), yes/no button art
+# (<name>_img.png and <name>_hover.png) and the buttons' offset from the dialog's center
+DIALOG_STYLES = {
+    "pause": {
+        "folder": ("battle", "pause", "confirmation"),
+        "border": "yesorno_border.png", "border_scale": 0.65,
+        "yes": "yes_btn", "no": "no_btn", "button_scale": 0.4, "button_offset": (250, 150),
+    },
+    "hero_selection": {
+        "folder": ("buttons", "game modes", "hero selection"),
+        "border": "yes_or_no_border.png", "border_scale": 0.7,
+        "yes": "yes_btn", "no": "no_btn", "button_scale": 0.6, "button_offset": (200, 150),
+    },
+    "exit": {
+        "folder": ("buttons", "exit"),
+        "border": "exit_border.png", "border_size": (700, 400),
+        "yes": "yes_btn", "no": "no_btn", "button_scale": 0.4, "button_offset": (140, 130),
+    },
+    "apply_changes": {
+        "folder": ("buttons", "settings"),
+        "border": "apply_changes_border.png", "border_size": (700, 400),
+        "yes": "apply_btn", "no": "discard_btn", "button_scale": 0.4, "button_offset": (140, 130),
+    },
+}
+TEXT_SIZE = 24
+
+dialogs = {}  # style -> the one ConfirmDialog of that style
+
+
+class ConfirmDialog(Layer):
+    def __init__(self, script_dir, style, audio_manager=None):
+        """A modal yes/no dialog with the art of one style, loaded and scaled once.
+
+        Screens don't build their own: get_dialog() hands out one dialog per style, and open() points
+        it at the screen's callbacks (and optionally a line of text) each time it's shown. Border and
+        idle buttons are composited once by the layer cache, so opening it again draws from that.
+        """
+        spec = DIALOG_STYLES[style]
+        folder = os.path.join(script_dir, "assets", "images", *spec["folder"])
+        self.style = style
+        self.on_yes = None
+        self.on_no = None
+        self.label = None
+
+        center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        border = asset_manager.load_image(os.path.join(folder, spec["border"]),
+                                          scale=spec.get("border_scale"), size=spec.get("border_size"))
+        self.border = ImageNode(border, center=center)
+
+        offset_x, offset_y = spec["button_offset"]
+        self.yes_button = Button(center[0] - offset_x, center[1] + offset_y,
+                                 os.path.join(folder, f"{spec['yes']}_img.png"),
+                                 os.path.join(folder, f"{spec['yes']}_hover.png"),
+                                 None, self.confirm, scale=spec["button_scale"], audio_manager=audio_manager)
+        self.no_button = Button(center[0] + offset_x, center[1] + offset_y,
+                                os.path.join(folder, f"{spec['no']}_img.png"),
+                                os.path.join(folder, f"{spec['no']}_hover.png"),
+                                None, self.cancel, scale=spec["button_scale"], audio_manager=audio_manager)
+
+        super().__init__([self.border, self.yes_button, self.no_button], modal=True)
+        self.visible = False
+
+    def open(self, on_yes, on_no=None, text=None):
+        """Shows the dialog for new callbacks, with a line of text over the border art if given."""
+        self.on_yes = on_yes
+        self.on_no = on_no
+        self.set_text(text)
+        for button in (self.yes_button, self.no_button):
+            button.image = button.idle_img  # Don't carry the last user's hover over
+        self.visible = True
+
+    def set_text(self, text):
+        if text is None:
+            if self.label is not None:
+                self.label.visible = False
+            return
+        if self.label is None:
+            # Rendered the first time a caller asks for text; the art of the current styles has its own
+            font = pygame.font.Font(FONT_PATH, TEXT_SIZE)
+            self.label = self.add(LabelNode(font, text, center=(self.border.rect.centerx, self.border.rect.top + self.border.rect.height // 4)))
+        self.label.set_text(text)
+        self.label.visible = True
+
+    def close(self):
+        """Hides the dialog and drops the callbacks, so it doesn't keep their screen alive."""
+        self.visible = False
+        self.on_yes = None
+        self.on_no = None
+
+    def confirm(self):
+        callback = self.on_yes
+        if callback:
+            callback()
+
+    def cancel(self):
+        callback = self.on_no
+        if callback:
+            callback()
+
+
+def get_dialog(script_dir, style, audio_manager=None):
+    """Returns the dialog of a style, building it the first time it's asked for."""
+    dialog = dialogs.get(style)
+    if dialog is None:
+        dialog = dialogs[style] = ConfirmDialog(script_dir, style, audio_manager)
+    return dialog
@@ -1,7 +1,8 @@
-import pygame
-import os
+from .scene import Scene
+from .widgets import WidgetTree
+from .confirm_dialog import get_dialog
 
-class Exit:
+class Exit(Scene):
     def __init__(self, screen, script_dir, exit_callback=None, audio_manager=None):
         self.screen = screen
         self.script_dir = script_dir
@@ -11,50 +12,14 @@ class Exit:
         # Exit state
         self.show_exit_confirmation = False
 
-        # Load exit assets
-        self.load_exit_assets()
-        self.create_exit_buttons()
-
-    def load_exit_assets(self):
-        from settings import SCREEN_WIDTH, SCREEN_HEIGHT
-
-        # Load exit confirmation assets
-        quit_border_img = os.path.join(self.script_dir, "assets", "images", "buttons", "exit", "exit_border.png")
-        self.exit_border = pygame.image.load(quit_border_img)
-        self.exit_border = pygame.transform.scale(self.exit_border, (700, 400))
-        self.exit_border_rect = self.exit_border.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-
-        # Load exit button images
-        self.exit_button_images = {
-            'yes': {
-                'normal': os.path.join(self.script_dir, "assets", "images", "buttons", "exit", "yes_btn_img.png"),
-                'hover': os.path.join(self.script_dir, "assets", "images", "buttons", "exit", "yes_btn_hover.png")
-            },
-            'no': {
-                'normal': os.path.join(self.script_dir, "assets", "images", "buttons", "exit", "no_btn_img.png"),
-                'hover': os.path.join(self.script_dir, "assets", "images", "buttons", "exit", "no_btn_hover.png")
-            }
-        }
-
-    def create_exit_buttons(self):
-        from settings import SCREEN_WIDTH, SCREEN_HEIGHT
-        from .button import Button
-
-        # Yes button
-        self.yes_button = Button(SCREEN_WIDTH // 2 - 140, SCREEN_HEIGHT // 2 + 130,
-                                 self.exit_button_images['yes']['normal'],
-                                 self.exit_button_images['yes']['hover'],
-                                 None, self.confirm_exit, scale=0.4, audio_manager=self.audio_manager)
-
-        # No button
-        self.no_button = Button(SCREEN_WIDTH // 2 + 140, SCREEN_HEIGHT // 2 + 130,
-                                self.exit_button_images['no']['normal'],
-                                self.exit_button_images['no']['hover'],
-                                None, self.cancel_exit, scale=0.4, audio_manager=self.audio_manager)
+        # The shared exit yes/no dialog
+        self.exit_dialog = get_dialog(script_dir, "exit", audio_manager)
+        self.ui = WidgetTree(self.exit_dialog)
 
     def exit_game(self):
         print("Exit button clicked!")
         self.show_exit_confirmation = True
+        self.exit_dialog.open(self.confirm_exit, self.cancel_exit)
 
     def confirm_exit(self):
         """Handles the confirmation of exiting the game."""
@@ -64,15 +29,21 @@ class Exit:
 
     def cancel_exit(self):
         self.show_exit_confirmation = False
+        self.exit_dialog.close()
+
+    def exit(self):
+        self.ui.release()
+
+    def dispose(self):
+        self.ui.clear()
+        self.exit_dialog.close()
+        self.exit_dialog = None
+        self.exit_callback = None
 
     def handle_events(self, event):
         if self.show_exit_confirmation:
-            self.yes_button.update(event)
-            self.no_button.update(event)
+            self.ui.dispatch(event)
 
     def draw(self):
         if self.show_exit_confirmation:
-            # Draw exit confirmation dialog
-            self.screen.blit(self.exit_border, self.exit_border_rect.topleft)
-            self.yes_button.draw(self.screen)
-            self.no_button.draw(self.screen)
\ No newline at end of file
+            self.ui.draw(self.screen)
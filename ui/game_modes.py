@@ -2,9 +2,12 @@ import pygame
 import os
 from ui.button import Button
 from .back_button import BackButton
+from managers.asset_manager import asset_manager
+from .scene import Scene
+from .widgets import WidgetTree, Layer, ImageNode
 
 
-class GameModes:
+class GameModes(Scene):
     def __init__(self, screen, audio_manager, script_dir, scale=0.5, game_instance=None):
         self.game_instance = game_instance  # Store the game instance
         self.screen = screen
@@ -32,13 +35,9 @@ class GameModes:
         }
 
         # New/Continue selection screen assets with custom scaling for border
-        border_image = pygame.image.load(
-            os.path.join(script_dir, "assets", "images", "buttons", "game modes", "new or continue", "border.png"))
-        # Scale the border image
-        original_border_size = border_image.get_rect().size
-        scaled_border_width = int(original_border_size[0] * self.border_scale)
-        scaled_border_height = int(original_border_size[1] * self.border_scale)
-        self.new_continue_border = pygame.transform.scale(border_image, (scaled_border_width, scaled_border_height))
+        self.new_continue_border = asset_manager.load_image(
+            os.path.join(script_dir, "assets", "images", "buttons", "game modes", "new or continue", "border.png"),
+            scale=self.border_scale)
         self.new_continue_border_rect = self.new_continue_border.get_rect(center=(960, 540))
 
         # Create new/continue buttons with custom scaling
@@ -48,6 +47,11 @@ class GameModes:
         # Add Back button
         self.back_button = BackButton(self.screen, script_dir, self.go_back, audio_manager=self.audio_manager, position=(100, 100), scale=0.25)
 
+        # Mode buttons, the modal new/continue prompt over them, and the back button on top of both
+        self.prompt_layer = Layer([ImageNode(self.new_continue_border, topleft=self.new_continue_border_rect.topleft),
+                                   self.new_button, self.continue_button], modal=True)
+        self.ui = WidgetTree(Layer(self.buttons.values()), self.prompt_layer, Layer([self.back_button]))
+
     def play_single_player(self):
         print("Playing single-player mode")
         self.show_new_continue = True  # Show new/continue prompt
@@ -107,31 +111,14 @@ class GameModes:
 
     def update(self, event):
         if self.visible:
-            # Only update back button and active prompt buttons when new/continue is shown
-            if self.show_new_continue:
-                self.new_button.update(event)
-                self.continue_button.update(event)
-                self.back_button.update(event)
-            else:
-                # Update all buttons when not showing new/continue
-                for button in self.buttons.values():
-                    button.update(event)
-                self.back_button.update(event)
+            # While the prompt is shown, the mode buttons below it get no events
+            self.prompt_layer.visible = self.show_new_continue
+            self.ui.dispatch(event)
 
     def draw(self):
         if self.visible:
-            # Always draw the game mode buttons in the background
-            for button in self.buttons.values():
-                button.draw(self.screen)
-
-            # Draw the new/continue prompt on top if active
-            if self.show_new_continue:
-                self.screen.blit(self.new_continue_border, self.new_continue_border_rect.topleft)
-                self.new_button.draw(self.screen)
-                self.continue_button.draw(self.screen)
-
-            # Always draw the back button on top
-            self.back_button.draw()
+            self.prompt_layer.visible = self.show_new_continue
+            self.ui.draw(self.screen)
 
     def show(self):
         """Show the game mode selection."""
@@ -145,4 +132,16 @@ class GameModes:
         self.visible = False
         self.show_new_continue = False  # Reset this when hiding the menu q
         for button in self.buttons.values():
-            button.active = False
\ No newline at end of file
+            button.active = False
+
+    def exit(self):
+        self.ui.release()
+
+    def dispose(self):
+        self.ui.clear()
+        self.ui.release()
+        self.buttons = {}
+        self.new_button = None
+        self.continue_button = None
+        self.back_button = None
+        self.game_instance = None
@@ -5,21 +5,27 @@ import random
 from .button import Button
 from .back_button import BackButton
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from managers.asset_manager import asset_manager
+from managers.input_manager import input_manager
+from .scene import Scene
+from .widgets import WidgetTree, Layer, ImageNode
+from .confirm_dialog import get_dialog
 
 CONFIRMATION_DELAY = pygame.USEREVENT + 1
 
-class HeroSelection:
+class HeroSelection(Scene):
     def __init__(self, game_instance, background_menu):
         """Initialize Hero Selection screen with character choices."""
         self.game_instance = game_instance
         self.screen = game_instance.screen
+        input_manager.allow(CONFIRMATION_DELAY)
         self.visible = False  # Hero selection starts hidden
         self.background_menu = background_menu
         self.audio_manager = game_instance.audio_manager
 
         # Load background border
         border_path = os.path.join(game_instance.script_dir, "assets", "images", "buttons", "game modes", "hero selection", "choose_hero_border.png")
-        self.border_img = pygame.image.load(border_path)
+        self.border_img = asset_manager.load_image(border_path)
         self.border_rect = self.border_img.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
         # Character button positions
@@ -58,46 +64,18 @@ class HeroSelection:
         self.confirmation_active = False
         self.temp_selected_hero = None
 
-        # Load confirmation border with scaling
-        confirmation_border_path = os.path.join(game_instance.script_dir, "assets", "images", "buttons", "game modes", "hero selection", "yes_or_no_border.png")
-        self.confirmation_border_original = pygame.image.load(confirmation_border_path)
-
-        # Apply scaling to confirmation border
-        border_scale = 0.7
-        border_width = int(self.confirmation_border_original.get_width() * border_scale)
-        border_height = int(self.confirmation_border_original.get_height() * border_scale)
-        self.confirmation_border = pygame.transform.scale(self.confirmation_border_original,(border_width, border_height))
-        self.confirmation_border_rect = self.confirmation_border.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-
-        # Create Yes/No buttons with appropriate scaling
-        yes_btn_position = (self.confirmation_border_rect.centerx - 200, self.confirmation_border_rect.centery + 150)
-        no_btn_position = (self.confirmation_border_rect.centerx + 200, self.confirmation_border_rect.centery + 150)
-
-        button_scale = 0.6  # Scale for the yes/no buttons
-
-        self.yes_button = Button(
-            yes_btn_position[0], yes_btn_position[1],
-            os.path.join(game_instance.script_dir, "assets", "images", "buttons", "game modes", "hero selection", "yes_btn_img.png"),
-            os.path.join(game_instance.script_dir, "assets", "images", "buttons", "game modes", "hero selection", "yes_btn_hover.png"),
-            action=self.confirm_hero_selection,
-            scale=button_scale,
-            audio_manager=self.game_instance.audio_manager
-        )
-
-        self.no_button = Button(
-            no_btn_position[0], no_btn_position[1],
-            os.path.join(game_instance.script_dir, "assets", "images", "buttons", "game modes", "hero selection", "no_btn_img.png"),
-            os.path.join(game_instance.script_dir, "assets", "images", "buttons", "game modes", "hero selection", "no_btn_hover.png"),
-            action=self.cancel_hero_selection,
-            scale=button_scale,
-            audio_manager=self.game_instance.audio_manager
-        )
+        # The shared hero selection yes/no dialog, pointed at this screen when a hero is picked
+        self.confirmation_dialog = get_dialog(game_instance.script_dir, "hero_selection", self.game_instance.audio_manager)
 
         self.selected_hero = None
         self.selection_time = None
         self.voiceline_sound = None
 
+        # Hero choices, and the modal yes/no dialog over them
+        self.ui = WidgetTree(Layer([ImageNode(self.border_img, topleft=self.border_rect.topleft),
+                                    *self.buttons.values(), self.back_button]),
+                             self.confirmation_dialog)
+
     def create_button(self, name, position, scale=1.0, freeze_duration=0):
         """Helper to create buttons with optional freeze duration."""
         base_path = os.path.join(self.game_instance.script_dir, "assets", "images", "buttons", "game modes", "hero selection")
@@ -109,7 +87,8 @@ class HeroSelection:
             lambda hero=name: self.pre_select_hero(hero),  # Changed to pre_select_hero
             scale=scale,
             audio_manager=self.game_instance.audio_manager,
-            freeze_duration=freeze_duration
+            freeze_duration=freeze_duration,
+            hit_mask=True
         )
 
     def play_random_voiceline(self, hero):
@@ -154,17 +133,11 @@ class HeroSelection:
         self.selected_hero = self.temp_selected_hero
         self.game_instance.selected_hero = self.selected_hero  # ✅ Store hero in game instance
         self.confirmation_active = False
+        self.confirmation_dialog.close()
 
         # Visual feedback - show selected hero for 3 seconds
         self.selection_time = time.time()
 
-        # Force the screen to freeze properly for 3 seconds
-        freeze_duration = 0
-        start_time = time.time()
-        while time.time() - start_time < freeze_duration:
-            self.draw()
-            pygame.display.update()
-
         # Select the hero's OST based on selection
         hero_ost_path = os.path.join(self.game_instance.script_dir, "assets", "audio", "ost", self.selected_hero, f"{self.selected_hero}_map_ost.mp3")
 
@@ -183,6 +156,7 @@ class HeroSelection:
         """User cancelled hero selection with 'No' button."""
         print(f"Hero {self.temp_selected_hero.upper()} selection cancelled.")
         self.confirmation_active = False
+        self.confirmation_dialog.close()
         self.temp_selected_hero = None
 
         # Reset button states and make them active again
@@ -190,50 +164,50 @@ class HeroSelection:
             button.image = button.idle_img
             button.active = True
 
+    def exit(self):
+        """Cancels a pending confirmation timer, stops the voiceline and frees the cached layers."""
+        pygame.time.set_timer(CONFIRMATION_DELAY, 0)
+        self.ui.release()
+        if self.voiceline_sound:
+            self.voiceline_sound.stop()
+
+    def dispose(self):
+        self.exit()
+        self.voiceline_sound = None
+        self.ui.clear()
+        self.buttons = {}
+        self.back_button = None
+        self.confirmation_dialog.close()
+        self.confirmation_dialog = None
+        self.background_menu = None
+        self.game_instance = None
+
     def update(self, event):
         """Handles button interactions and enforces click delay."""
         if self.visible:
             if event.type == CONFIRMATION_DELAY:
                 # Show confirmation exactly after 1 second
                 self.confirmation_active = True
+                self.confirmation_dialog.open(self.confirm_hero_selection, self.cancel_hero_selection)
                 pygame.time.set_timer(CONFIRMATION_DELAY, 0)  # Stop the timer
 
-            if self.confirmation_active:
-                # While confirmation is active, only Yes/No buttons respond
-                self.yes_button.update(event)
-                self.no_button.update(event)
-            else:
-                # Normal hero selection state
-                for button in self.buttons.values():
-                    button.update(event)
-                self.back_button.update(event)
+            # While confirmation is active, only Yes/No buttons respond
+            self.update_layers()
+            self.ui.dispatch(event)
+
+    def update_layers(self):
+        """Shows the confirmation dialog, and hides the back button under it, while a hero awaits confirmation."""
+        self.confirmation_dialog.visible = self.confirmation_active
+        self.back_button.visible = not self.confirmation_active
 
     def draw(self):
         """Draw the hero selection screen."""
-        frame_surface = self.background_menu.get_frame()
-        frame_surface = pygame.transform.scale(frame_surface, (SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.screen.blit(frame_surface, (0, 0))
+        self.screen.draw_fullscreen(self.background_menu.get_frame())
 
         if self.visible:
-            # Draw the main border
-            self.screen.blit(self.border_img, self.border_rect.topleft)
-
-            # Draw all hero buttons
-            for button in self.buttons.values():
-                button.draw(self.screen)
-
-            # If confirmation dialog is active, draw it over everything else
-            if self.confirmation_active:
-                self.screen.blit(self.confirmation_border, self.confirmation_border_rect.topleft)
-
-                # Draw Yes/No buttons
-                self.yes_button.draw(self.screen)
-                self.no_button.draw(self.screen)
-            else:
-                # Draw back button only when confirmation is not showing
-                self.back_button.draw()
-
-        pygame.display.update()
+            # Border and hero buttons, with the confirmation dialog over everything else when active
+            self.update_layers()
+            self.ui.draw(self.screen)
 
     def show(self):
         """Show the hero selection screen."""
@@ -0,0 +1,75 @@
+import pygame
+from settings import FONT_PATH
+from debug.perf_hud import track_surface_cache
+from managers.asset_manager import asset_manager
+
+BAR_WIDTH = 200
+BAR_HEIGHT = 20
+DRAIN_SPEED = 0.5  # Share of max HP the bar drains per second
+TEXT_PADDING = 4  # Room for the HP text that overhangs the bar
+
+
+class HPBar:
+    fonts = {}  # Font size -> Font, shared by every bar
+
+    def __init__(self, x, y, width=BAR_WIDTH, height=BAR_HEIGHT, font_size=20):
+        """HP bar that caches its rendered surface and only re-renders when the shown HP changes."""
+        self.bar_rect = pygame.Rect(x, y, width, height)
+        self.rect = self.bar_rect.inflate(TEXT_PADDING * 2, TEXT_PADDING * 2)
+        if font_size not in HPBar.fonts:
+            HPBar.fonts[font_size] = pygame.font.Font(FONT_PATH, font_size)
+        self.font = HPBar.fonts[font_size]
+
+        self.hp = None
+        self.max_hp = None
+        self.shown_hp = None  # HP currently drawn, drains towards self.hp
+        self.state = None  # (fill width, text) of the cached surface
+        self.surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        track_surface_cache(self)
+
+    def cached_surfaces(self):
+        return [self.surface]
+
+    def set_hp(self, hp, max_hp):
+        """Sets the HP to show; the bar drains towards it in update()."""
+        if self.shown_hp is None or max_hp != self.max_hp:
+            self.shown_hp = hp  # Jump straight to the value the first time
+        self.hp = hp
+        self.max_hp = max_hp
+
+    def update(self, dt):
+        """Advances the drain animation by dt seconds. Returns True if the bar was re-rendered."""
+        if self.shown_hp != self.hp:
+            step = DRAIN_SPEED * self.max_hp * dt
+            if self.shown_hp > self.hp:
+                self.shown_hp = max(self.hp, self.shown_hp - step)
+            else:
+                self.shown_hp = min(self.hp, self.shown_hp + step)
+
+        ratio = self.shown_hp / self.max_hp if self.max_hp > 0 else 0
+        state = (int(self.bar_rect.width * max(0, min(1, ratio))), f"{self.hp:g}/{self.max_hp:g} HP")
+        if state == self.state:
+            return False
+        self.state = state
+        self.render()
+        return True
+
+    def render(self):
+        """Renders the bar and HP text into the cached surface."""
+        health_width, text = self.state
+        bar = self.bar_rect.move(TEXT_PADDING - self.bar_rect.x, TEXT_PADDING - self.bar_rect.y)
+        self.surface.fill((0, 0, 0, 0))
+        # Background (empty) bar
+        pygame.draw.rect(self.surface, (255, 0, 0), bar)
+        # Filled portion of the bar
+        pygame.draw.rect(self.surface, (0, 255, 0), (bar.x, bar.y, health_width, bar.height))
+        # HP text
+        hp_text = self.font.render(text, True, (255, 255, 255))
+        self.surface.blit(hp_text, (bar.x + 10, bar.y + 2))
+        asset_manager.surface_changed(self.surface)
+
+    def draw(self, screen):
+        """Draws the cached bar."""
+        if self.state is None:
+            self.update(0)
+        screen.blit(self.surface, self.rect)
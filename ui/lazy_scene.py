@@ -0,0 +1,106 @@
+LOW_MEMORY_BYTES = 256 * 1024 * 1024  # Release hidden screens when less than this is available
+
+
+class LazyScene:
+    def __init__(self, factory, idle_state=None, releasable=True):
+        """Stand-in for a screen that is only built on first use.
+
+        Attribute reads are forwarded to the screen, building it first. Reading one of the idle_state
+        attributes (by default just `visible`) of a screen that isn't built returns its idle value instead,
+        so per-frame visibility checks don't build anything. Screens holding state that must survive
+        while hidden (like unapplied settings) pass releasable=False.
+        """
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_scene", None)
+        object.__setattr__(self, "_idle_state", idle_state or {"visible": False})
+        object.__setattr__(self, "_releasable", releasable)
+
+    @property
+    def built(self):
+        return self._scene is not None
+
+    def get(self):
+        """Returns the screen, building it on first use."""
+        if self._scene is None:
+            object.__setattr__(self, "_scene", self._factory())
+        return self._scene
+
+    def is_idle(self):
+        """True if the screen isn't built or is built but currently shows nothing."""
+        return self._scene is None or all(getattr(self._scene, name) == value for name, value in self._idle_state.items())
+
+    def release(self):
+        """Disposes a built screen that isn't showing, so its surfaces can be freed. Returns True if dropped."""
+        if self._scene is None or not self._releasable or not self.is_idle():
+            return False
+        self.dispose()
+        return True
+
+    # Lifecycle hooks reach the screen only if it's built; an unbuilt screen has nothing to enter or free
+    def enter(self):
+        if self._scene is not None:
+            self._scene.enter()
+
+    def exit(self):
+        if self._scene is not None:
+            self._scene.exit()
+
+    def dispose(self):
+        if self._scene is not None:
+            self._scene.dispose()
+            object.__setattr__(self, "_scene", None)
+
+    def __getattr__(self, name):
+        scene = self._scene
+        if scene is None and name in self._idle_state:
+            return self._idle_state[name]
+        return getattr(self.get(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.get(), name, value)
+
+
+class SceneWarmer:
+    def __init__(self, scenes, delay_frames=30):
+        """Builds lazy screens one per idle frame once the menu has been up for delay_frames frames."""
+        self.pending = list(scenes)
+        self.delay_frames = delay_frames
+
+    def idle_frame(self):
+        """Call after a frame was presented; builds at most one screen."""
+        if self.delay_frames > 0:
+            self.delay_frames -= 1
+            return
+        while self.pending:
+            scene = self.pending.pop(0)
+            if not scene.built:
+                scene.get()
+                return
+
+
+def available_memory():
+    """Bytes of memory available to the game, or None when it can't be determined."""
+    try:
+        import psutil  # Optional, works on every platform
+        return psutil.virtual_memory().available
+    except ImportError:
+        pass
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def release_under_memory_pressure(scenes, threshold=LOW_MEMORY_BYTES):
+    """Releases every hidden screen when available memory is low. Returns how many were released."""
+    available = available_memory()
+    if available is None or available >= threshold:
+        return 0
+    released = sum(1 for scene in scenes if scene.release())
+    if released:
+        print(f"Low memory ({available // (1024 * 1024)} MB available): released {released} hidden screens")
+    return released
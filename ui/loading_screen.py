@@ -0,0 +1,58 @@
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, FONT_PATH
+from managers.asset_manager import asset_manager
+from debug.frame_timing import frame_timer, PHASE_EVENTS, PHASE_UPDATE, PHASE_DRAW, PHASE_PRESENT
+
+# Progress bar layout
+BAR_WIDTH = 800
+BAR_HEIGHT = 40
+CONVERT_SLICE_MS = 8  # Main-thread conversion time per loading frame
+
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+BAR_COLOR = (50, 50, 200)
+
+
+class LoadingScreen:
+    def __init__(self, screen, title="Loading"):
+        """Shows the progress of an AssetLoader while it loads a manifest group."""
+        self.screen = screen
+        self.font = pygame.font.Font(FONT_PATH, 30)
+        self.title_surface = self.font.render(f"{title}...", True, WHITE)
+        self.title_rect = self.title_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80))
+        self.bar_surface = pygame.Surface((BAR_WIDTH, BAR_HEIGHT)).convert()
+        self.bar_rect = self.bar_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+
+    def draw(self, loader):
+        self.screen.fill(BLACK)
+        self.screen.blit(self.title_surface, self.title_rect)
+        self.bar_surface.fill(BLACK)
+        self.bar_surface.fill(BAR_COLOR, (0, 0, int(BAR_WIDTH * loader.progress), BAR_HEIGHT))
+        pygame.draw.rect(self.bar_surface, WHITE, self.bar_surface.get_rect(), 3)
+        asset_manager.surface_changed(self.bar_surface)
+        self.screen.blit(self.bar_surface, self.bar_rect)
+        count = self.font.render(f"{loader.done} / {loader.total}", True, WHITE)
+        self.screen.blit(count, count.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80)))
+
+    def run(self, loader):
+        """Shows the loading screen until the loader is done, then reports the load times."""
+        if loader.step(CONVERT_SLICE_MS):
+            if loader.total:
+                loader.report()
+            return
+        clock = pygame.time.Clock()
+        while True:
+            frame_timer.begin_frame("loading")
+            pygame.event.pump()  # Keep the window responsive; input stays queued for the next scene
+            frame_timer.mark(PHASE_EVENTS)
+            done = loader.step(CONVERT_SLICE_MS)
+            frame_timer.mark(PHASE_UPDATE)
+            self.draw(loader)
+            frame_timer.mark(PHASE_DRAW)
+            self.screen.present()
+            frame_timer.mark(PHASE_PRESENT)
+            frame_timer.end_frame()
+            if done:
+                break
+            clock.tick(FPS)
+        loader.report()
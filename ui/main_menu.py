@@ -3,13 +3,15 @@ import os
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT
 from .button import Button
 from managers.audio_manager import AudioManager
-from .game_modes import GameModes
 from .back_button import BackButton
-from .hero_selection import HeroSelection
 from .option import Options  # Import the new Options class
 from .exit import Exit  # Import the new Exit class
+from .widgets import WidgetTree, Layer, Container, ImageNode
+from .lazy_scene import LazyScene
+from .scene import Scene
+from managers.asset_manager import asset_manager
 
-class MainMenu:
+class MainMenu(Scene):
     def __init__(self, screen, audio_manager, script_dir, exit_callback=None, game_instance=None):
         self.screen = screen
         self.audio_manager = audio_manager
@@ -23,20 +25,29 @@ class MainMenu:
         self.load_assets()
         self.create_buttons()
 
-        # Initialize separate options and exit handlers
-        self.options_handler = Options(screen, audio_manager, script_dir)
-        self.exit_handler = Exit(screen, script_dir, exit_callback, audio_manager)
+        # Logo and menu buttons; the dialogs and game modes draw their own layers on top
+        self.logo_node = ImageNode(self.game_logo, topleft=self.game_logo_rect.topleft)
+        self.menu_button_group = Container(self.menu_buttons)
+        self.ui = WidgetTree(Layer([self.logo_node, self.menu_button_group]))
+
+        # Options and exit dialogs are built the first time they are opened (or warmed while idle)
+        self.options_handler = LazyScene(lambda: Options(screen, audio_manager, script_dir),
+                                         idle_state={"show_settings": False}, releasable=False)
+        self.exit_handler = LazyScene(lambda: Exit(screen, script_dir, exit_callback, audio_manager),
+                                      idle_state={"show_exit_confirmation": False})
 
         # Only create GameModes if game_instance is None
         if not self.game_instance:
-            self.game_modes = GameModes(self.screen, self.audio_manager, self.script_dir, scale=1.0, game_instance=self)
+            self.game_modes = LazyScene(self.create_game_modes)
+
+    def create_game_modes(self):
+        from .game_modes import GameModes  # Imported on first use, like the screen itself
+        return GameModes(self.screen, self.audio_manager, self.script_dir, scale=1.0, game_instance=self)
 
     def load_assets(self):
         # Load game logo
         game_logo_img = os.path.join(self.script_dir, "assets", "images", "logo", "logo.png")
-        self.game_logo = pygame.image.load(game_logo_img)
-        self.game_logo = pygame.transform.scale(self.game_logo, (
-        int(self.game_logo.get_width() * 0.75), int(self.game_logo.get_height() * 0.75)))
+        self.game_logo = asset_manager.load_image(game_logo_img, scale=0.75)
         custom_x = 1070
         custom_y = 220
         self.game_logo_rect = self.game_logo.get_rect(centerx=custom_x, centery=custom_y)
@@ -115,38 +126,40 @@ class MainMenu:
         self.exit_handler.exit_game()
 
     def handle_events(self, event):
+        game_modes_visible = self.is_game_modes_visible()
         if self.exit_handler.show_exit_confirmation:
             self.exit_handler.handle_events(event)
         elif self.options_handler.show_settings:
             self.options_handler.handle_events(event, self.menu_buttons)
         else:
             # Only update main menu buttons if settings and exit confirmation are not open
-            for button in self.menu_buttons:
-                button.update(event)
+            self.update_layers(game_modes_visible)
+            self.ui.dispatch(event)
 
         # For Game Modes
-        if self.game_instance and self.game_instance.game_modes.visible:
-            self.game_instance.game_modes.update(event)
-        elif hasattr(self, 'game_modes') and self.game_modes.visible:
-            self.game_modes.update(event)
+        if game_modes_visible:
+            if self.game_instance:
+                self.game_instance.game_modes.update(event)
+            else:
+                self.game_modes.update(event)
+
+    def update_layers(self, covered):
+        """Logo and menu buttons show only while nothing covers them (a dialog or the game mode selection)."""
+        self.logo_node.visible = self.show_game_logo and not covered
+        self.menu_button_group.visible = not covered
 
     def draw(self):
-        # Draw the game logo if it's visible
-        if self.show_game_logo and not self.exit_handler.show_exit_confirmation and not self.options_handler.show_settings and not self.is_game_modes_visible():
-            self.screen.blit(self.game_logo, self.game_logo_rect.topleft)
+        self.update_layers(self.exit_handler.show_exit_confirmation or self.options_handler.show_settings
+                           or self.is_game_modes_visible())
+        self.ui.draw(self.screen)
 
-        # Draw based on current state
+        # Based on current state
         if self.exit_handler.show_exit_confirmation:
             self.exit_handler.draw()
         elif self.options_handler.show_settings:
             self.options_handler.draw()
-        else:
-            # Draw main menu buttons only if GameModes is not visible
-            if not self.is_game_modes_visible():
-                for button in self.menu_buttons:
-                    button.draw(self.screen)
 
-        # Draw game modes if visible
+        # Game modes if visible
         if self.game_instance and hasattr(self.game_instance, 'game_modes') and self.game_instance.game_modes.visible:
             self.game_instance.game_modes.draw()
         elif hasattr(self, 'game_modes') and self.game_modes.visible:
@@ -168,6 +181,27 @@ class MainMenu:
         """Hide the main menu."""
         self.visible = False
 
+    def exit(self):
+        # Free the cached layers of the menu and its dialogs while another screen is up
+        self.ui.release()
+        self.options_handler.exit()
+        self.exit_handler.exit()
+        if self.game_instance and hasattr(self.game_instance, 'game_modes'):
+            self.game_instance.game_modes.exit()
+        elif hasattr(self, 'game_modes'):
+            self.game_modes.exit()
+
+    def dispose(self):
+        self.exit()
+        self.options_handler.dispose()
+        self.exit_handler.dispose()
+        if hasattr(self, 'game_modes'):
+            self.game_modes.dispose()
+        self.ui.clear()
+        self.menu_buttons = []
+        self.exit_callback = None
+        self.game_instance = None
+
     def main_menu(self):
         # Ensure all main menu buttons are visible
         for button in self.menu_buttons:
@@ -1,10 +1,10 @@
-import cv2
-import numpy as np
 import pygame
 import sys
 
 class MenuBackground:
     def __init__(self, file_path, speed=0.5):
+        import cv2  # Heavy import, only paid once the menu actually needs the video
+        self.cv2 = cv2
         self.cap = cv2.VideoCapture(file_path)
         if not self.cap.isOpened():
             print("Error: Could not open video file.")
@@ -14,17 +14,20 @@ class MenuBackground:
 
     def get_frame(self):
         self.frame_counter += self.speed
-        self.cap.set(cv2.CAP_PROP_POS_FRAMES, self.frame_counter)
+        self.cap.set(self.cv2.CAP_PROP_POS_FRAMES, self.frame_counter)
 
         ret, frame = self.cap.read()
         if not ret:
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self.cap.set(self.cv2.CAP_PROP_POS_FRAMES, 0)
             self.frame_counter = 0
             ret, frame = self.cap.read()
 
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame = np.rot90(frame)
-        return pygame.surfarray.make_surface(frame)
+        # Wrap the BGR pixels directly instead of converting and rotating them with numpy
+        height, width = frame.shape[:2]
+        frame = pygame.image.frombuffer(frame, (width, height), "BGR")
+        # The menu has always shown the video mirrored left to right
+        # convert() the small frame once so scaling and blitting it work in the display format
+        return pygame.transform.flip(frame, True, False).convert()
 
     def close(self):
-        self.cap.release()
\ No newline at end of file
+        self.cap.release()
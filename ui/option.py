@@ -1,7 +1,11 @@
 import pygame
 import os
+from managers.asset_manager import asset_manager
+from .scene import Scene
+from .widgets import WidgetTree, Layer, Container, ImageNode
+from .confirm_dialog import get_dialog
 
-class Options:
+class Options(Scene):
     def __init__(self, screen, audio_manager, script_dir):
         self.screen = screen
         self.audio_manager = audio_manager
@@ -24,25 +28,15 @@ class Options:
         # Load settings border
         settings_border_img = os.path.join(self.script_dir, "assets", "images", "buttons", "settings",
                                            "settings_border.png")
-        self.settings_border = pygame.image.load(settings_border_img)
-        self.settings_border = pygame.transform.scale(self.settings_border, (700, 400))
+        self.settings_border = asset_manager.load_image(settings_border_img, size=(700, 400))
         self.settings_border_rect = self.settings_border.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
-        # Load apply changes border
-        apply_changes_border_img = os.path.join(self.script_dir, "assets", "images", "buttons", "settings",
-                                                "apply_changes_border.png")
-        self.apply_changes_border = pygame.image.load(apply_changes_border_img)
-        self.apply_changes_border = pygame.transform.scale(self.apply_changes_border, (700, 400))
-        self.apply_changes_border_rect = self.apply_changes_border.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
 
         # Load audio toggle images
-        self.audio_on_img = pygame.image.load(
-            os.path.join(self.script_dir, "assets", "images", "buttons", "settings", "music_on.png"))
-        self.audio_off_img = pygame.image.load(
-            os.path.join(self.script_dir, "assets", "images", "buttons", "settings", "music_off.png"))
-        self.audio_on_img = pygame.transform.scale(self.audio_on_img, (150, 130))
-        self.audio_off_img = pygame.transform.scale(self.audio_off_img, (150, 130))
+        self.audio_on_img = asset_manager.load_image(
+            os.path.join(self.script_dir, "assets", "images", "buttons", "settings", "music_on.png"), size=(150, 130))
+        self.audio_off_img = asset_manager.load_image(
+            os.path.join(self.script_dir, "assets", "images", "buttons", "settings", "music_off.png"), size=(150, 130))
 
         from settings import SCREEN_WIDTH, SCREEN_HEIGHT
         self.audio_img_rect = self.audio_on_img.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 10))
@@ -84,18 +78,14 @@ class Options:
                                      self.settings_button_images['discard']['hover'],
                                      None, self.discard_settings, scale=0.4, audio_manager=self.audio_manager)
 
-        # Confirm apply button
-        self.confirm_apply_button = Button(SCREEN_WIDTH // 2 - 140, SCREEN_HEIGHT // 2 + 130,
-                                           self.settings_button_images['apply']['normal'],
-                                           self.settings_button_images['apply']['hover'],
-                                           None, self.confirm_apply_settings, scale=0.4,
-                                           audio_manager=self.audio_manager)
+        # The shared apply changes yes/no dialog
+        self.apply_changes_dialog = get_dialog(self.script_dir, "apply_changes", self.audio_manager)
 
-        # Cancel apply button
-        self.cancel_apply_button = Button(SCREEN_WIDTH // 2 + 140, SCREEN_HEIGHT // 2 + 130,
-                                          self.settings_button_images['discard']['normal'],
-                                          self.settings_button_images['discard']['hover'],
-                                          None, self.cancel_apply_settings, scale=0.4, audio_manager=self.audio_manager)
+        # The settings dialog (the audio toggle shows the on/off icon), and the modal apply confirmation over it
+        self.settings_buttons = Container([self.apply_button, self.discard_button])
+        self.ui = WidgetTree(Layer([ImageNode(self.settings_border, topleft=self.settings_border_rect.topleft),
+                                    self.audio_toggle_button, self.settings_buttons], modal=True),
+                             self.apply_changes_dialog)
 
     def open_options(self, menu_buttons):
         print("Options button clicked!")
@@ -108,6 +98,19 @@ class Options:
         for button in menu_buttons:
             button.active = False
 
+    def exit(self):
+        self.ui.release()
+
+    def dispose(self):
+        self.ui.clear()
+        self.ui.release()
+        self.menu_buttons = []
+        self.audio_toggle_button = None
+        self.apply_button = None
+        self.discard_button = None
+        self.apply_changes_dialog.close()
+        self.apply_changes_dialog = None
+
     def toggle_audio(self):
         print("Audio toggle clicked!")
         self.temp_audio_enabled = not self.temp_audio_enabled
@@ -117,6 +120,7 @@ class Options:
         print("Apply settings clicked!")
         # Show confirmation dialog
         self.show_apply_changes = True
+        self.apply_changes_dialog.open(self.confirm_apply_settings, self.cancel_apply_settings)
 
     def discard_settings(self):
         print("Discard settings clicked!")
@@ -133,6 +137,7 @@ class Options:
         # Apply settings permanently
         self.audio_enabled = self.temp_audio_enabled
         self.show_apply_changes = False
+        self.apply_changes_dialog.close()
         self.show_settings = False
         # Re-enable main menu buttons when settings are closed
         for button in self.menu_buttons:
@@ -141,6 +146,7 @@ class Options:
     def cancel_apply_settings(self):
         print("Canceling apply confirmation...")
         self.show_apply_changes = False
+        self.apply_changes_dialog.close()
 
     def handle_events(self, event, menu_buttons=None):
         # Store menu buttons if provided
@@ -148,31 +154,18 @@ class Options:
             self.menu_buttons = menu_buttons
 
         if self.show_settings:
-            if self.show_apply_changes:
-                self.confirm_apply_button.update(event)
-                self.cancel_apply_button.update(event)
-            else:
-                self.audio_toggle_button.update(event)
-                self.apply_button.update(event)
-                self.discard_button.update(event)
+            self.update_layers()
+            self.ui.dispatch(event)
 
-    def draw(self):
-        from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+    def update_layers(self):
+        """Matches the dialog to the settings state: audio icon, and apply/discard or the apply confirmation."""
+        audio_img = self.audio_on_img if self.temp_audio_enabled else self.audio_off_img
+        if audio_img is not self.audio_toggle_button.idle_img:
+            self.audio_toggle_button.set_images(audio_img)
+        self.settings_buttons.visible = not self.show_apply_changes
+        self.apply_changes_dialog.visible = self.show_apply_changes
 
+    def draw(self):
         if self.show_settings:
-            # Draw settings dialog
-            self.screen.blit(self.settings_border, self.settings_border_rect.topleft)
-
-            # Draw the appropriate audio icon based on status
-            audio_img = self.audio_on_img if self.temp_audio_enabled else self.audio_off_img
-            self.screen.blit(audio_img, self.audio_img_rect.topleft)
-
-            if self.show_apply_changes:
-                # Draw apply changes confirmation
-                self.screen.blit(self.apply_changes_border, self.apply_changes_border_rect.topleft)
-                self.confirm_apply_button.draw(self.screen)
-                self.cancel_apply_button.draw(self.screen)
-            else:
-                # Draw apply/discard buttons
-                self.apply_button.draw(self.screen)
-                self.discard_button.draw(self.screen)
\ No newline at end of file
+            self.update_layers()
+            self.ui.draw(self.screen)
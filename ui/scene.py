@@ -0,0 +1,26 @@
+class Scene:
+    """Lifecycle hooks shared by every screen.
+
+    enter() runs each time the screen starts showing and exit() each time it stops. dispose() runs
+    once the screen won't be shown again: it drops the screen's surfaces, sounds and timers and its
+    references to other screens, so nothing keeps them alive after the screen is gone.
+    """
+
+    def enter(self):
+        pass
+
+    def exit(self):
+        pass
+
+    def dispose(self):
+        pass
+
+
+def run_scene(scene):
+    """Runs a screen's own loop between its enter and exit hooks, then disposes it. Returns the loop's result."""
+    scene.enter()
+    try:
+        return scene.run()
+    finally:
+        scene.exit()
+        scene.dispose()
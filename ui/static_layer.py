@@ -0,0 +1,74 @@
+import pygame
+from debug.perf_hud import track_surface_cache
+
+
+class StaticLayer:
+    def __init__(self):
+        """Caches a stack of blits into pre-converted alpha surfaces, rebuilt only when the stack changes."""
+        self.key = None
+        self.parts = []  # (surface, rect, item indexes) per group of overlapping items
+        self.live_items = {}  # Item index -> surface it shows instead of its cached one
+        track_surface_cache(self)
+
+    def cached_surfaces(self):
+        return [surface for surface, rect, members in self.parts]
+
+    def draw(self, screen, items):
+        """Draws (surface, position, resting surface) items from the cached layer."""
+        self.update(items)
+        self.blit(screen)
+
+    def update(self, items):
+        """Takes a new list of (surface, position, resting surface) items.
+
+        The cache holds every item's resting surface, e.g. a button's idle image, so hovering only
+        makes that item live; the cache is rebuilt only when resting surfaces or positions change.
+        """
+        key = tuple((resting, tuple(position)) for surface, position, resting in items)
+        if key != self.key:
+            self.rebuild(key)
+        self.live_items = {index: surface for index, (surface, position, resting) in enumerate(items) if surface is not resting}
+
+    def blit(self, screen):
+        """Draws the cached layer. A group holding a live item is drawn item by item instead, in the
+        original order, so a hovered button stays under anything stacked on it."""
+        for surface, rect, members in self.parts:
+            if not self.live_items or not any(index in self.live_items for index in members):
+                screen.blit(surface, rect)
+                continue
+            for index in members:
+                resting, position = self.key[index]
+                screen.blit(self.live_items.get(index, resting), position)
+
+    def rebuild(self, key):
+        """Composites overlapping items together, so transparent gaps between them are never blitted."""
+        self.key = key
+
+        # Group items whose rects overlap, keeping the original draw order inside each group
+        groups = []  # [rect, [item indexes]]
+        for index, (surface, position) in enumerate(key):
+            rect = surface.get_rect(topleft=position)
+            members = [index]
+            for group in [group for group in groups if group[0].colliderect(rect)]:
+                groups.remove(group)
+                rect.union_ip(group[0])
+                members.extend(group[1])
+            groups.append([rect, sorted(members)])
+
+        self.parts = []
+        for rect, members in groups:
+            surface = pygame.Surface(rect.size, pygame.SRCALPHA).convert_alpha()
+            for index in members:
+                item_surface, position = key[index]
+                surface.blit(item_surface, (position[0] - rect.x, position[1] - rect.y))
+            self.parts.append((surface, rect, members))
+
+    def release(self):
+        """Frees the cached surfaces while the layer isn't drawn; the next draw rebuilds them."""
+        self.key = None
+        self.parts = []
+        self.live_items = {}
+
+    def invalidate(self):
+        """Forces a rebuild on the next draw."""
+        self.key = None
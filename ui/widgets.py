@@ -0,0 +1,228 @@
+import pygame
+from managers.input_manager import input_manager
+from .static_layer import StaticLayer
+
+
+class Widget:
+    interactive = False  # Only interactive widgets are returned by hit-tests
+
+    def __init__(self, rect=None):
+        """A node of a widget tree: a rect, a visible flag, an active flag and a parent.
+
+        Changing what a widget shows calls mark_dirty(), so the layer holding it rebuilds its draw items
+        before the next draw; changes to visibility or size also make the containers above it recompute
+        their bounding boxes before the next hit-test.
+        """
+        self.parent = None
+        self.rect = pygame.Rect(rect) if rect is not None else pygame.Rect(0, 0, 0, 0)
+        self._visible = True
+        self._active = True
+
+    @property
+    def visible(self):
+        return self._visible
+
+    @visible.setter
+    def visible(self, value):
+        if value != self._visible:
+            self._visible = value
+            self.mark_dirty()
+
+    @property
+    def active(self):
+        return self._active
+
+    @active.setter
+    def active(self, value):
+        if value != self._active:
+            self._active = value
+            self.mark_dirty(layout=False)
+
+    def mark_dirty(self, layout=True):
+        node = self.parent
+        while node is not None:
+            node.invalidate(layout)
+            node = node.parent
+
+    def contains(self, pos):
+        return self.rect.collidepoint(pos)
+
+    def widget_at(self, pos):
+        """The topmost interactive widget at pos in this subtree, or None."""
+        if self.interactive and self._visible and self._active and self.contains(pos):
+            return self
+        return None
+
+    def collect(self, items):
+        """Appends this widget's (surface, position, resting surface) draw items."""
+
+    # Called by the tree on the widget under the pointer
+    def frozen(self):
+        """True while the widget ignores clicks, e.g. a button still showing its click image."""
+        return False
+
+    def set_hover(self, hovered):
+        pass
+
+    def press(self):
+        pass
+
+
+class ImageNode(Widget):
+    def __init__(self, surface, center=None, topleft=(0, 0)):
+        """A static image; it never receives events."""
+        rect = surface.get_rect(center=center) if center is not None else surface.get_rect(topleft=topleft)
+        super().__init__(rect)
+        self.surface = surface
+
+    def set_surface(self, surface):
+        if surface is not self.surface:
+            self.surface = surface
+            self.rect = surface.get_rect(center=self.rect.center)
+            self.mark_dirty()
+
+    def collect(self, items):
+        if self._visible:
+            items.append((self.surface, self.rect.topleft, self.surface))
+
+
+class LabelNode(ImageNode):
+    def __init__(self, font, text, color=(255, 255, 255), center=None, topleft=(0, 0)):
+        """A line of text, rendered once per change of text."""
+        self.font = font
+        self.text = text
+        self.color = color
+        super().__init__(font.render(text, True, color), center=center, topleft=topleft)
+
+    def set_text(self, text):
+        if text != self.text:
+            self.text = text
+            self.set_surface(self.font.render(text, True, self.color))
+
+
+class Container(Widget):
+    def __init__(self, children=()):
+        """Groups widgets; its rect is the bounding box of its visible children, so hit-tests skip it whole."""
+        super().__init__()
+        self.children = []
+        self.stale = True
+        for child in children:
+            self.add(child)
+
+    def add(self, child):
+        child.parent = self
+        self.children.append(child)
+        self.invalidate(True)
+        return child
+
+    def clear(self):
+        for child in self.children:
+            child.parent = None
+        self.children = []
+        self.invalidate(True)
+
+    def invalidate(self, layout):
+        if layout:
+            self.stale = True
+
+    def bounds(self):
+        if self.stale:
+            self.stale = False
+            self.rect = pygame.Rect(0, 0, 0, 0)
+            rects = [child.bounds() if isinstance(child, Container) else child.rect
+                     for child in self.children if child.visible]
+            if rects:
+                self.rect = rects[0].unionall(rects[1:])
+        return self.rect
+
+    def widget_at(self, pos):
+        if not self._visible or not self._active or not self.bounds().collidepoint(pos):
+            return None
+        # Later children are drawn on top, so they are hit first
+        for child in reversed(self.children):
+            hit = child.widget_at(pos)
+            if hit is not None:
+                return hit
+        return None
+
+    def collect(self, items):
+        if self._visible:
+            for child in self.children:
+                child.collect(items)
+
+
+class Layer(Container):
+    def __init__(self, children=(), modal=False):
+        """A top-level container drawn through its own cached static layer.
+
+        A modal layer takes every pointer event while it's visible, so nothing below it reacts.
+        """
+        self.modal = modal
+        self.dirty = True
+        self.cache = StaticLayer()
+        super().__init__(children)
+
+    def invalidate(self, layout):
+        if layout:
+            self.stale = True
+        self.dirty = True
+
+    def draw(self, screen):
+        if self.dirty:
+            self.dirty = False
+            items = []
+            self.collect(items)
+            self.cache.update([item for item in items if item])
+        self.cache.blit(screen)
+
+    def release(self):
+        """Frees the cached surfaces; the next draw rebuilds them."""
+        self.cache.release()
+        self.dirty = True
+
+
+class WidgetTree:
+    def __init__(self, *layers):
+        """A screen's layers, bottom to top. Pointer events go only to the topmost widget under the pointer."""
+        self.layers = list(layers)
+        self.hovered = None
+
+    def add(self, layer):
+        self.layers.append(layer)
+        return layer
+
+    def widget_at(self, pos):
+        for layer in reversed(self.layers):
+            if layer.visible:
+                hit = layer.widget_at(pos)
+                if hit is not None or layer.modal:
+                    return hit
+        return None
+
+    def dispatch(self, event):
+        """Updates hover from the event's position (or this frame's) and sends clicks to the widget there.
+        Returns the widget under the pointer, or None."""
+        target = self.widget_at(getattr(event, "pos", input_manager.mouse_pos))
+        if target is not self.hovered:
+            if self.hovered is not None:
+                self.hovered.set_hover(False)
+            self.hovered = target
+        if target is not None:
+            target.set_hover(True)
+            if event.type == pygame.MOUSEBUTTONDOWN and not target.frozen():
+                target.press()
+        return target
+
+    def draw(self, screen):
+        for layer in self.layers:
+            if layer.visible:
+                layer.draw(screen)
+
+    def release(self):
+        for layer in self.layers:
+            layer.release()
+
+    def clear(self):
+        """Drops the layers; layers shared with other screens (like confirm dialogs) stay intact."""
+        self.hovered = None
+        self.layers = []